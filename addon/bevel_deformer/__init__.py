@@ -13,26 +13,79 @@ import bpy
 import os
 
 import bpy.utils.previews
-from bpy.props import StringProperty
+from bpy.props import BoolProperty, StringProperty
 from bpy.types import AddonPreferences
 
 
 if "settings" in locals():
     import importlib
 
+    importlib.reload(ffd)
+    importlib.reload(kernels)
+    importlib.reload(stages)
+    importlib.reload(reference)
+    importlib.reload(memstats)
+    importlib.reload(live_trace)
     importlib.reload(settings)
+    importlib.reload(scope)
+    importlib.reload(influence)
+    importlib.reload(batch)
     importlib.reload(lattice_ops)
     importlib.reload(deform_ops)
+    importlib.reload(anim_ops)
+    importlib.reload(random_ops)
+    importlib.reload(gn_backend)
+    importlib.reload(asset_library)
+    importlib.reload(snapshots)
+    importlib.reload(layers)
+    importlib.reload(cage_io)
+    importlib.reload(interactive_ops)
+    importlib.reload(api)
     importlib.reload(ui)
     importlib.reload(updater)
 else:
-    from . import deform_ops, lattice_ops, settings, ui, updater
+    from . import (
+        anim_ops,
+        api,
+        asset_library,
+        batch,
+        cage_io,
+        deform_ops,
+        ffd,
+        gn_backend,
+        influence,
+        interactive_ops,
+        kernels,
+        layers,
+        lattice_ops,
+        live_trace,
+        memstats,
+        random_ops,
+        reference,
+        scope,
+        settings,
+        snapshots,
+        stages,
+        ui,
+        updater,
+    )
 
 
 _modules = (
     settings,
+    memstats,
+    live_trace,
+    influence,
     lattice_ops,
     deform_ops,
+    anim_ops,
+    random_ops,
+    gn_backend,
+    asset_library,
+    snapshots,
+    layers,
+    cage_io,
+    interactive_ops,
     ui,
     updater,
 )
@@ -73,6 +126,18 @@ class BD_AddonPreferences(AddonPreferences):
         subtype='PASSWORD',
         default="",
     )
+    memory_accounting: BoolProperty(
+        name="Memory Accounting",
+        description="Record tracemalloc peak and net allocations of operators and Live Preview ticks (slows them down)",
+        default=False,
+        update=lambda self, _context: memstats.set_enabled(self.memory_accounting),
+    )
+    trace_path: StringProperty(
+        name="Live Trace",
+        description="File the Live Preview trace is saved to and replayed from",
+        subtype='FILE_PATH',
+        default="//bd_live_trace.json",
+    )
 
     def draw(self, context):
         layout = self.layout
@@ -96,6 +161,21 @@ class BD_AddonPreferences(AddonPreferences):
         row.operator("bd.check_updates", text="Check")
         row.operator("bd.install_update", text="Install")
 
+        layout.separator()
+        layout.label(text="Diagnostics")
+        layout.prop(self, "memory_accounting")
+        row = layout.row(align=True)
+        row.operator("bd.memory_report")
+        row.operator("bd.memory_budget_check")
+        layout.prop(self, "trace_path")
+        row = layout.row(align=True)
+        row.operator(
+            "bd.toggle_live_trace",
+            text="Stop Recording" if live_trace.is_recording() else "Record Live Trace",
+            depress=live_trace.is_recording(),
+        )
+        row.operator("bd.replay_live_trace")
+
 
 def register() -> None:
     registered = []
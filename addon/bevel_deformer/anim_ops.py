@@ -0,0 +1,216 @@
+import bpy
+import numpy as np
+from bpy.props import IntProperty, StringProperty
+from bpy.types import Operator
+
+from . import kernels, stages
+from .deform_ops import gather_target_lattices, group_by_signature, settings_chain
+
+# Keyframe interpolation value as exposed through foreach_set (BEZT_IPO_LIN).
+_IPO_LINEAR = 1
+
+
+def _fcurve_collections(id_data):
+    anim = getattr(id_data, "animation_data", None)
+    action = getattr(anim, "action", None) if anim is not None else None
+    if action is None:
+        return
+
+    slot = getattr(anim, "action_slot", None)
+    layers = getattr(action, "layers", None)
+    if layers and slot is not None:
+        for layer in layers:
+            for strip in layer.strips:
+                channelbag = strip.channelbag(slot)
+                if channelbag is not None:
+                    yield channelbag.fcurves
+        return
+
+    yield getattr(action, "fcurves", [])
+
+
+def _iter_fcurves(id_data):
+    for fcurves in _fcurve_collections(id_data):
+        yield from fcurves
+
+
+def _find_fcurve(id_data, data_path: str):
+    for fcurve in _iter_fcurves(id_data):
+        if fcurve.data_path == data_path and fcurve.array_index == 0:
+            return fcurve
+    return None
+
+
+def sample_deform_params(scene, frames: np.ndarray, names: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """Evaluate the animated deform sliders at ``frames`` without changing the scene frame."""
+    settings = scene.bd_deform_settings
+    samples: dict[str, np.ndarray] = {}
+    for name in names:
+        fcurve = _find_fcurve(scene, f"bd_deform_settings.{name}")
+        if fcurve is None:
+            samples[name] = np.full(frames.shape, float(getattr(settings, name, 0.0)))
+        else:
+            samples[name] = np.array([fcurve.evaluate(float(f)) for f in frames], dtype=np.float64)
+    return samples
+
+
+def _clear_baked_keys(lat_obj, prefix: str) -> None:
+    keys = lat_obj.data.shape_keys
+    if keys is None:
+        return
+    if bool(lat_obj.get("bd_anim_baked", False)):
+        # Only the baked keys' curves go; other shape key animation and drivers stay.
+        baked_path = f'key_blocks["{prefix}'
+        for fcurves in list(_fcurve_collections(keys)):
+            for fcurve in list(fcurves):
+                if fcurve.data_path.startswith(baked_path):
+                    fcurves.remove(fcurve)
+        anim = keys.animation_data
+        if anim is not None and next(_iter_fcurves(keys), None) is None and not len(anim.drivers):
+            keys.animation_data_clear()
+    for kb in list(keys.key_blocks):
+        if kb.name.startswith(prefix):
+            lat_obj.shape_key_remove(kb)
+
+
+def _keyframe_value(key_block, frames: np.ndarray, values: np.ndarray) -> None:
+    key_block.keyframe_insert("value", frame=float(frames[0]))
+    fcurve = _find_fcurve(key_block.id_data, key_block.path_from_id("value"))
+    if fcurve is None:
+        return
+
+    points = fcurve.keyframe_points
+    if len(points) < len(frames):
+        points.add(len(frames) - len(points))
+    points.foreach_set("co", np.column_stack((frames, values)).astype(np.float32).ravel())
+    points.foreach_set("interpolation", np.full(len(frames), _IPO_LINEAR, dtype=np.int32))
+    fcurve.update()
+
+
+def _write_shape_keys(lat_obj, frames: np.ndarray, index: np.ndarray, results: np.ndarray, prefix: str) -> int:
+    """Add one shape key per distinct result and keyframe it on at the frames that use it."""
+    _clear_baked_keys(lat_obj, prefix)
+    if lat_obj.data.shape_keys is None:
+        lat_obj.shape_key_add(name="Basis", from_mix=False)
+
+    created = 0
+    for k in range(results.shape[0]):
+        on = index == k
+        # Neighbouring frames are keyed to 0 so adjacent keys crossfade linearly.
+        near = on | np.roll(on, 1) | np.roll(on, -1)
+        if len(on) > 1:
+            near[0] = on[0] | on[1]
+            near[-1] = on[-1] | on[-2]
+
+        kb = lat_obj.shape_key_add(name=f"{prefix}{int(frames[on][0]):04d}", from_mix=False)
+        kb.data.foreach_set("co", results[k].astype(np.float32).ravel())
+        kb.value = 0.0
+        _keyframe_value(kb, frames[near], on[near].astype(np.float64))
+        created += 1
+
+    lat_obj["bd_anim_baked"] = True
+    return created
+
+
+def bake_deform_animation(
+    scene,
+    lattices: list[bpy.types.Object],
+    *,
+    frame_start: int,
+    frame_end: int,
+    frame_step: int = 1,
+    prefix: str = "BD_Frame_",
+) -> int:
+    frames = np.arange(int(frame_start), int(frame_end) + 1, max(1, int(frame_step)), dtype=np.float64)
+    if frames.size == 0 or not lattices:
+        return 0
+
+    settings = scene.bd_deform_settings
+    chain, constants = settings_chain(settings)
+    names = stages.chain_params(chain)
+    samples = sample_deform_params(scene, frames, names)
+    params = np.column_stack([samples[name] for name in names]) if names else np.zeros((frames.size, 1))
+    # Frames with identical parameters share one shape key.
+    unique_params, index = np.unique(params, axis=0, return_inverse=True)
+    index = index.reshape(-1)
+    reset_to_uniform = bool(settings.reset_to_uniform)
+    varying = dict(constants)
+    varying.update({name: unique_params[:, i] for i, name in enumerate(names)})
+
+    def evaluate(grid: np.ndarray, locked_idx: int) -> np.ndarray:
+        stages.run_chain(grid, chain, varying, locked_idx=locked_idx)
+        return grid.reshape(grid.shape[0], -1, 3)
+
+    baked = 0
+    for (resolution, locked_idx), members in group_by_signature(lattices).items():
+        shared = None
+        if reset_to_uniform:
+            shared = evaluate(kernels.uniform_grid(resolution, batch=unique_params.shape[0]), locked_idx)
+
+        for lat_obj in members:
+            try:
+                results = shared
+                if results is None:
+                    co = np.empty(len(lat_obj.data.points) * 3, dtype=np.float32)
+                    lat_obj.data.points.foreach_get("co_deform", co)
+                    grid = np.repeat(kernels.grid_from_flat(co, resolution), unique_params.shape[0], axis=0)
+                    results = evaluate(grid, locked_idx)
+                _write_shape_keys(lat_obj, frames, index, results, prefix)
+                baked += 1
+            except Exception as e:
+                print(f"BevelDeformer: animation bake failed for {getattr(lat_obj, 'name', '<unknown>')}: {e}")
+
+    return baked
+
+
+class BD_OT_bake_deform_animation(Operator):
+    bl_idname = "bd.bake_deform_animation"
+    bl_label = "Bake Deform Animation"
+    bl_description = "Bake animated deform sliders over a frame range into lattice shape keys"
+    bl_options = {"REGISTER", "UNDO"}
+
+    frame_start: IntProperty(name="Start", default=1)
+    frame_end: IntProperty(name="End", default=250)
+    frame_step: IntProperty(name="Step", default=1, min=1)
+    prefix: StringProperty(name="Key Prefix", default="BD_Frame_")
+
+    def invoke(self, context, event):
+        self.frame_start = int(context.scene.frame_start)
+        self.frame_end = int(context.scene.frame_end)
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        if self.frame_end < self.frame_start:
+            self.report({'WARNING'}, "End frame is before start frame")
+            return {'CANCELLED'}
+
+        lattices = gather_target_lattices(context.selected_objects)
+        if not lattices:
+            self.report({'WARNING'}, "No lattices found for selected objects")
+            return {'CANCELLED'}
+
+        count = bake_deform_animation(
+            context.scene,
+            lattices,
+            frame_start=self.frame_start,
+            frame_end=self.frame_end,
+            frame_step=self.frame_step,
+            prefix=self.prefix,
+        )
+        self.report({'INFO'}, f"Baked deform animation into {count} lattice(s)")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_bake_deform_animation,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,332 @@
+"""Scripting API: batch functions on explicit objects, for ``blender -b`` and pipelines.
+
+    from bevel_deformer import api
+
+    result = api.create_lattices(meshes, base_resolution=8)
+    api.deform(result.lattices, shift_factor=0.3, offset_x=rng.uniform(-1, 1, len(result.lattices)))
+    api.apply(meshes, fast=True)
+
+Nothing here reads or changes the selection, the active object or the mode, so
+the functions work the same in the UI, in background mode and from other tools.
+Parameters that take one value per lattice accept a scalar or an array aligned
+with the ``lattices`` sequence.
+"""
+
+from dataclasses import dataclass, field
+
+import bpy
+import numpy as np
+
+from . import deform_ops, influence, lattice_ops, layers, random_ops, scope, stages
+
+
+@dataclass
+class CreateResult:
+    """``lattices`` holds one entry per input mesh that has a lattice afterwards."""
+
+    lattices: list = field(default_factory=list)
+    created: list = field(default_factory=list)
+    kept: list = field(default_factory=list)
+    replaced: int = 0
+    failed: dict = field(default_factory=dict)
+
+
+@dataclass
+class DeformResult:
+    """``written`` lattices got new points; ``layered`` are those of them deformed through a stage layer."""
+
+    written: list = field(default_factory=list)
+    layered: list = field(default_factory=list)
+    skipped: dict = field(default_factory=dict)
+    failed: dict = field(default_factory=dict)
+
+
+@dataclass
+class ResetResult:
+    """``flattened`` are the reset lattices whose layer stack was dropped."""
+
+    reset: list = field(default_factory=list)
+    flattened: list = field(default_factory=list)
+    skipped: dict = field(default_factory=dict)
+
+
+@dataclass
+class DeleteResult:
+    deleted: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+
+
+_GN_BACKEND = "on the Geometry Nodes backend (the mesh follows the scene sliders)"
+
+
+@dataclass
+class ApplyResult:
+    applied: int = 0
+    deleted_lattices: int = 0
+    still_used: int = 0
+    skipped: dict = field(default_factory=dict)
+
+
+def _objects(objects, object_type: str) -> list[bpy.types.Object]:
+    # Keeps the caller's order and drops duplicates and other object types.
+    seen: dict[bpy.types.Object, None] = {}
+    for obj in objects or ():
+        if obj is not None and obj.type == object_type:
+            seen.setdefault(obj, None)
+    return list(seen)
+
+
+def lattices_of(objects) -> list[bpy.types.Object]:
+    """The lattices of ``objects``: lattices themselves plus those the meshes' modifiers use."""
+    return deform_ops.gather_target_lattices(objects)
+
+
+def create_lattices(
+    meshes,
+    *,
+    base_resolution: int = 6,
+    locked_axis: bool = True,
+    locked_world_axis: str = "X",
+    interpolation: str = "KEY_BSPLINE",
+    rebuild: bool = False,
+) -> CreateResult:
+    """Fit a lattice to every mesh, as Create Lattice (Per Mesh) does.
+
+    Lattices fitted from the same bounds, transform and settings are kept (only
+    their interpolation is updated) unless ``rebuild`` is set; other lattices of
+    the mesh, shared ones included, are replaced.
+    """
+    create_kwargs = dict(
+        locked_enabled=bool(locked_axis),
+        base_res=lattice_ops._even_base_resolution(int(base_resolution)),
+        locked_world_axis=str(locked_world_axis),
+        interpolation=str(interpolation),
+    )
+    result = CreateResult()
+    meshes = _objects(meshes, 'MESH')
+    if not meshes:
+        return result
+
+    bpy.context.view_layer.update()
+    for obj in meshes:
+        try:
+            lat_obj = None if rebuild else lattice_ops._reusable_lattice(obj, create_kwargs)
+            if lat_obj is not None:
+                lattice_ops._set_interpolation(lat_obj, create_kwargs["interpolation"])
+                result.kept.append(lat_obj)
+            else:
+                removed = lattice_ops._remove_existing_lattice(obj)
+                if lattice_ops._leave_group_lattices(obj) or removed:
+                    result.replaced += 1
+                lat_obj = lattice_ops._create_lattice_for_mesh(obj, **create_kwargs)
+                result.created.append(lat_obj)
+            result.lattices.append(lat_obj)
+        except Exception as e:
+            print(f"BevelDeformer: failed for {obj.name}: {e}")
+            result.failed[obj.name] = str(e)
+    return result
+
+
+def create_shared_lattice(
+    meshes,
+    *,
+    name: str,
+    base_resolution: int = 6,
+    locked_axis: bool = True,
+    locked_world_axis: str = "X",
+    interpolation: str = "KEY_BSPLINE",
+    collection=None,
+) -> bpy.types.Object:
+    """One world-aligned lattice used by all ``meshes``; their previous lattices are replaced."""
+    meshes = _objects(meshes, 'MESH')
+    if not meshes:
+        raise ValueError("no mesh objects given")
+
+    bpy.context.view_layer.update()
+    for obj in meshes:
+        lattice_ops._remove_existing_lattice(obj)
+        lattice_ops._leave_group_lattices(obj)
+    return lattice_ops.create_group_lattice(
+        meshes,
+        name=name,
+        locked_enabled=bool(locked_axis),
+        base_res=lattice_ops._even_base_resolution(int(base_resolution)),
+        locked_world_axis=str(locked_world_axis),
+        interpolation=str(interpolation),
+        collection=collection,
+    )
+
+
+def _axis_index(value) -> float:
+    return float(stages.AXES.index(value.upper())) if isinstance(value, str) else float(value)
+
+
+def _stage_value(name: str, value, axis_params: set[str]):
+    # Scalars become floats, sequences per-lattice arrays; axis names ("X") become indices.
+    if name in axis_params:
+        if np.ndim(value):
+            return np.array([_axis_index(v) for v in value], dtype=np.float64)
+        return _axis_index(value)
+    if isinstance(value, str):
+        return value
+    return np.asarray(value, dtype=np.float64) if np.ndim(value) else float(value)
+
+
+def deform(
+    lattices,
+    *,
+    shift_factor=0.0,
+    scale_factor=1.0,
+    offset_x=0.0,
+    offset_y=0.0,
+    offset_z=0.0,
+    reset_to_uniform: bool = True,
+    chain=stages.DEFAULT_CHAIN,
+    layer: str = layers.DEFAULT_LAYER,
+    **stage_params,
+) -> DeformResult:
+    """Run the deform chain on ``lattices``.
+
+    ``chain`` is a sequence of stage names or a string such as ``"shift, taper, scale"``;
+    ``stage_params`` are the extra inputs its stages read (``taper_factor``,
+    ``taper_axis="Z"``, ``relax_profile="SMOOTH"``, ...). With only scalar values
+    lattices of the same resolution share one computed result; any array value
+    switches to a per-lattice batch. Lattices with a layer stack get the values as
+    stage layer ``layer`` (``reset_to_uniform`` does not apply to them) and are
+    rebuilt from their stacks; those where that layer holds captured edits end up in
+    ``failed``. Lattices on the Geometry Nodes backend are skipped.
+    """
+    lattices = list(lattices or ())
+    if any(obj is None or obj.type != 'LATTICE' for obj in lattices):
+        raise TypeError("deform() takes lattice objects; lattices_of() finds those of meshes")
+    if len(set(lattices)) != len(lattices):
+        raise ValueError("lattices must not repeat")
+    if isinstance(chain, str):
+        chain = stages.parse_chain(chain)
+    chain = tuple(chain)
+    unknown = [name for name in chain if name not in stages.STAGES]
+    if unknown:
+        raise ValueError(f"unknown stage(s): {', '.join(unknown)}")
+
+    known = {p for name in stages.STAGES for p in stages.STAGES[name].inputs}
+    unexpected = sorted(set(stage_params) - known)
+    if unexpected:
+        raise TypeError(f"unexpected stage parameter(s): {', '.join(unexpected)}")
+    result = DeformResult()
+    if not lattices:
+        return result
+
+    axis_params = {stage.axis_param for stage in stages.STAGES.values() if stage.axis_param}
+    params = {
+        "shift_factor": shift_factor,
+        "scale_factor": scale_factor,
+        "offset_x": offset_x,
+        "offset_y": offset_y,
+        "offset_z": offset_z,
+    }
+    params.update(stage_params)
+    params = {name: _stage_value(name, value, axis_params) for name, value in params.items()}
+
+    per_lattice = {name: value for name, value in params.items() if isinstance(value, np.ndarray)}
+    for name, values in per_lattice.items():
+        if values.shape != (len(lattices),):
+            raise ValueError(f"{name} has {values.size} value(s) for {len(lattices)} lattice(s)")
+
+    rows = []
+    for i, lat_obj in enumerate(lattices):
+        if lat_obj.get("bd_gn_backend"):
+            result.skipped[lat_obj.name] = _GN_BACKEND
+            continue
+        try:
+            layers.check_stage_layer([lat_obj], layer)
+        except ValueError as e:
+            result.failed[lat_obj.name] = str(e)
+            continue
+        rows.append(i)
+    targets = [lattices[i] for i in rows]
+    if not targets:
+        return result
+
+    stacked = [layers.has_layers(lat) for lat in targets]
+    result.layered = [lat for lat, has in zip(targets, stacked) if has]
+    if per_lattice:
+        per_lattice = {name: values[rows] for name, values in per_lattice.items()}
+        constants = {name: value for name, value in params.items() if name not in per_lattice}
+        random_ops.deform_lattices_with_params(
+            targets, per_lattice, chain=chain, constants=constants, reset_to_uniform=reset_to_uniform, layer=layer,
+        )
+    else:
+        layers.deform_into_layer(result.layered, layer, chain, params)
+        plain = [lat for lat, has in zip(targets, stacked) if not has]
+        main = {name: params.pop(name) for name in random_ops.RANDOM_PARAMS}
+        deform_ops.process_lattice_smart_scale(
+            lattices=plain, reset_to_uniform=bool(reset_to_uniform), chain=chain, stage_params=params, **main,
+        )
+    result.written = targets
+    # Background sessions never run timers, so queued influence groups are refreshed here.
+    influence.refresh_pending()
+    return result
+
+
+def reset(lattices) -> ResetResult:
+    """Put ``lattices`` back to their uniform grid, dropping their layer stacks.
+
+    Lattices on the Geometry Nodes backend are skipped.
+    """
+    result = ResetResult()
+    for lat_obj in _objects(lattices, 'LATTICE'):
+        if lat_obj.get("bd_gn_backend"):
+            result.skipped[lat_obj.name] = _GN_BACKEND
+            continue
+        result.reset.append(lat_obj)
+        if layers.has_layers(lat_obj):
+            result.flattened.append(lat_obj)
+    if result.reset:
+        deform_ops.reset_selected_lattices_to_uniform(result.reset)
+        influence.refresh_pending()
+    return result
+
+
+def delete(lattices) -> DeleteResult:
+    """Delete ``lattices`` and the modifiers that use them; ``deleted`` holds their names."""
+    result = DeleteResult()
+    for lat_obj, users in scope.lattice_users(_objects(lattices, 'LATTICE')).items():
+        name = lat_obj.name
+        try:
+            if lattice_ops._delete_lattice_object(lat_obj, users):
+                result.deleted.append(name)
+        except Exception as e:
+            print(f"BevelDeformer: failed to delete lattice {name}: {e}")
+            result.failed[name] = str(e)
+    return result
+
+
+def apply(meshes, *, lattices=None, fast: bool = True, delete_lattices: bool = True) -> ApplyResult:
+    """Apply the lattice modifiers of ``meshes`` (only those using ``lattices`` when given).
+
+    ``fast`` bakes first-in-stack modifiers with NumPy instead of the modifier
+    operator. Meshes in Edit Mode are skipped rather than switched out of it, and so
+    are meshes whose data is linked from a library. With ``delete_lattices`` the
+    applied lattices no other mesh uses are deleted.
+    """
+    result = ApplyResult()
+    only = set(_objects(lattices, 'LATTICE')) if lattices is not None else None
+    used: set[bpy.types.Object] = set()
+    for mesh_obj in _objects(meshes, 'MESH'):
+        if mesh_obj.mode == 'EDIT':
+            result.skipped[mesh_obj.name] = "in Edit Mode"
+            continue
+        if lattice_ops.is_linked_mesh(mesh_obj):
+            result.skipped[mesh_obj.name] = "mesh data is linked"
+            continue
+        targets = {
+            mod.object for mod in lattice_ops._iter_lattice_modifiers(mesh_obj)
+            if mod.object is not None and (only is None or mod.object in only)
+        }
+        used.update(targets)
+        if targets:
+            result.applied += lattice_ops.apply_lattice_modifiers(bpy.context, mesh_obj, targets, fast=fast)
+
+    if delete_lattices:
+        result.deleted_lattices, result.still_used = lattice_ops.delete_unused_lattices(list(used))
+    return result
@@ -0,0 +1,216 @@
+import fnmatch
+import os
+
+import bpy
+from bpy.types import Operator
+
+from . import lattice_ops
+
+
+# abspath -> (mtime_ns, size, {"objects": [...], "collections": [...]})
+_library_index: dict[str, tuple[int, int, dict[str, list[str]]]] = {}
+
+
+def _normalize_path(filepath: str) -> str:
+    return os.path.normcase(os.path.abspath(bpy.path.abspath(str(filepath))))
+
+
+def library_index(filepath: str) -> dict[str, list[str]]:
+    """Object and collection names stored in a .blend, cached until the file changes.
+
+    Listing names through ``libraries.load`` reads only the file's block headers;
+    nothing is linked because no names are requested.
+    """
+    path = _normalize_path(filepath)
+    stat = os.stat(path)
+    cached = _library_index.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    with bpy.data.libraries.load(path, link=True) as (data_from, _data_to):
+        index = {
+            "objects": list(data_from.objects),
+            "collections": list(data_from.collections),
+        }
+    _library_index[path] = (stat.st_mtime_ns, stat.st_size, index)
+    return index
+
+
+def clear_library_index(filepath: str | None = None) -> None:
+    if filepath is None:
+        _library_index.clear()
+    else:
+        _library_index.pop(_normalize_path(filepath), None)
+
+
+def match_names(names: list[str], pattern: str) -> list[str]:
+    """Names matching any of the comma separated glob patterns (all names for an empty pattern)."""
+    patterns = [p.strip() for p in str(pattern).split(",") if p.strip()]
+    if not patterns:
+        return list(names)
+    return [name for name in names if any(fnmatch.fnmatchcase(name, p) for p in patterns)]
+
+
+def _batch_load(path: str, kind: str, names: list[str], *, link: bool) -> list:
+    """Load ``names`` of ``kind`` ("objects"/"collections") from ``path`` in one call."""
+    if not names:
+        return []
+    with bpy.data.libraries.load(path, link=link) as (data_from, data_to):
+        available = set(getattr(data_from, kind))
+        setattr(data_to, kind, [name for name in names if name in available])
+    return [block for block in getattr(data_to, kind) if block is not None]
+
+
+def place_objects(
+    filepath: str,
+    names: list[str],
+    *,
+    collection: bpy.types.Collection,
+    link: bool = True,
+) -> list[bpy.types.Object]:
+    """Place library objects into ``collection``.
+
+    With ``link`` the object data (meshes, materials) stays linked and only a local
+    object is created around it, so placing thousands of rocks copies nothing and
+    the placed objects can still take lattice modifiers. Apply Lattice skips them,
+    since a linked mesh cannot be changed. Without ``link`` the objects are appended.
+    """
+    path = _normalize_path(filepath)
+    loaded = _batch_load(path, "objects", names, link=link)
+
+    placed: list[bpy.types.Object] = []
+    for src in loaded:
+        try:
+            if not link:
+                collection.objects.link(src)
+                placed.append(src)
+                continue
+
+            name, data, matrix = src.name, src.data, src.matrix_world.copy()
+            # The linked object itself is not needed once its data is used locally.
+            bpy.data.objects.remove(src)
+            obj = bpy.data.objects.new(name, data)
+            obj.matrix_world = matrix
+            collection.objects.link(obj)
+            placed.append(obj)
+        except Exception as e:
+            print(f"BevelDeformer: failed to place asset {getattr(src, 'name', '<unknown>')}: {e}")
+    return placed
+
+
+def place_collection_instances(
+    filepath: str,
+    names: list[str],
+    *,
+    collection: bpy.types.Collection,
+) -> list[bpy.types.Object]:
+    """Link library collections and add one collection-instance empty per collection."""
+    path = _normalize_path(filepath)
+    placed: list[bpy.types.Object] = []
+    for src in _batch_load(path, "collections", names, link=True):
+        try:
+            empty = bpy.data.objects.new(src.name, None)
+            empty.instance_type = 'COLLECTION'
+            empty.instance_collection = src
+            collection.objects.link(empty)
+            placed.append(empty)
+        except Exception as e:
+            print(f"BevelDeformer: failed to instance collection {getattr(src, 'name', '<unknown>')}: {e}")
+    return placed
+
+
+class BD_OT_load_library_assets(Operator):
+    bl_idname = "bd.load_library_assets"
+    bl_label = "Load Assets"
+    bl_description = "Link, append or instance matching assets from the library .blend in one batch"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        settings = context.scene.bd_asset_settings
+        if not settings.filepath:
+            self.report({'WARNING'}, "No asset library file set")
+            return {'CANCELLED'}
+
+        try:
+            index = library_index(settings.filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Cannot read asset library: {e}")
+            return {'CANCELLED'}
+
+        kind = "collections" if settings.mode == 'INSTANCE' else "objects"
+        names = match_names(index[kind], settings.name_filter)
+        if not names:
+            self.report({'WARNING'}, f"No {kind} match '{settings.name_filter}'")
+            return {'CANCELLED'}
+
+        collection = context.collection or context.scene.collection
+        try:
+            if settings.mode == 'INSTANCE':
+                placed = place_collection_instances(settings.filepath, names, collection=collection)
+            else:
+                placed = place_objects(
+                    settings.filepath, names, collection=collection, link=settings.mode == 'LINK'
+                )
+        except Exception as e:
+            self.report({'ERROR'}, f"Asset loading failed: {e}")
+            return {'CANCELLED'}
+
+        created = 0
+        meshes = [obj for obj in placed if obj.type == 'MESH']
+        if settings.create_lattices and meshes:
+            lattice_settings = context.scene.bd_lattice_settings
+            created = lattice_ops.create_lattice_multi(
+                meshes,
+                locked_axis_enabled=bool(getattr(lattice_settings, "locked_axis_enabled", True)),
+                base_resolution=int(lattice_settings.base_resolution),
+                locked_world_axis=str(lattice_settings.locked_world_axis),
+                interpolation=str(lattice_settings.interpolation),
+                select_result=False,
+            )
+
+        self.report(
+            {'INFO'},
+            f"Placed {len(placed)} asset(s)" + (f", created {created} lattice(s)" if created else ""),
+        )
+        return {'FINISHED'}
+
+
+class BD_OT_refresh_library_index(Operator):
+    bl_idname = "bd.refresh_library_index"
+    bl_label = "Refresh Library"
+    bl_description = "Re-read the asset library contents"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        settings = context.scene.bd_asset_settings
+        clear_library_index(settings.filepath or None)
+        if not settings.filepath:
+            return {'FINISHED'}
+
+        try:
+            index = library_index(settings.filepath)
+        except Exception as e:
+            self.report({'ERROR'}, f"Cannot read asset library: {e}")
+            return {'CANCELLED'}
+
+        self.report(
+            {'INFO'}, f"{len(index['objects'])} object(s), {len(index['collections'])} collection(s)"
+        )
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_load_library_assets,
+    BD_OT_refresh_library_index,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
+    _library_index.clear()
@@ -0,0 +1,93 @@
+import time
+
+from bpy.props import BoolProperty
+
+from . import memstats
+
+
+BATCH_BUDGET_SEC = 0.1
+_TIMER_STEP_SEC = 0.01
+
+
+class BatchOperator:
+    """Mixin running an operator's per-item work in time-budgeted chunks.
+
+    Subclasses implement ``batch_prepare(context) -> list | None`` (None cancels),
+    ``batch_step(context, item)`` and ``batch_finish(context, done, cancelled) -> set``.
+    Invoked from the UI, work that does not fit in one budget continues modally with
+    a progress bar; ESC stops after the current item and finishes with what is done.
+    Called from scripts (EXEC) everything runs synchronously.
+    """
+
+    use_modal: BoolProperty(default=False, options={'HIDDEN', 'SKIP_SAVE'})
+
+    batch_label = "Processing"
+
+    def invoke(self, context, event):
+        self.use_modal = True
+        return self.execute(context)
+
+    def execute(self, context):
+        items = self.batch_prepare(context)
+        if items is None:
+            return {'CANCELLED'}
+
+        self._batch_items = list(items)
+        self._batch_done = 0
+
+        modal = bool(self.use_modal) and context.window is not None
+        self._run_chunk(context, BATCH_BUDGET_SEC if modal else None)
+        if not modal or self._batch_done >= len(self._batch_items):
+            return self.batch_finish(context, self._batch_done, False)
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self._batch_items))
+        wm.progress_update(self._batch_done)
+        self._batch_timer = wm.event_timer_add(_TIMER_STEP_SEC, window=context.window)
+        self._set_status(context)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self._end_modal(context, cancelled=True)
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        self._run_chunk(context, BATCH_BUDGET_SEC)
+        context.window_manager.progress_update(self._batch_done)
+        if self._batch_done >= len(self._batch_items):
+            return self._end_modal(context, cancelled=False)
+        self._set_status(context)
+        return {'RUNNING_MODAL'}
+
+    def _run_chunk(self, context, budget: float | None) -> None:
+        start = time.perf_counter()
+        items = self._batch_items
+        with memstats.track(self.bl_idname):
+            while self._batch_done < len(items):
+                item = items[self._batch_done]
+                self._batch_done += 1
+                try:
+                    self.batch_step(context, item)
+                except Exception as e:
+                    print(f"BevelDeformer: {self.batch_label.lower()} failed for {item!r}: {e}")
+                if budget is not None and time.perf_counter() - start >= budget:
+                    break
+
+    def _set_status(self, context) -> None:
+        workspace = getattr(context, "workspace", None)
+        if workspace is not None:
+            workspace.status_text_set(
+                f"{self.batch_label}: {self._batch_done}/{len(self._batch_items)} (Esc to stop)"
+            )
+
+    def _end_modal(self, context, *, cancelled: bool):
+        wm = context.window_manager
+        wm.event_timer_remove(self._batch_timer)
+        wm.progress_end()
+        workspace = getattr(context, "workspace", None)
+        if workspace is not None:
+            workspace.status_text_set(None)
+        # The completed part stays done (and undoable), even when stopped early.
+        return self.batch_finish(context, self._batch_done, cancelled)
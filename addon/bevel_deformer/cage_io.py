@@ -0,0 +1,366 @@
+import os
+import struct
+
+import bpy
+import numpy as np
+from bpy.types import Operator
+from mathutils import Matrix
+
+from . import ffd, gn_backend, lattice_ops, layers, scope
+from .deform_ops import gather_target_lattices, get_lattice_locked_axis
+
+
+# Binary lattice-cage exchange (.bdcage), little-endian:
+#
+#   header   MAGIC, version u32, record size u32
+#   records  per cage: one RECORD_DTYPE header, then its co_deform as float32 (N, 3)
+#   index    every record header again, back to back
+#   trailer  index offset u64, cage count u64, INDEX_MAGIC
+#
+# Records can be written and read front to back without seeking; the index at
+# the end gives random access to any cage through one memory map of the file.
+
+MAGIC = b"BDCAGES\0"
+INDEX_MAGIC = b"BDCAGEIX"
+FORMAT_VERSION = 1
+
+RECORD_DTYPE = np.dtype([
+    ("name", "S64"),
+    ("resolution", "<u4", (3,)),
+    ("interpolation", "u1", (3,)),
+    ("locked_axis", "i1"),
+    ("locked_world_axis", "S1"),
+    ("reserved", "u1", (7,)),
+    ("offset", "<u8"),
+    ("matrix_world", "<f8", (4, 4)),
+])
+
+_HEADER = struct.Struct("<8sII")
+_TRAILER = struct.Struct("<QQ8s")
+
+
+def _interpolation_codes(interpolation) -> tuple[int, int, int]:
+    return tuple(ffd.INTERPOLATION_TYPES.index(value) for value in ffd._normalize_interpolation(interpolation))
+
+
+def _interpolation_names(codes) -> tuple[str, str, str]:
+    return tuple(ffd.INTERPOLATION_TYPES[int(code)] for code in codes)
+
+
+class CageWriter:
+    """Stream cages into a .bdcage file; the index is written on ``close``."""
+
+    def __init__(self, filepath: str):
+        self._file = open(filepath, "wb")
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize))
+        self._index: list[np.ndarray] = []
+        self._buffer = np.empty(0, dtype=np.float32)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._index)
+
+    def add_array(
+        self,
+        name: str,
+        points: np.ndarray,
+        resolution: tuple[int, int, int],
+        interpolation="KEY_BSPLINE",
+        *,
+        locked_axis: int = -1,
+        locked_world_axis: str = "",
+        matrix_world=None,
+    ) -> None:
+        points = np.ascontiguousarray(points, dtype="<f4").reshape(-1)
+        if points.size != int(np.prod(resolution)) * 3:
+            raise ValueError(f"Cage '{name}' has {points.size // 3} points, resolution {tuple(resolution)} needs {int(np.prod(resolution))}")
+        encoded = str(name).encode("utf-8")
+        if len(encoded) > RECORD_DTYPE["name"].itemsize:
+            raise ValueError(f"Cage name '{name}' is longer than {RECORD_DTYPE['name'].itemsize} bytes")
+
+        record = np.zeros((), dtype=RECORD_DTYPE)
+        record["name"] = encoded
+        record["resolution"] = resolution
+        record["interpolation"] = _interpolation_codes(interpolation)
+        record["locked_axis"] = int(locked_axis)
+        record["locked_world_axis"] = str(locked_world_axis or "")[:1].encode("ascii")
+        record["offset"] = self._file.tell() + RECORD_DTYPE.itemsize
+        record["matrix_world"] = np.identity(4) if matrix_world is None else np.asarray(matrix_world, dtype=np.float64)
+
+        self._file.write(record.tobytes())
+        self._file.write(points.tobytes())
+        self._index.append(record)
+
+    def add_lattice(self, lat_obj) -> None:
+        """Read ``co_deform`` with one ``foreach_get`` into a reused buffer and append it."""
+        lat = lat_obj.data
+        count = len(lat.points) * 3
+        if self._buffer.size < count:
+            self._buffer = np.empty(count, dtype=np.float32)
+        points = self._buffer[:count]
+        lat.points.foreach_get("co_deform", points)
+
+        locked_enabled, locked_idx = get_lattice_locked_axis(lat_obj)
+        self.add_array(
+            lat_obj.name,
+            points,
+            (int(lat.points_u), int(lat.points_v), int(lat.points_w)),
+            (lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w),
+            locked_axis=int(locked_idx) if locked_enabled and locked_idx is not None else -1,
+            locked_world_axis=str(lat_obj.get("bd_locked_world_axis", "")),
+            matrix_world=np.array(lat_obj.matrix_world, dtype=np.float64),
+        )
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        if self._index:
+            self._file.write(np.stack(self._index).tobytes())
+        self._file.write(_TRAILER.pack(index_offset, len(self._index), INDEX_MAGIC))
+        self._file.close()
+
+
+def _read_header(f) -> None:
+    magic, version, record_size = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("not a .bdcage file")
+    if version != FORMAT_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"unsupported .bdcage version {version}")
+
+
+def iter_cages(filepath: str):
+    """Yield ``(record, points)`` front to back without using the index."""
+    with open(filepath, "rb") as f:
+        _read_header(f)
+        while True:
+            raw = f.read(RECORD_DTYPE.itemsize)
+            if len(raw) < RECORD_DTYPE.itemsize:
+                return
+            record = np.frombuffer(raw, dtype=RECORD_DTYPE)[0]
+            if int(record["offset"]) != f.tell():
+                # Reached the index: its entries point back at earlier payloads.
+                return
+            count = int(np.prod(record["resolution"])) * 3
+            points = np.frombuffer(f.read(count * 4), dtype="<f4").reshape(-1, 3)
+            yield record, points
+
+
+class CageFile:
+    """Random access to a .bdcage file through one read-only memory map."""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        with open(filepath, "rb") as f:
+            _read_header(f)
+            f.seek(-_TRAILER.size, os.SEEK_END)
+            index_offset, count, magic = _TRAILER.unpack(f.read(_TRAILER.size))
+        if magic != INDEX_MAGIC:
+            raise ValueError("missing .bdcage index (file incomplete?)")
+
+        self._map = np.memmap(filepath, dtype=np.uint8, mode='r')
+        self.index = np.frombuffer(self._map, dtype=RECORD_DTYPE, count=int(count), offset=int(index_offset))
+        self._positions: dict[str, int] | None = None
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def names(self) -> list[str]:
+        return [name.decode("utf-8") for name in self.index["name"]]
+
+    def find(self, name: str) -> int | None:
+        if self._positions is None:
+            self._positions = {key: i for i, key in enumerate(self.names)}
+        return self._positions.get(name)
+
+    def record(self, i: int) -> dict:
+        entry = self.index[int(i)]
+        return {
+            "name": entry["name"].decode("utf-8"),
+            "resolution": tuple(int(r) for r in entry["resolution"]),
+            "interpolation": _interpolation_names(entry["interpolation"]),
+            "locked_axis": int(entry["locked_axis"]),
+            "locked_world_axis": entry["locked_world_axis"].decode("ascii"),
+            "matrix_world": np.array(entry["matrix_world"]),
+        }
+
+    def points(self, i: int) -> np.ndarray:
+        """The cage's co_deform as a read-only (N, 3) float32 view into the map."""
+        entry = self.index[int(i)]
+        count = int(np.prod(entry["resolution"])) * 3
+        return np.frombuffer(self._map, dtype="<f4", count=count, offset=int(entry["offset"])).reshape(-1, 3)
+
+
+def export_lattices(filepath: str, lattices) -> int:
+    with CageWriter(filepath) as writer:
+        for lat_obj in lattices:
+            writer.add_lattice(lat_obj)
+        return len(writer)
+
+
+def _apply_record(lat_obj, record: dict, points: np.ndarray, *, apply_transform: bool) -> bool:
+    lat = lat_obj.data
+    resolution = record["resolution"]
+    try:
+        layers.check_edits_layer(lat_obj)
+    except ValueError as e:
+        print(f"BevelDeformer: cage not imported: {e}")
+        return False
+    old_res = (int(lat.points_u), int(lat.points_v), int(lat.points_w))
+    if old_res != resolution:
+        # Blender cannot resize lattices with shape keys or while they are in Edit Mode.
+        if lat.shape_keys is not None or lat_obj.mode == 'EDIT':
+            return False
+        layers.resample(lat_obj, old_res, resolution)
+        lat.points_u, lat.points_v, lat.points_w = resolution
+
+    lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w = record["interpolation"]
+    # On a layered lattice the cage's difference to the stack becomes the edits layer.
+    layers.write_points(lat_obj, points)
+
+    lat_obj["bd_locked_axis_enabled"] = record["locked_axis"] >= 0
+    lat_obj["bd_locked_axis_idx"] = record["locked_axis"]
+    if record["locked_world_axis"]:
+        lat_obj["bd_locked_world_axis"] = record["locked_world_axis"]
+    if apply_transform:
+        lat_obj.matrix_world = Matrix(record["matrix_world"].tolist())
+        # The cage no longer sits where Create fitted it, so Create must not keep it.
+        lat_obj.pop(lattice_ops.FINGERPRINT_KEY, None)
+    gn_backend.sync_lattice_inputs(lat_obj)
+    return True
+
+
+def import_cages(
+    filepath: str,
+    *,
+    names=None,
+    create_missing: bool = False,
+    apply_transform: bool = False,
+    collection=None,
+) -> tuple[int, int, int]:
+    """Write cages from ``filepath`` into the lattices of the same name.
+
+    ``names`` restricts the import to those cages (looked up through the index).
+    Missing lattices are created (placed by the stored world matrix) when
+    ``create_missing`` is set. Returns (updated, created, skipped).
+    """
+    cages = CageFile(filepath)
+    positions = range(len(cages)) if names is None else [cages.find(name) for name in names]
+
+    updated = created = skipped = 0
+    for i in positions:
+        if i is None:
+            skipped += 1
+            continue
+        record = cages.record(i)
+        lat_obj = bpy.data.objects.get(record["name"])
+        if lat_obj is not None and lat_obj.type != 'LATTICE':
+            skipped += 1
+            continue
+
+        if lat_obj is None:
+            if not create_missing:
+                skipped += 1
+                continue
+            lat_obj = lattice_ops._new_lattice_object(
+                record["name"], list(record["resolution"]), record["interpolation"][0],
+                collection or bpy.context.scene.collection,
+                locked_enabled=record["locked_axis"] >= 0,
+                locked_idx=record["locked_axis"] if record["locked_axis"] >= 0 else None,
+                locked_world_axis=record["locked_world_axis"] or "X",
+            )
+            _apply_record(lat_obj, record, cages.points(i), apply_transform=True)
+            created += 1
+            continue
+
+        if _apply_record(lat_obj, record, cages.points(i), apply_transform=apply_transform):
+            updated += 1
+        else:
+            skipped += 1
+    return updated, created, skipped
+
+
+def _cage_path(settings) -> str:
+    # bpy.path.abspath resolves "//" against the working directory for unsaved files.
+    if settings.filepath.startswith("//") and not bpy.data.filepath:
+        raise ValueError("save the .blend first or choose an absolute cage file path")
+    return bpy.path.abspath(settings.filepath)
+
+
+class BD_OT_export_cages(Operator):
+    bl_idname = "bd.export_cages"
+    bl_label = "Export Cages"
+    bl_description = "Write the target lattices (resolution, interpolation, locked axis, world matrix, points) to a .bdcage file"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        settings = context.scene.bd_cage_settings
+        lattices = sorted(gather_target_lattices(scope.scope_objects(context)), key=lambda o: o.name)
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        try:
+            path = _cage_path(settings)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            count = export_lattices(path, lattices)
+        except Exception as e:
+            self.report({'ERROR'}, f"Cage export failed: {e}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Exported {count} cage(s) to {path}")
+        return {'FINISHED'}
+
+
+class BD_OT_import_cages(Operator):
+    bl_idname = "bd.import_cages"
+    bl_label = "Import Cages"
+    bl_description = "Write the cages of a .bdcage file into the lattices with the same names"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        settings = context.scene.bd_cage_settings
+        collection = None
+        if scope.is_collection_scope(context):
+            collection = context.scene.bd_scope_settings.collection
+
+        try:
+            updated, created, skipped = import_cages(
+                _cage_path(settings),
+                create_missing=bool(settings.create_missing),
+                apply_transform=bool(settings.apply_transform),
+                collection=collection,
+            )
+        except Exception as e:
+            self.report({'ERROR'}, f"Cage import failed: {e}")
+            return {'CANCELLED'}
+
+        self.report(
+            {'INFO'},
+            f"Imported {updated} cage(s)"
+            + (f", created {created} lattice(s)" if created else "")
+            + (f", skipped {skipped} (no lattice of that name, shape keys, Edit Mode or a stage layer named Edits)" if skipped else ""),
+        )
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_export_cages,
+    BD_OT_import_cages,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -1,14 +1,35 @@
+import time
+from contextlib import contextmanager
+
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
 from bpy.types import Operator
-from mathutils import Vector
+
+from . import influence, kernels, live_trace, memstats, scope, stages
 
 
 _LIVE_UPDATE_INTERVAL_SEC = 0.15
 _live_update_timer_running = False
 _live_update_pending = False
+# Set while a modal tool writes the sliders itself, so those writes do not queue ticks.
+_live_update_suppressed = False
+
+# The live update loop reads time and registers timers through these, so the
+# replay harness (live_trace) can run it on a virtual clock. None = bpy.app.timers.
+_clock = time.monotonic
+_timer_api = None
 
+# Interaction LOD: originals captured while a Live Preview drag is in progress,
+# restored once no slider change has arrived for _LOD_SETTLE_SEC.
+_LOD_SETTLE_SEC = 0.5
+_lod_saved_interpolation: dict[str, tuple[str, str, str]] = {}
+_lod_hidden_modifiers: dict[tuple[str, str], bool] = {}
+_lod_last_activity = 0.0
 
-def _gather_target_lattices(selected_objects) -> list[bpy.types.Object]:
+
+def gather_target_lattices(selected_objects) -> list[bpy.types.Object]:
+    """Lattices among ``selected_objects`` plus those their lattice modifiers use."""
     lattices: set[bpy.types.Object] = set()
     for obj in list(selected_objects or []):
         try:
@@ -41,9 +62,13 @@ def _gather_target_lattices(selected_objects) -> list[bpy.types.Object]:
     return list(lattices)
 
 
+def _timers():
+    return _timer_api if _timer_api is not None else bpy.app.timers
+
+
 def _is_timer_registered() -> bool:
     try:
-        is_registered = getattr(bpy.app.timers, "is_registered", None)
+        is_registered = getattr(_timers(), "is_registered", None)
         if callable(is_registered):
             return bool(is_registered(_live_update_timer))
     except Exception:
@@ -55,57 +80,125 @@ def _ensure_timer_registered() -> bool:
     try:
         if _is_timer_registered():
             return True
-        bpy.app.timers.register(_live_update_timer, first_interval=_LIVE_UPDATE_INTERVAL_SEC)
+        _timers().register(_live_update_timer, first_interval=_LIVE_UPDATE_INTERVAL_SEC)
         return True
     except Exception as e:
         print(f"BevelDeformer: failed to register live update timer: {e}")
         return False
 
 
-def _shift_and_relax_line(coords: list[Vector], shift_factor: float) -> None:
-    count = len(coords)
-    if count < 4:
+def _lod_candidate_meshes(selected_objects, lattices) -> list[bpy.types.Object]:
+    meshes: set[bpy.types.Object] = set()
+    for obj in list(selected_objects or []) + [getattr(lat, "parent", None) for lat in lattices]:
+        if obj is not None and getattr(obj, "type", None) == 'MESH':
+            meshes.add(obj)
+    return list(meshes)
+
+
+def _enter_interaction_lod(settings, lattices, selected_objects) -> None:
+    global _lod_last_activity
+
+    if bool(getattr(settings, "lod_linear_interpolation", True)):
+        for lat_obj in lattices:
+            try:
+                lat = lat_obj.data
+                if lat is None or lat.name in _lod_saved_interpolation:
+                    continue
+                current = (lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w)
+                if current == ('KEY_LINEAR', 'KEY_LINEAR', 'KEY_LINEAR'):
+                    continue
+                _lod_saved_interpolation[lat.name] = current
+                lat.interpolation_type_u = 'KEY_LINEAR'
+                lat.interpolation_type_v = 'KEY_LINEAR'
+                lat.interpolation_type_w = 'KEY_LINEAR'
+            except Exception as e:
+                print(f"BevelDeformer: LOD interpolation switch failed for {getattr(lat_obj, 'name', '<unknown>')}: {e}")
+
+    threshold = int(getattr(settings, "lod_vertex_threshold", 0))
+    if threshold > 0:
+        lattice_set = set(lattices)
+        for mesh_obj in _lod_candidate_meshes(selected_objects, lattices):
+            try:
+                if len(mesh_obj.data.vertices) <= threshold:
+                    continue
+                for mod in mesh_obj.modifiers:
+                    if mod.type != 'LATTICE' or mod.object not in lattice_set:
+                        continue
+                    key = (mesh_obj.name, mod.name)
+                    if key in _lod_hidden_modifiers:
+                        continue
+                    _lod_hidden_modifiers[key] = bool(mod.show_viewport)
+                    mod.show_viewport = False
+            except Exception as e:
+                print(f"BevelDeformer: LOD modifier hide failed for {getattr(mesh_obj, 'name', '<unknown>')}: {e}")
+
+    _lod_last_activity = _clock()
+    if not (_lod_saved_interpolation or _lod_hidden_modifiers):
         return
 
-    sf = float(shift_factor)
-    if abs(sf) < 1e-8:
-        return
+    try:
+        if not _timers().is_registered(_lod_settle_timer):
+            _timers().register(_lod_settle_timer, first_interval=_LOD_SETTLE_SEC)
+    except Exception as e:
+        print(f"BevelDeformer: failed to register LOD settle timer: {e}")
 
-    if sf >= 0.0:
-        coords[1] = coords[1].lerp(coords[0], sf)
-        coords[count - 2] = coords[count - 2].lerp(coords[count - 1], sf)
-    else:
-        t = abs(sf)
-        if count > 2:
-            coords[1] = coords[1].lerp(coords[2], t)
-        if count - 3 >= 0:
-            coords[count - 2] = coords[count - 2].lerp(coords[count - 3], t)
 
-    if count <= 4:
-        return
+def restore_interaction_lod() -> None:
+    if _lod_saved_interpolation:
+        # Interpolation decides how far each lattice point reaches into the mesh.
+        for obj in bpy.data.objects:
+            if obj.type == 'LATTICE' and obj.data is not None and obj.data.name in _lod_saved_interpolation:
+                influence.mark_dirty(obj)
 
-    start_anchor = coords[1].copy()
-    end_anchor = coords[count - 2].copy()
-    total_steps = (count - 2) - 1
-    if total_steps <= 0:
-        return
+    for lat_name, interpolation in list(_lod_saved_interpolation.items()):
+        lat = bpy.data.lattices.get(lat_name)
+        if lat is None:
+            continue
+        try:
+            lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w = interpolation
+        except Exception as e:
+            print(f"BevelDeformer: failed to restore interpolation for {lat_name}: {e}")
+    _lod_saved_interpolation.clear()
+
+    for (mesh_name, mod_name), shown in list(_lod_hidden_modifiers.items()):
+        mesh_obj = bpy.data.objects.get(mesh_name)
+        mod = mesh_obj.modifiers.get(mod_name) if mesh_obj is not None else None
+        if mod is None:
+            continue
+        try:
+            mod.show_viewport = shown
+        except Exception as e:
+            print(f"BevelDeformer: failed to restore modifier {mod_name} on {mesh_name}: {e}")
+    _lod_hidden_modifiers.clear()
 
-    for k in range(2, count - 2):
-        t = (k - 1) / total_steps
-        coords[k] = start_anchor.lerp(end_anchor, t)
+
+def _lod_settle_timer() -> float | None:
+    try:
+        remaining = _LOD_SETTLE_SEC - (_clock() - _lod_last_activity)
+        if _live_update_pending or remaining > 0.0:
+            return max(remaining, _LIVE_UPDATE_INTERVAL_SEC)
+        restore_interaction_lod()
+    except Exception as e:
+        _lod_saved_interpolation.clear()
+        _lod_hidden_modifiers.clear()
+        print(f"BevelDeformer: LOD settle timer crashed: {e}")
+    return None
+
+
+@persistent
+def _restore_lod_before_save(*_args) -> None:
+    # Never persist the temporary drag state into the .blend.
+    restore_interaction_lod()
 
 
-def _offset_ramp_factor(index: int, resolution: int) -> float:
-    if resolution < 4:
-        return 0.0
-    if index <= 1:
-        return 0.0
-    if index >= resolution - 2:
-        return 1.0
-    return (index - 1) / (resolution - 3)
+@persistent
+def _discard_lod_on_load(*_args) -> None:
+    _lod_saved_interpolation.clear()
+    _lod_hidden_modifiers.clear()
 
 
-def _get_lattice_locked_axis(lat_obj) -> tuple[bool, int | None]:
+def get_lattice_locked_axis(lat_obj) -> tuple[bool, int | None]:
+    """(enabled, local axis index) stored on the lattice when it was created."""
     try:
         enabled = lat_obj.get("bd_locked_axis_enabled")
         idx = lat_obj.get("bd_locked_axis_idx")
@@ -134,21 +227,34 @@ def _get_lattice_locked_axis(lat_obj) -> tuple[bool, int | None]:
 
 
 def _apply_live_update() -> bool:
+    start = time.perf_counter()
+    with memstats.track("live_tick"):
+        applied = _live_update_tick()
+    live_trace.record_tick(time.perf_counter() - start)
+    return applied
+
+
+def _live_update_tick() -> bool:
     try:
         scene = bpy.context.scene
         settings = scene.bd_deform_settings
     except Exception:
         return False
 
+    objects = scope.scope_objects(bpy.context)
+    lattices = gather_target_lattices(objects)
+    if any(lat.get("bd_gn_backend") for lat in lattices):
+        from . import gn_backend
+
+        # Meshes on the Geometry Nodes backend follow the sliders through drivers,
+        # unless the settings moved past what the node group can draw.
+        gn_backend.fall_back_if_unsupported(scene, lattices)
+        lattices = [lat for lat in lattices if not lat.get("bd_gn_backend")]
+    if bool(getattr(settings, "interaction_lod", False)):
+        _enter_interaction_lod(settings, lattices, objects)
+
     try:
-        process_lattice_smart_scale(
-            scale_factor=float(settings.scale_factor),
-            shift_factor=float(settings.shift_factor),
-            offset_x=float(getattr(settings, "offset_x", 0.0)),
-            offset_y=float(getattr(settings, "offset_y", 0.0)),
-            offset_z=float(getattr(settings, "offset_z", 0.0)),
-            reset_to_uniform=bool(settings.reset_to_uniform),
-        )
+        deform_with_settings(scene, lattices)
     except Exception as e:
         print(f"BevelDeformer: live update failed: {e}")
         return False
@@ -187,7 +293,11 @@ def schedule_live_update(context) -> None:
     global _live_update_timer_running
     global _live_update_pending
 
+    if _live_update_suppressed:
+        return
+
     _live_update_pending = True
+    live_trace.record_change(context)
     if _live_update_timer_running and _is_timer_registered():
         return
 
@@ -198,168 +308,202 @@ def schedule_live_update(context) -> None:
     _live_update_timer_running = True
 
 
-def reset_selected_lattices_to_uniform() -> int:
-    selected_lattices = _gather_target_lattices(bpy.context.selected_objects)
+@contextmanager
+def suppress_live_update():
+    """Slider writes inside the block do not schedule a Live Preview tick."""
+    global _live_update_suppressed
+    previous = _live_update_suppressed
+    _live_update_suppressed = True
+    try:
+        yield
+    finally:
+        _live_update_suppressed = previous
+
+
+def flush_live_update() -> None:
+    """Run a pending Live Preview tick now instead of waiting for the timer."""
+    global _live_update_pending
+    if _live_update_pending:
+        _live_update_pending = False
+        _apply_live_update()
+
+
+def lattice_resolution(lat_obj) -> tuple[int, int, int]:
+    """(points_u, points_v, points_w) of the lattice."""
+    lat = lat_obj.data
+    return int(lat.points_u), int(lat.points_v), int(lat.points_w)
+
+
+def write_co_deform(lat_obj, co: np.ndarray) -> None:
+    """Write flat points to ``co_deform`` in one ``foreach_set`` and count them for memstats."""
+    # In Edit Mode lattice.points resolves to the edit lattice, so this bulk write
+    # works without leaving Edit Mode and is kept when the user exits it.
+    lat = lat_obj.data
+    lat.points.foreach_set("co_deform", co.ravel())
+    lat.update_tag()
+    memstats.add_points(co.size // 3)
+    influence.mark_dirty(lat_obj)
+
+
+def group_by_signature(lattices) -> dict[tuple[tuple[int, int, int], int], list[bpy.types.Object]]:
+    """Group lattices whose deform result depends on the same (resolution, locked axis)."""
+    groups: dict[tuple[tuple[int, int, int], int], list[bpy.types.Object]] = {}
+    for obj in lattices:
+        locked_enabled, locked_idx = get_lattice_locked_axis(obj)
+        key = (lattice_resolution(obj), int(locked_idx) if locked_enabled and locked_idx is not None else -1)
+        groups.setdefault(key, []).append(obj)
+    return groups
+
+
+def settings_chain(settings) -> tuple[tuple[str, ...], dict[str, float]]:
+    """The scene's stage chain and the values of every parameter it reads."""
+    chain = stages.parse_chain(getattr(settings, "stage_chain", ""))
+    return chain, stages.params_from_settings(settings, chain)
+
+
+def chain_memo_key(chain: tuple[str, ...], params: dict) -> tuple[tuple[str, float], ...]:
+    # Only the parameters the chain reads take part in the memo key.
+    return tuple(
+        (name, params[name])
+        for name in sorted({p for stage in chain for p in stages.STAGES[stage].inputs})
+        if name in params
+    )
+
+
+def reset_selected_lattices_to_uniform(lattices: list[bpy.types.Object] | None = None) -> int:
+    """Put the lattices back to their uniform grid; layer stacks are dropped with it."""
+    from . import layers
+
+    if lattices is None:
+        selected_lattices = gather_target_lattices(bpy.context.selected_objects)
+    else:
+        selected_lattices = list(lattices)
     if not selected_lattices:
         return 0
 
     bpy.context.view_layer.update()
 
     for obj in selected_lattices:
-        lat = obj.data
-        u_res = lat.points_u
-        v_res = lat.points_v
-        w_res = lat.points_w
-
-        def get_idx(u, v, w):
-            return w * (u_res * v_res) + v * u_res + u
-
-        for w in range(w_res):
-            z_pos = -0.5 + (w / (w_res - 1)) if w_res > 1 else 0.0
-            for v in range(v_res):
-                y_pos = -0.5 + (v / (v_res - 1)) if v_res > 1 else 0.0
-                for u in range(u_res):
-                    x_pos = -0.5 + (u / (u_res - 1)) if u_res > 1 else 0.0
-                    idx = get_idx(u, v, w)
-                    lat.points[idx].co_deform = Vector((x_pos, y_pos, z_pos))
+        # Otherwise the next rebuild of the stack would bring the deformation back.
+        layers.flatten(obj)
+        write_co_deform(obj, kernels.uniform_coords(lattice_resolution(obj)))
 
     return len(selected_lattices)
 
 
 def process_lattice_smart_scale(
     *,
+    lattices: list[bpy.types.Object] | None = None,
     scale_factor: float,
     shift_factor: float,
     offset_x: float,
     offset_y: float,
     offset_z: float,
     reset_to_uniform: bool,
+    chain: tuple[str, ...] = stages.DEFAULT_CHAIN,
+    stage_params: dict[str, float] | None = None,
 ) -> int:
-    try:
-        if bpy.context.mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode='OBJECT')
-    except Exception:
-        pass
-
-    selected_lattices = _gather_target_lattices(bpy.context.selected_objects)
+    if lattices is None:
+        selected_lattices = gather_target_lattices(bpy.context.selected_objects)
+    else:
+        selected_lattices = list(lattices)
     if not selected_lattices:
         return 0
 
     bpy.context.view_layer.update()
 
-    for obj in selected_lattices:
-        lat = obj.data
-        u_res = lat.points_u
-        v_res = lat.points_v
-        w_res = lat.points_w
+    params = {
+        "shift_factor": float(shift_factor),
+        "scale_factor": float(scale_factor),
+        "offset_x": float(offset_x),
+        "offset_y": float(offset_y),
+        "offset_z": float(offset_z),
+    }
+    params.update(stage_params or {})
+    chain = tuple(chain)
+    if reset_to_uniform:
+        chain = ("reset",) + chain
+    memo_key = chain_memo_key(chain, params)
+
+    for (resolution, locked_idx), members in group_by_signature(selected_lattices).items():
+        if reset_to_uniform:
+            # Identical for every member: computed once (or reused from the memo) and bulk-written.
+            co = stages.uniform_chain(resolution, locked_idx, chain, memo_key)
+            for obj in members:
+                write_co_deform(obj, co)
+            continue
 
-        def get_idx(u, v, w):
-            return w * (u_res * v_res) + v * u_res + u
+        count = resolution[0] * resolution[1] * resolution[2]
+        current = np.empty((len(members), count * 3), dtype=np.float32)
+        for i, obj in enumerate(members):
+            obj.data.points.foreach_get("co_deform", current[i])
 
-        if reset_to_uniform:
-            for w in range(w_res):
-                z_pos = -0.5 + (w / (w_res - 1)) if w_res > 1 else 0.0
-                for v in range(v_res):
-                    y_pos = -0.5 + (v / (v_res - 1)) if v_res > 1 else 0.0
-                    for u in range(u_res):
-                        x_pos = -0.5 + (u / (u_res - 1)) if u_res > 1 else 0.0
-                        idx = get_idx(u, v, w)
-                        lat.points[idx].co_deform = Vector((x_pos, y_pos, z_pos))
-
-        shifted_u = False
-        shifted_v = False
-        shifted_w = False
-
-        do_shift = abs(float(shift_factor)) > 1e-8
-
-        if do_shift and u_res >= 4:
-            shifted_u = True
-            for w in range(w_res):
-                for v in range(v_res):
-                    coords = [lat.points[get_idx(u, v, w)].co_deform.copy() for u in range(u_res)]
-                    _shift_and_relax_line(coords, float(shift_factor))
-                    for u in range(u_res):
-                        lat.points[get_idx(u, v, w)].co_deform = coords[u]
-
-        if do_shift and v_res >= 4:
-            shifted_v = True
-            for w in range(w_res):
-                for u in range(u_res):
-                    coords = [lat.points[get_idx(u, v, w)].co_deform.copy() for v in range(v_res)]
-                    _shift_and_relax_line(coords, float(shift_factor))
-                    for v in range(v_res):
-                        lat.points[get_idx(u, v, w)].co_deform = coords[v]
-
-        if do_shift and w_res >= 4:
-            shifted_w = True
-            for v in range(v_res):
-                for u in range(u_res):
-                    coords = [lat.points[get_idx(u, v, w)].co_deform.copy() for w in range(w_res)]
-                    _shift_and_relax_line(coords, float(shift_factor))
-                    for w in range(w_res):
-                        lat.points[get_idx(u, v, w)].co_deform = coords[w]
-
-        do_offset = (
-            abs(float(offset_x)) > 1e-8
-            or abs(float(offset_y)) > 1e-8
-            or abs(float(offset_z)) > 1e-8
+        grid = stages.run_chain(
+            kernels.grid_from_flat(current, resolution), chain, params, locked_idx=locked_idx
         )
-        if do_offset:
-            locked_enabled, locked_idx = _get_lattice_locked_axis(obj)
-            fx = [_offset_ramp_factor(i, u_res) for i in range(u_res)]
-            fy = [_offset_ramp_factor(i, v_res) for i in range(v_res)]
-            fz = [_offset_ramp_factor(i, w_res) for i in range(w_res)]
-
-            for w in range(w_res):
-                dz = float(offset_z) * float(fz[w])
-                for v in range(v_res):
-                    dy = float(offset_y) * float(fy[v])
-                    for u in range(u_res):
-                        dx = float(offset_x) * float(fx[u])
-
-                        if locked_enabled and locked_idx is not None:
-                            if locked_idx == 0:
-                                dx = 0.0
-                            elif locked_idx == 1:
-                                dy = 0.0
-                            elif locked_idx == 2:
-                                dz = 0.0
-
-                        idx = get_idx(u, v, w)
-                        p = lat.points[idx].co_deform
-                        lat.points[idx].co_deform = Vector((p[0] + dx, p[1] + dy, p[2] + dz))
-
-        scale_u = scale_factor if shifted_u else 1.0
-        scale_v = scale_factor if shifted_v else 1.0
-        scale_w = scale_factor if shifted_w else 1.0
-
-        if scale_u != 1.0 or scale_v != 1.0 or scale_w != 1.0:
-            for point in lat.points:
-                point.co_deform[0] *= scale_u
-                point.co_deform[1] *= scale_v
-                point.co_deform[2] *= scale_w
+        result = grid.reshape(len(members), -1).astype(np.float32)
+        for i, obj in enumerate(members):
+            write_co_deform(obj, result[i])
 
     return len(selected_lattices)
 
 
+def deform_with_settings(scene, lattices: list[bpy.types.Object]) -> int:
+    """Deform with the scene's sliders, into the named layer when Deform Into Layer is on.
+
+    Lattices that already have a layer stack always take the sliders as a layer:
+    writing their points directly would be lost on the next rebuild. Raises
+    ValueError when the layer holds captured edits.
+    """
+    settings = scene.bd_deform_settings
+    chain, stage_params = settings_chain(settings)
+    values = {
+        "scale_factor": float(settings.scale_factor),
+        "shift_factor": float(settings.shift_factor),
+        "offset_x": float(getattr(settings, "offset_x", 0.0)),
+        "offset_y": float(getattr(settings, "offset_y", 0.0)),
+        "offset_z": float(getattr(settings, "offset_z", 0.0)),
+    }
+
+    from . import layers
+
+    layer_settings = getattr(scene, "bd_layer_settings", None)
+    if layer_settings is not None and layer_settings.deform_into_layer:
+        layered, plain = list(lattices), []
+    else:
+        stacked = [layers.has_layers(lat) for lat in lattices]
+        layered = [lat for lat, has in zip(lattices, stacked) if has]
+        plain = [lat for lat, has in zip(lattices, stacked) if not has]
+
+    count = 0
+    if layered:
+        count += layers.deform_into_layer(layered, layers.target_layer(scene), chain, {**values, **stage_params})
+    if plain:
+        count += process_lattice_smart_scale(
+            lattices=plain,
+            reset_to_uniform=bool(settings.reset_to_uniform),
+            chain=chain,
+            stage_params=stage_params,
+            **values,
+        )
+    return count
+
+
 class BD_OT_deform_selected_lattices(Operator):
     bl_idname = "bd.deform_selected_lattices"
     bl_label = "Deform Selected Lattices"
     bl_options = {"REGISTER", "UNDO"}
 
+    @memstats.tracked
     def execute(self, context):
-        settings = context.scene.bd_deform_settings
-        count = process_lattice_smart_scale(
-            scale_factor=float(settings.scale_factor),
-            shift_factor=float(settings.shift_factor),
-            offset_x=float(getattr(settings, "offset_x", 0.0)),
-            offset_y=float(getattr(settings, "offset_y", 0.0)),
-            offset_z=float(getattr(settings, "offset_z", 0.0)),
-            reset_to_uniform=bool(settings.reset_to_uniform),
-        )
+        try:
+            count = deform_with_settings(context.scene, gather_target_lattices(scope.scope_objects(context)))
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
 
         if count == 0:
-            self.report({'WARNING'}, "No lattices found for selected objects")
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
             return {'CANCELLED'}
 
         self.report({'INFO'}, f"Processed {count} lattice(s)")
@@ -371,8 +515,9 @@ class BD_OT_reset_selected_lattices(Operator):
     bl_label = "Reset Selected Lattices"
     bl_options = {"REGISTER", "UNDO"}
 
+    @memstats.tracked
     def execute(self, context):
-        count = reset_selected_lattices_to_uniform()
+        count = reset_selected_lattices_to_uniform(gather_target_lattices(scope.scope_objects(context)))
 
         try:
             settings = context.scene.bd_deform_settings
@@ -384,11 +529,14 @@ class BD_OT_reset_selected_lattices(Operator):
                 settings.offset_y = 0.0
             if hasattr(settings, "offset_z"):
                 settings.offset_z = 0.0
+            for name in ("taper_factor", "twist_angle", "bend_angle"):
+                if hasattr(settings, name):
+                    setattr(settings, name, 0.0)
         except Exception as e:
             print(f"BevelDeformer: failed to reset UI sliders: {e}")
 
         if count == 0:
-            self.report({'WARNING'}, "No lattices found for selected objects (sliders reset)")
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)} (sliders reset)")
             return {'CANCELLED'}
 
         self.report({'INFO'}, f"Reset {count} lattice(s) to uniform")
@@ -405,7 +553,24 @@ def register() -> None:
     for cls in _classes:
         bpy.utils.register_class(cls)
 
+    bpy.app.handlers.save_pre.append(_restore_lod_before_save)
+    bpy.app.handlers.load_pre.append(_discard_lod_on_load)
+
 
 def unregister() -> None:
+    for handlers, handler in (
+        (bpy.app.handlers.save_pre, _restore_lod_before_save),
+        (bpy.app.handlers.load_pre, _discard_lod_on_load),
+    ):
+        if handler in handlers:
+            handlers.remove(handler)
+
+    try:
+        if bpy.app.timers.is_registered(_lod_settle_timer):
+            bpy.app.timers.unregister(_lod_settle_timer)
+    except Exception:
+        pass
+    restore_interaction_lod()
+
     for cls in reversed(_classes):
         bpy.utils.unregister_class(cls)
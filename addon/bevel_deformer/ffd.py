@@ -0,0 +1,274 @@
+import numpy as np
+
+
+INTERPOLATION_TYPES = ("KEY_LINEAR", "KEY_CARDINAL", "KEY_CATMULL_ROM", "KEY_BSPLINE")
+DEFAULT_CHUNK_SIZE = 65536
+
+# Tension used by Blender's key_curve_position_weights() for the cardinal types.
+_CARDINAL_TENSION = {
+    "KEY_CARDINAL": 0.71,
+    "KEY_CATMULL_ROM": 0.5,
+}
+
+
+def _axis_rest(count: int) -> np.ndarray:
+    if count > 1:
+        return -0.5 + np.arange(count, dtype=np.float64) / (count - 1)
+    return np.zeros(1, dtype=np.float64)
+
+
+def rest_coords(u_res: int, v_res: int, w_res: int) -> np.ndarray:
+    """Undeformed lattice point positions in lattice space, U varying fastest (N, 3)."""
+    w, v, u = np.meshgrid(_axis_rest(w_res), _axis_rest(v_res), _axis_rest(u_res), indexing="ij")
+    return np.stack((u, v, w), axis=-1).reshape(-1, 3)
+
+
+def position_weights(t: np.ndarray, interpolation: str) -> np.ndarray:
+    """Per-sample weights of the 4 neighbouring points (i-1, i, i+1, i+2), shape (n, 4)."""
+    t = np.asarray(t, dtype=np.float64)
+    out = np.empty(t.shape + (4,), dtype=np.float64)
+
+    if interpolation == "KEY_LINEAR":
+        out[..., 0] = 0.0
+        out[..., 1] = 1.0 - t
+        out[..., 2] = t
+        out[..., 3] = 0.0
+        return out
+
+    t2 = t * t
+    t3 = t2 * t
+    if interpolation == "KEY_BSPLINE":
+        out[..., 0] = -t3 / 6.0 + 0.5 * t2 - 0.5 * t + 1.0 / 6.0
+        out[..., 1] = 0.5 * t3 - t2 + 2.0 / 3.0
+        out[..., 2] = -0.5 * t3 + 0.5 * t2 + 0.5 * t + 1.0 / 6.0
+        out[..., 3] = t3 / 6.0
+        return out
+
+    fc = _CARDINAL_TENSION.get(interpolation)
+    if fc is None:
+        raise ValueError(f"Unsupported lattice interpolation: {interpolation}")
+    out[..., 0] = -fc * t3 + 2.0 * fc * t2 - fc * t
+    out[..., 1] = (2.0 - fc) * t3 + (fc - 3.0) * t2 + 1.0
+    out[..., 2] = (fc - 2.0) * t3 + (3.0 - 2.0 * fc) * t2 + fc * t
+    out[..., 3] = fc * t3 - fc * t2
+    return out
+
+
+def _axis_taps(coord: np.ndarray, count: int, interpolation: str) -> tuple[np.ndarray, np.ndarray]:
+    if count <= 1:
+        weights = np.zeros(coord.shape + (4,), dtype=np.float64)
+        weights[..., 1] = 1.0
+        return weights, np.zeros(coord.shape + (4,), dtype=np.intp)
+
+    pos = (coord + 0.5) * (count - 1)
+    base = np.floor(pos)
+    weights = position_weights(pos - base, interpolation)
+    # Neighbours outside the grid reuse the boundary point, as Blender does.
+    index = base.astype(np.intp)[..., None] + np.arange(-1, 3, dtype=np.intp)
+    np.clip(index, 0, count - 1, out=index)
+    return weights, index
+
+
+def _normalize_interpolation(interpolation) -> tuple[str, str, str]:
+    if isinstance(interpolation, str):
+        return interpolation, interpolation, interpolation
+    u, v, w = interpolation
+    return str(u), str(v), str(w)
+
+
+def iter_deformed_chunks(
+    co: np.ndarray,
+    deform: np.ndarray,
+    resolution: tuple[int, int, int],
+    interpolation,
+    *,
+    matrix: np.ndarray | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Yield ``(start, stop, deformed)`` for consecutive chunks of ``co``.
+
+    ``co`` is an (N, 3) array of positions and ``deform`` the lattice ``co_deform``
+    array (U fastest). ``matrix`` maps ``co`` into lattice space; without it ``co``
+    is assumed to already be in lattice space. Results are returned in the space
+    of ``co``. Working memory is bounded by ``chunk_size``.
+    """
+    u_res, v_res, w_res = (int(r) for r in resolution)
+    interp_u, interp_v, interp_w = _normalize_interpolation(interpolation)
+
+    co = np.asarray(co).reshape(-1, 3)
+    deform = np.asarray(deform, dtype=np.float64).reshape(-1, 3)
+    if deform.shape[0] != u_res * v_res * w_res:
+        raise ValueError(
+            f"Lattice point count {deform.shape[0]} does not match resolution {u_res}x{v_res}x{w_res}"
+        )
+    displacement = deform - rest_coords(u_res, v_res, w_res)
+
+    to_lattice = None
+    from_lattice = None
+    if matrix is not None:
+        to_lattice = np.asarray(matrix, dtype=np.float64).reshape(4, 4)
+        from_lattice = np.linalg.inv(to_lattice)[:3, :3]
+        # Blender stores lattice offsets already mapped back into the deformed object's space.
+        displacement = displacement @ from_lattice.T
+
+    # Linear interpolation gives zero weight to the outer taps, so skip them.
+    taps = [
+        (1, 2) if interp == "KEY_LINEAR" or count <= 1 else (0, 1, 2, 3)
+        for interp, count in ((interp_u, u_res), (interp_v, v_res), (interp_w, w_res))
+    ]
+    stride_v = u_res
+    stride_w = u_res * v_res
+    step = max(1, int(chunk_size))
+
+    for start in range(0, co.shape[0], step):
+        stop = min(start + step, co.shape[0])
+        chunk = co[start:stop].astype(np.float64)
+        if to_lattice is not None:
+            local = chunk @ to_lattice[:3, :3].T + to_lattice[:3, 3]
+        else:
+            local = chunk
+
+        wu, iu = _axis_taps(local[:, 0], u_res, interp_u)
+        wv, iv = _axis_taps(local[:, 1], v_res, interp_v)
+        ww, iw = _axis_taps(local[:, 2], w_res, interp_w)
+
+        offset = np.zeros_like(chunk)
+        for c in taps[2]:
+            w_weight = ww[:, c]
+            w_index = iw[:, c] * stride_w
+            for b in taps[1]:
+                vw_weight = wv[:, b] * w_weight
+                vw_index = iv[:, b] * stride_v + w_index
+                for a in taps[0]:
+                    weight = wu[:, a] * vw_weight
+                    offset += weight[:, None] * displacement[iu[:, a] + vw_index]
+
+        yield start, stop, chunk + offset
+
+
+def deform_points(
+    co: np.ndarray,
+    deform: np.ndarray,
+    resolution: tuple[int, int, int],
+    interpolation,
+    *,
+    matrix: np.ndarray | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Evaluate the lattice deformation for every position in ``co``."""
+    co = np.asarray(co).reshape(-1, 3)
+    if out is None:
+        out = np.empty(co.shape, dtype=co.dtype if co.dtype.kind == "f" else np.float64)
+    for start, stop, chunk in iter_deformed_chunks(
+        co, deform, resolution, interpolation, matrix=matrix, chunk_size=chunk_size
+    ):
+        out[start:stop] = chunk
+    return out
+
+
+def read_lattice(lat_obj) -> tuple[np.ndarray, tuple[int, int, int], tuple[str, str, str]]:
+    lat = lat_obj.data
+    resolution = (int(lat.points_u), int(lat.points_v), int(lat.points_w))
+    deform = np.empty(len(lat.points) * 3, dtype=np.float32)
+    lat.points.foreach_get("co_deform", deform)
+    interpolation = (
+        str(lat.interpolation_type_u),
+        str(lat.interpolation_type_v),
+        str(lat.interpolation_type_w),
+    )
+    return deform.reshape(-1, 3), resolution, interpolation
+
+
+def read_mesh_coords(mesh_obj) -> np.ndarray:
+    vertices = mesh_obj.data.vertices
+    co = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def lattice_space_matrix(mesh_obj, lat_obj) -> np.ndarray:
+    """Matrix taking mesh-local coordinates into the lattice's object space."""
+    return np.array(lat_obj.matrix_world.inverted() @ mesh_obj.matrix_world, dtype=np.float64)
+
+
+def deform_mesh_coords(mesh_obj, lat_obj, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    """Mesh-local vertex positions of ``mesh_obj`` after ``lat_obj`` deforms them."""
+    deform, resolution, interpolation = read_lattice(lat_obj)
+    return deform_points(
+        read_mesh_coords(mesh_obj),
+        deform,
+        resolution,
+        interpolation,
+        matrix=lattice_space_matrix(mesh_obj, lat_obj),
+        chunk_size=chunk_size,
+    )
+
+
+def displacement_stats(mesh_obj, lat_obj, *, chunk_size: int = DEFAULT_CHUNK_SIZE, eps: float = 1e-6) -> dict:
+    """Max/mean vertex displacement (mesh-local units) without touching the modifier stack."""
+    deform, resolution, interpolation = read_lattice(lat_obj)
+    co = read_mesh_coords(mesh_obj)
+
+    total = 0.0
+    peak = 0.0
+    moved = 0
+    for start, stop, chunk in iter_deformed_chunks(
+        co,
+        deform,
+        resolution,
+        interpolation,
+        matrix=lattice_space_matrix(mesh_obj, lat_obj),
+        chunk_size=chunk_size,
+    ):
+        length = np.linalg.norm(chunk - co[start:stop], axis=1)
+        total += float(length.sum())
+        if length.size:
+            peak = max(peak, float(length.max()))
+        moved += int(np.count_nonzero(length > eps))
+
+    count = int(co.shape[0])
+    return {
+        "vertices": count,
+        "moved": moved,
+        "max": peak,
+        "mean": total / count if count else 0.0,
+    }
+
+
+def can_bake_directly(mesh_obj, mod) -> bool:
+    """True when ``mod`` can be baked by the evaluator with the same result as modifier_apply."""
+    try:
+        lat_obj = mod.object
+        if mod.type != 'LATTICE' or lat_obj is None or lat_obj.type != 'LATTICE':
+            return False
+        if len(mesh_obj.modifiers) == 0 or mesh_obj.modifiers[0] != mod:
+            return False
+        if mod.vertex_group or abs(float(mod.strength) - 1.0) > 1e-8:
+            return False
+        # modifier_apply skips modifiers hidden in the viewport.
+        if not mod.show_viewport:
+            return False
+        mesh = mesh_obj.data
+        if mesh.shape_keys is not None or mesh.users != 1:
+            return False
+        # Linked and overridden meshes cannot take new vertex positions.
+        if mesh.library is not None or mesh.override_library is not None:
+            return False
+        lat = lat_obj.data
+        if lat.shape_keys is not None or bool(getattr(lat, "use_outside", False)):
+            return False
+        return all(
+            interp in INTERPOLATION_TYPES
+            for interp in (lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w)
+        )
+    except Exception:
+        return False
+
+
+def bake_mesh(mesh_obj, lat_obj, *, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Write the lattice-deformed positions into the mesh vertices (modifier left in place)."""
+    co = deform_mesh_coords(mesh_obj, lat_obj, chunk_size=chunk_size)
+    mesh = mesh_obj.data
+    mesh.vertices.foreach_set("co", co.astype(np.float32, copy=False).ravel())
+    mesh.update()
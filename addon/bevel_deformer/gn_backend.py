@@ -0,0 +1,663 @@
+import bpy
+import numpy as np
+from bpy.types import Operator
+
+from . import ffd, kernels, layers, scope, stages
+from .deform_ops import gather_target_lattices, get_lattice_locked_axis, lattice_resolution, write_co_deform
+
+
+# With Reset To Uniform and the default chain (linear profiles) the deformed lattice
+# is separable: along each axis its points follow a piecewise-linear function of the
+# point index with knots at 0, 1, n-2 and n-1. The generated node group evaluates
+# that function and the lattice interpolation weights per vertex; axis_map() is its
+# NumPy mirror.
+
+MODIFIER_NAME = "BD_GeometryNodes"
+GROUP_PREFIX = "BD Bevel Deform"
+_GROUP_VERSION = 1
+
+_SHIFT_EPS = 1e-8
+_POINT_TOLERANCE = 1e-5
+
+# Modifier input -> scene deform setting (and component) it is driven by.
+_DRIVEN_INPUTS = (
+    ("Shift", "shift_factor", None),
+    ("Scale", "scale_factor", None),
+    ("Offset", "offset_x", 0),
+    ("Offset", "offset_y", 1),
+    ("Offset", "offset_z", 2),
+)
+
+
+def unsupported_reason(settings) -> str | None:
+    """Why the node group cannot reproduce the current deform settings, or None."""
+    if not bool(settings.reset_to_uniform):
+        return "Reset To Uniform must be enabled"
+    if stages.parse_chain(getattr(settings, "stage_chain", "")) != stages.DEFAULT_CHAIN:
+        return "Stage chain must be 'shift, offset, scale'"
+    profiles = (getattr(settings, "relax_profile", "LINEAR"), getattr(settings, "offset_falloff", "LINEAR"))
+    if profiles != ("LINEAR", "LINEAR"):
+        return "Relax Profile and Offset Falloff must be Linear"
+    return None
+
+
+def slider_points(lat_obj, settings) -> np.ndarray:
+    """(N, 3) float32 lattice points the node group reproduces for the current sliders."""
+    chain, params = ("reset",) + stages.DEFAULT_CHAIN, stages.params_from_settings(settings, stages.DEFAULT_CHAIN)
+    _enabled, locked_idx = get_lattice_locked_axis(lat_obj)
+    return stages.uniform_chain(
+        lattice_resolution(lat_obj), -1 if locked_idx is None else int(locked_idx), chain, tuple(sorted(params.items()))
+    )
+
+
+def lattice_unsupported_reason(lat_obj, settings) -> str | None:
+    """Why the node group would not show what ``lat_obj`` holds, or None.
+
+    The node group only knows the sliders: a layer stack, hand edits or randomized
+    points on the lattice would be lost. A lattice still on its uniform grid is fine.
+    """
+    if layers.has_layers(lat_obj):
+        return "it has deform layers"
+    current, resolution, _interpolation = ffd.read_lattice(lat_obj)
+    for expected in (kernels.uniform_coords(resolution), slider_points(lat_obj, settings)):
+        if np.allclose(current, expected, rtol=0.0, atol=_POINT_TOLERANCE):
+            return None
+    return "its points differ from the sliders (edited or randomized)"
+
+
+def weight_coefficients(interpolation: str) -> np.ndarray:
+    """Polynomial coefficients (tap, power) of ``ffd.position_weights`` for taps i-1..i+2."""
+    samples = np.array([0.0, 1.0 / 3.0, 2.0 / 3.0, 1.0])
+    weights = ffd.position_weights(samples, interpolation)
+    return np.round(np.polynomial.polynomial.polyfit(samples, weights, 3).T, 12)
+
+
+def _safe_div(a, b):
+    # Same as the Math node: division by zero gives 0.
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+    out = np.zeros(a.shape)
+    np.divide(a, b, out=out, where=b != 0.0)
+    return out
+
+
+def knot_displacements(n, shift, scale, offset) -> tuple:
+    """Displacement of points 0, 1, n-2 and n-1 along one axis after shift → offset → scale."""
+    n = np.asarray(n, dtype=np.float64)
+    active = n >= 4.0
+    h = _safe_div(1.0, n - 1.0)
+    sf = np.where(active, shift, 0.0)
+    off = np.where(active, offset, 0.0)
+    s = np.where(active & (np.abs(sf) > _SHIFT_EPS), scale, 1.0)
+    # With 4 points a negative shift also drags the last anchor (see kernels._shift_axis).
+    extra = np.where((sf < 0.0) & (n == 4.0), sf * sf * h, 0.0)
+
+    r1 = -0.5 + h
+    r2 = 0.5 - h
+    d0 = (s - 1.0) * -0.5
+    d1 = s * (r1 - sf * h) - r1
+    d2 = s * (r2 + sf * h + extra + off) - r2
+    d3 = s * (0.5 + off) - 0.5
+    return d0, d1, d2, d3
+
+
+def _displacement_at(j, n, knots):
+    d0, d1, d2, d3 = knots
+    return (
+        d0
+        + (d1 - d0) * np.clip(j, 0.0, 1.0)
+        + (d2 - d1) * np.clip(_safe_div(j - 1.0, n - 3.0), 0.0, 1.0)
+        + (d3 - d2) * np.clip(j - (n - 2.0), 0.0, 1.0)
+    )
+
+
+def axis_map(t, n, shift, scale, offset, interpolation: str) -> np.ndarray:
+    """Deformed lattice-space coordinate along one axis (NumPy mirror of the axis node group)."""
+    t = np.asarray(t, dtype=np.float64)
+    n = float(n)
+    knots = knot_displacements(n, shift, scale, offset)
+    pos = (t + 0.5) * (n - 1.0)
+    base = np.floor(pos)
+    f = pos - base
+    out = t.copy()
+    for tap, coeffs in enumerate(weight_coefficients(interpolation)):
+        if not np.any(coeffs):
+            continue
+        j = np.clip(base + (tap - 1), 0.0, max(n - 1.0, 0.0))
+        weight = coeffs[0] + f * (coeffs[1] + f * (coeffs[2] + f * coeffs[3]))
+        out += weight * _displacement_at(j, n, knots)
+    return out
+
+
+# -- node group generation --------------------------------------------------------
+
+
+class _Builder:
+    def __init__(self, tree):
+        self.tree = tree
+        self.count = 0
+
+    def node(self, bl_idname: str, **props):
+        node = self.tree.nodes.new(bl_idname)
+        # Plain column layout; the groups are generated, not hand-edited.
+        node.location = (200.0 * (self.count // 12), -160.0 * (self.count % 12))
+        self.count += 1
+        for key, value in props.items():
+            setattr(node, key, value)
+        return node
+
+    def feed(self, node, index, value) -> None:
+        if isinstance(value, (int, float)):
+            node.inputs[index].default_value = float(value)
+        else:
+            self.tree.links.new(value, node.inputs[index])
+
+    def math(self, operation: str, a, b=0.0, c=0.0, *, clamp: bool = False):
+        node = self.node('ShaderNodeMath', operation=operation, use_clamp=clamp)
+        for index, value in enumerate((a, b, c)):
+            self.feed(node, index, value)
+        return node.outputs[0]
+
+    def clamp01(self, value):
+        return self.math('ADD', value, 0.0, clamp=True)
+
+
+def _new_group(name: str, inputs, outputs):
+    group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    for socket_name, socket_type, default in inputs:
+        socket = group.interface.new_socket(name=socket_name, in_out='INPUT', socket_type=socket_type)
+        if default is not None:
+            socket.default_value = default
+    for socket_name, socket_type in outputs:
+        group.interface.new_socket(name=socket_name, in_out='OUTPUT', socket_type=socket_type)
+    group["bd_gn_version"] = _GROUP_VERSION
+    return group
+
+
+def _build_axis_group(name: str, interpolation: str):
+    group = _new_group(
+        name,
+        (
+            ("T", 'NodeSocketFloat', 0.0),
+            ("N", 'NodeSocketFloat', 2.0),
+            ("Shift", 'NodeSocketFloat', 0.0),
+            ("Scale", 'NodeSocketFloat', 1.0),
+            ("Offset", 'NodeSocketFloat', 0.0),
+        ),
+        (("T", 'NodeSocketFloat'),),
+    )
+    b = _Builder(group)
+    gin = b.node('NodeGroupInput').outputs
+    gout = b.node('NodeGroupOutput')
+    t, n = gin["T"], gin["N"]
+
+    # knot_displacements()
+    active = b.math('GREATER_THAN', n, 3.5)
+    h = b.math('DIVIDE', 1.0, b.math('SUBTRACT', n, 1.0))
+    sf = b.math('MULTIPLY', gin["Shift"], active)
+    off = b.math('MULTIPLY', gin["Offset"], active)
+    shifted = b.math('GREATER_THAN', b.math('ABSOLUTE', sf), _SHIFT_EPS)
+    s = b.math('MULTIPLY_ADD', b.math('SUBTRACT', gin["Scale"], 1.0), shifted, 1.0)
+    quirk = b.math('MULTIPLY', b.math('LESS_THAN', sf, 0.0), b.math('COMPARE', n, 4.0, 0.5))
+    extra = b.math('MULTIPLY', quirk, b.math('MULTIPLY', b.math('MULTIPLY', sf, sf), h))
+
+    r1 = b.math('ADD', -0.5, h)
+    r2 = b.math('SUBTRACT', 0.5, h)
+    sfh = b.math('MULTIPLY', sf, h)
+    d0 = b.math('MULTIPLY', b.math('SUBTRACT', s, 1.0), -0.5)
+    d1 = b.math('SUBTRACT', b.math('MULTIPLY', s, b.math('SUBTRACT', r1, sfh)), r1)
+    d2_inner = b.math('ADD', b.math('ADD', r2, sfh), b.math('ADD', extra, off))
+    d2 = b.math('SUBTRACT', b.math('MULTIPLY', s, d2_inner), r2)
+    d3 = b.math('SUBTRACT', b.math('MULTIPLY', s, b.math('ADD', 0.5, off)), 0.5)
+    delta01 = b.math('SUBTRACT', d1, d0)
+    delta12 = b.math('SUBTRACT', d2, d1)
+    delta23 = b.math('SUBTRACT', d3, d2)
+    n_minus_3 = b.math('SUBTRACT', n, 3.0)
+    n_minus_2 = b.math('SUBTRACT', n, 2.0)
+    last = b.math('MAXIMUM', b.math('SUBTRACT', n, 1.0), 0.0)
+
+    # Lattice interpolation along the axis.
+    pos = b.math('MULTIPLY', b.math('ADD', t, 0.5), b.math('SUBTRACT', n, 1.0))
+    base = b.math('FLOOR', pos)
+    f = b.math('SUBTRACT', pos, base)
+
+    total = t
+    for tap, coeffs in enumerate(weight_coefficients(interpolation)):
+        if not np.any(coeffs):
+            continue
+        j = b.math('MINIMUM', b.math('MAXIMUM', b.math('ADD', base, float(tap - 1)), 0.0), last)
+        disp = b.math('MULTIPLY_ADD', delta01, b.clamp01(j), d0)
+        disp = b.math('MULTIPLY_ADD', delta12, b.math('DIVIDE', b.math('SUBTRACT', j, 1.0), n_minus_3, clamp=True), disp)
+        disp = b.math('MULTIPLY_ADD', delta23, b.clamp01(b.math('SUBTRACT', j, n_minus_2)), disp)
+
+        weight = float(coeffs[3])
+        for power in (2, 1, 0):
+            weight = b.math('MULTIPLY_ADD', weight, f, float(coeffs[power]))
+        total = b.math('MULTIPLY_ADD', weight, disp, total)
+
+    group.links.new(total, gout.inputs["T"])
+    return group
+
+
+def _build_main_group(name: str, axis_group):
+    group = _new_group(
+        name,
+        (
+            ("Geometry", 'NodeSocketGeometry', None),
+            ("Lattice", 'NodeSocketObject', None),
+            ("Shift", 'NodeSocketFloat', 0.0),
+            ("Scale", 'NodeSocketFloat', 1.0),
+            ("Offset", 'NodeSocketVector', (0.0, 0.0, 0.0)),
+            ("Resolution", 'NodeSocketVector', (2.0, 2.0, 2.0)),
+            ("Locked Axis", 'NodeSocketInt', -1),
+        ),
+        (("Geometry", 'NodeSocketGeometry'),),
+    )
+    b = _Builder(group)
+    gin = b.node('NodeGroupInput').outputs
+    gout = b.node('NodeGroupOutput')
+
+    # Lattice transform relative to the modified object, so moving the cage is followed natively.
+    info = b.node('GeometryNodeObjectInfo', transform_space='RELATIVE')
+    group.links.new(gin["Lattice"], info.inputs["Object"])
+    invert = b.node('FunctionNodeInvertMatrix')
+    group.links.new(info.outputs["Transform"], invert.inputs["Matrix"])
+
+    to_lattice = b.node('FunctionNodeTransformPoint')
+    group.links.new(b.node('GeometryNodeInputPosition').outputs["Position"], to_lattice.inputs["Vector"])
+    group.links.new(invert.outputs["Matrix"], to_lattice.inputs["Transform"])
+
+    split = b.node('ShaderNodeSeparateXYZ')
+    group.links.new(to_lattice.outputs["Vector"], split.inputs[0])
+    resolution = b.node('ShaderNodeSeparateXYZ')
+    group.links.new(gin["Resolution"], resolution.inputs[0])
+    offset = b.node('ShaderNodeSeparateXYZ')
+    group.links.new(gin["Offset"], offset.inputs[0])
+    join = b.node('ShaderNodeCombineXYZ')
+
+    for axis in range(3):
+        # No offset along the locked axis.
+        unlocked = b.math('SUBTRACT', 1.0, b.math('COMPARE', gin["Locked Axis"], float(axis), 0.5))
+        call = b.node('GeometryNodeGroup', node_tree=axis_group)
+        group.links.new(split.outputs[axis], call.inputs["T"])
+        group.links.new(resolution.outputs[axis], call.inputs["N"])
+        group.links.new(gin["Shift"], call.inputs["Shift"])
+        group.links.new(gin["Scale"], call.inputs["Scale"])
+        group.links.new(b.math('MULTIPLY', offset.outputs[axis], unlocked), call.inputs["Offset"])
+        group.links.new(call.outputs["T"], join.inputs[axis])
+
+    to_object = b.node('FunctionNodeTransformPoint')
+    group.links.new(join.outputs[0], to_object.inputs["Vector"])
+    group.links.new(info.outputs["Transform"], to_object.inputs["Transform"])
+
+    set_position = b.node('GeometryNodeSetPosition')
+    group.links.new(gin["Geometry"], set_position.inputs["Geometry"])
+    group.links.new(to_object.outputs["Vector"], set_position.inputs["Position"])
+    group.links.new(set_position.outputs["Geometry"], gout.inputs["Geometry"])
+    return group
+
+
+def ensure_node_group(interpolation: str):
+    """The generated group for ``interpolation``, rebuilt when missing or outdated."""
+    name = f"{GROUP_PREFIX} ({interpolation})"
+    axis_name = f"{GROUP_PREFIX} Axis ({interpolation})"
+
+    group = bpy.data.node_groups.get(name)
+    axis_group = bpy.data.node_groups.get(axis_name)
+    if group is not None and axis_group is not None and group.get("bd_gn_version") == _GROUP_VERSION:
+        return group
+
+    for stale in (group, axis_group):
+        if stale is not None:
+            bpy.data.node_groups.remove(stale)
+    return _build_main_group(name, _build_axis_group(axis_name, interpolation))
+
+
+# -- modifiers and drivers ---------------------------------------------------------
+
+
+def _socket_identifiers(group) -> dict[str, str]:
+    return {
+        item.name: item.identifier
+        for item in group.interface.items_tree
+        if getattr(item, "item_type", None) == 'SOCKET' and item.in_out == 'INPUT'
+    }
+
+
+def _lattice_modifier(mesh_obj, lat_obj):
+    for mod in mesh_obj.modifiers:
+        if mod.type == 'LATTICE' and mod.object == lat_obj:
+            return mod
+    return None
+
+
+def _drive_input(mesh_obj, mod, identifier: str, index, scene, setting: str) -> None:
+    path = f'modifiers["{mod.name}"]["{identifier}"]'
+    fcurve = mesh_obj.driver_add(path) if index is None else mesh_obj.driver_add(path, index)
+    driver = fcurve.driver
+    # A single-property average is evaluated natively, without Python.
+    driver.type = 'AVERAGE'
+    for var in list(driver.variables):
+        driver.variables.remove(var)
+    var = driver.variables.new()
+    var.name = "value"
+    var.type = 'SINGLE_PROP'
+    var.targets[0].id_type = 'SCENE'
+    var.targets[0].id = scene
+    var.targets[0].data_path = f"bd_deform_settings.{setting}"
+
+
+def _clear_drivers(mesh_obj, mod) -> None:
+    if mod.node_group is None:
+        return
+    identifiers = _socket_identifiers(mod.node_group)
+    for socket_name, _setting, index in _DRIVEN_INPUTS:
+        path = f'modifiers["{mod.name}"]["{identifiers[socket_name]}"]'
+        try:
+            if index is None:
+                mesh_obj.driver_remove(path)
+            else:
+                mesh_obj.driver_remove(path, index)
+        except Exception:
+            pass
+
+
+def enable_gn_backend(mesh_obj, lat_obj, scene):
+    """Deform ``mesh_obj`` with the generated node group instead of its lattice modifier.
+
+    The lattice modifier is kept but hidden, so the backend can be switched back.
+    """
+    lat_mod = _lattice_modifier(mesh_obj, lat_obj)
+    if lat_mod is None:
+        raise ValueError(f"{mesh_obj.name} has no lattice modifier for {lat_obj.name}")
+    if lat_mod.vertex_group or abs(float(lat_mod.strength) - 1.0) > 1e-8:
+        raise ValueError("vertex group or strength on the lattice modifier is not supported")
+
+    lat = lat_obj.data
+    interpolation = {lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w}
+    if len(interpolation) != 1:
+        raise ValueError("mixed per-axis interpolation is not supported")
+
+    group = ensure_node_group(interpolation.pop())
+    mod = mesh_obj.modifiers.get(MODIFIER_NAME)
+    if mod is None:
+        mod = mesh_obj.modifiers.new(name=MODIFIER_NAME, type='NODES')
+    else:
+        _clear_drivers(mesh_obj, mod)
+    mod.node_group = group
+
+    modifiers = list(mesh_obj.modifiers)
+    target = modifiers.index(lat_mod)
+    current = modifiers.index(mod)
+    if current != target + 1:
+        mesh_obj.modifiers.move(current, target + 1 if current > target else target)
+
+    identifiers = _socket_identifiers(group)
+    _enabled, locked_idx = get_lattice_locked_axis(lat_obj)
+    mod[identifiers["Lattice"]] = lat_obj
+    mod[identifiers["Resolution"]] = [float(lat.points_u), float(lat.points_v), float(lat.points_w)]
+    mod[identifiers["Locked Axis"]] = int(locked_idx) if locked_idx is not None else -1
+    for socket_name, setting, index in _DRIVEN_INPUTS:
+        _drive_input(mesh_obj, mod, identifiers[socket_name], index, scene, setting)
+
+    lat_mod.show_viewport = False
+    lat_mod.show_render = False
+    lat_obj["bd_gn_backend"] = True
+    mesh_obj.update_tag()
+    return mod
+
+
+def sync_lattice_inputs(lat_obj) -> int:
+    """Copy the lattice's resolution and locked axis into the node modifiers using it.
+
+    Unlike the deform settings these inputs are not driven, so everything that
+    resizes a lattice (Change Resolution, cage import) calls this. Returns the
+    number of modifiers updated.
+    """
+    if not lat_obj.get("bd_gn_backend"):
+        return 0
+    lat = lat_obj.data
+    _enabled, locked_idx = get_lattice_locked_axis(lat_obj)
+    updated = 0
+    for mesh_obj in scope.lattice_users([lat_obj]).get(lat_obj, ()):
+        mod = mesh_obj.modifiers.get(MODIFIER_NAME)
+        if mod is None or mod.node_group is None:
+            continue
+        identifiers = _socket_identifiers(mod.node_group)
+        if mod.get(identifiers["Lattice"]) != lat_obj:
+            continue
+        mod[identifiers["Resolution"]] = [float(lat.points_u), float(lat.points_v), float(lat.points_w)]
+        mod[identifiers["Locked Axis"]] = int(locked_idx) if locked_idx is not None else -1
+        mesh_obj.update_tag()
+        updated += 1
+    return updated
+
+
+def disable_gn_backend(mesh_obj, lat_obj) -> bool:
+    mod = mesh_obj.modifiers.get(MODIFIER_NAME)
+    if mod is None:
+        return False
+    _clear_drivers(mesh_obj, mod)
+    mesh_obj.modifiers.remove(mod)
+
+    lat_mod = _lattice_modifier(mesh_obj, lat_obj)
+    if lat_mod is not None:
+        lat_mod.show_viewport = True
+        lat_mod.show_render = True
+    if "bd_gn_backend" in lat_obj:
+        del lat_obj["bd_gn_backend"]
+    return True
+
+
+def fall_back_if_unsupported(scene, lattices=None) -> int:
+    """Switch meshes back to their lattices when the sliders left what the node group can do.
+
+    Looks at ``lattices`` (every lattice when None) that are on the backend. Each
+    lattice first gets the points the node group was showing, so the meshes do not
+    jump. Returns the number of meshes switched.
+    """
+    reason = unsupported_reason(scene.bd_deform_settings)
+    if reason is None:
+        return 0
+    candidates = bpy.data.objects if lattices is None else lattices
+    backend = [obj for obj in candidates if obj.type == 'LATTICE' and obj.get("bd_gn_backend")]
+    if not backend:
+        return 0
+
+    switched = 0
+    for lat_obj, users in scope.lattice_users(backend).items():
+        write_co_deform(lat_obj, slider_points(lat_obj, scene.bd_deform_settings))
+        for mesh_obj in users:
+            if disable_gn_backend(mesh_obj, lat_obj):
+                switched += 1
+        lat_obj.pop("bd_gn_backend", None)
+    print(f"BevelDeformer: Geometry Nodes backend turned off for {switched} mesh(es): {reason}")
+    return switched
+
+
+def _mesh_lattice_pairs(context) -> list[tuple[bpy.types.Object, bpy.types.Object]]:
+    lattices = gather_target_lattices(scope.scope_objects(context))
+    pairs = []
+    for lat_obj, users in scope.lattice_users(lattices).items():
+        pairs.extend((mesh_obj, lat_obj) for mesh_obj in users)
+    return pairs
+
+
+# -- parity ------------------------------------------------------------------------
+
+
+def lattice_path_coords(mesh_obj, lat_obj, settings) -> np.ndarray:
+    """Mesh-local positions the lattice path gives for the current scene settings."""
+    _current, resolution, interpolation = ffd.read_lattice(lat_obj)
+    return ffd.deform_points(
+        ffd.read_mesh_coords(mesh_obj),
+        slider_points(lat_obj, settings),
+        resolution,
+        interpolation,
+        matrix=ffd.lattice_space_matrix(mesh_obj, lat_obj),
+    )
+
+
+def mirror_coords(mesh_obj, lat_obj, settings) -> np.ndarray:
+    """Mesh-local positions computed with ``axis_map``, i.e. what the node group evaluates."""
+    matrix = ffd.lattice_space_matrix(mesh_obj, lat_obj)
+    co = ffd.read_mesh_coords(mesh_obj).astype(np.float64)
+    local = co @ matrix[:3, :3].T + matrix[:3, 3]
+
+    lat = lat_obj.data
+    resolution = (int(lat.points_u), int(lat.points_v), int(lat.points_w))
+    _enabled, locked_idx = get_lattice_locked_axis(lat_obj)
+    offsets = [float(settings.offset_x), float(settings.offset_y), float(settings.offset_z)]
+    for axis in range(3):
+        if locked_idx == axis:
+            offsets[axis] = 0.0
+        local[:, axis] = axis_map(
+            local[:, axis],
+            resolution[axis],
+            float(settings.shift_factor),
+            float(settings.scale_factor),
+            offsets[axis],
+            str(lat.interpolation_type_u),
+        )
+
+    back = np.linalg.inv(matrix)
+    return local @ back[:3, :3].T + back[:3, 3]
+
+
+def evaluated_coords(mesh_obj, depsgraph) -> np.ndarray | None:
+    evaluated = mesh_obj.evaluated_get(depsgraph)
+    mesh = evaluated.data
+    if len(mesh.vertices) != len(mesh_obj.data.vertices):
+        return None
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def parity_report(mesh_obj, lat_obj, settings, depsgraph=None) -> dict:
+    """Max distance between the lattice path and the node group (mirror, and evaluated if possible)."""
+    expected = lattice_path_coords(mesh_obj, lat_obj, settings)
+    report = {"mirror": float(np.abs(mirror_coords(mesh_obj, lat_obj, settings) - expected).max(initial=0.0))}
+    if depsgraph is not None:
+        # Only comparable when the node group is the only modifier changing positions.
+        enabled = [m for m in mesh_obj.modifiers if m.show_viewport]
+        if len(enabled) == 1 and enabled[0].name == MODIFIER_NAME:
+            evaluated = evaluated_coords(mesh_obj, depsgraph)
+            if evaluated is not None:
+                report["evaluated"] = float(np.abs(evaluated - expected).max(initial=0.0))
+    return report
+
+
+class BD_OT_enable_gn_backend(Operator):
+    bl_idname = "bd.enable_gn_backend"
+    bl_label = "Use Geometry Nodes"
+    bl_description = "Deform target meshes with a generated Geometry Nodes modifier driven by the sliders"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        reason = unsupported_reason(context.scene.bd_deform_settings)
+        if reason is not None:
+            self.report({'WARNING'}, f"Geometry Nodes backend unavailable: {reason}")
+            return {'CANCELLED'}
+
+        pairs = _mesh_lattice_pairs(context)
+        if not pairs:
+            self.report({'WARNING'}, f"No lattice-deformed meshes in {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        enabled = 0
+        refused: dict[str, str] = {}
+        for mesh_obj, lat_obj in pairs:
+            reason = refused.get(lat_obj.name) or lattice_unsupported_reason(lat_obj, context.scene.bd_deform_settings)
+            if reason is not None:
+                refused[lat_obj.name] = reason
+                continue
+            try:
+                enable_gn_backend(mesh_obj, lat_obj, context.scene)
+                enabled += 1
+            except Exception as e:
+                print(f"BevelDeformer: Geometry Nodes backend failed for {mesh_obj.name}: {e}")
+
+        if refused:
+            name, reason = next(iter(refused.items()))
+            self.report(
+                {'WARNING'},
+                f"Geometry Nodes backend on {enabled} mesh(es); kept {len(refused)} lattice(s) "
+                f"({name}: {reason})",
+            )
+        else:
+            self.report({'INFO'}, f"Geometry Nodes backend on {enabled} mesh(es)")
+        return {'FINISHED'}
+
+
+class BD_OT_disable_gn_backend(Operator):
+    bl_idname = "bd.disable_gn_backend"
+    bl_label = "Use Lattice"
+    bl_description = "Switch target meshes back to their lattice modifiers"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        from . import deform_ops
+
+        disabled = 0
+        lattices = set()
+        for mesh_obj, lat_obj in _mesh_lattice_pairs(context):
+            if disable_gn_backend(mesh_obj, lat_obj):
+                disabled += 1
+                lattices.add(lat_obj)
+
+        if lattices:
+            # The lattice points were not updated while the node group was in charge.
+            try:
+                deform_ops.deform_with_settings(context.scene, list(lattices))
+            except ValueError as e:
+                self.report({'ERROR'}, str(e))
+                return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Lattice backend restored on {disabled} mesh(es)")
+        return {'FINISHED'}
+
+
+class BD_OT_gn_parity_check(Operator):
+    bl_idname = "bd.gn_parity_check"
+    bl_label = "Check Parity"
+    bl_description = "Compare the Geometry Nodes result with the lattice deform for the target meshes"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        settings = context.scene.bd_deform_settings
+        pairs = _mesh_lattice_pairs(context)
+        if not pairs:
+            self.report({'WARNING'}, f"No lattice-deformed meshes in {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        depsgraph = context.evaluated_depsgraph_get()
+        worst = {"mirror": 0.0}
+        for mesh_obj, lat_obj in pairs:
+            try:
+                report = parity_report(mesh_obj, lat_obj, settings, depsgraph)
+            except Exception as e:
+                print(f"BevelDeformer: parity check failed for {mesh_obj.name}: {e}")
+                continue
+            for key, value in report.items():
+                worst[key] = max(worst.get(key, 0.0), value)
+
+        message = ", ".join(f"{key} max error {value:.2e}" for key, value in worst.items())
+        self.report({'INFO'}, f"Parity over {len(pairs)} mesh(es): {message}")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_enable_gn_backend,
+    BD_OT_disable_gn_backend,
+    BD_OT_gn_parity_check,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,298 @@
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.types import Operator
+
+from . import ffd, scope
+
+
+# Automatic influence groups: each lattice modifier gets a vertex group holding
+# only the vertices whose interpolation taps reach a lattice point that moved,
+# so the modifier skips every vertex the lattice cannot displace. Groups are
+# refreshed after lattice writes, and only the membership difference is written.
+
+GROUP_PREFIX = "BD_Influence_"
+MOVED_TOLERANCE = 1e-6
+_REFRESH_DELAY_SEC = 0.3
+
+_dirty: set[str] = set()
+_refresh_timer_running = False
+# (mesh name, modifier name) -> (signature of the inputs, membership mask)
+_state: dict[tuple[str, str], tuple[tuple, np.ndarray]] = {}
+
+
+def group_name(mod) -> str:
+    return f"{GROUP_PREFIX}{mod.name}"
+
+
+def is_enabled(context=None) -> bool:
+    try:
+        scene = (context or bpy.context).scene
+        return bool(scene.bd_lattice_settings.auto_influence)
+    except Exception:
+        return False
+
+
+def moved_points(deform: np.ndarray, resolution: tuple[int, int, int], tolerance: float = MOVED_TOLERANCE) -> np.ndarray:
+    """(W, V, U) mask of lattice points away from their uniform rest position."""
+    u_res, v_res, w_res = (int(r) for r in resolution)
+    displacement = np.asarray(deform, dtype=np.float64).reshape(-1, 3) - ffd.rest_coords(u_res, v_res, w_res)
+    return (np.abs(displacement).max(axis=1) > tolerance).reshape(w_res, v_res, u_res)
+
+
+def _axis_taps(count: int, interpolation: str) -> tuple[int, ...]:
+    # Offsets of the taps with non-zero weight relative to the cell base, as in ffd.
+    if count <= 1:
+        return (0,)
+    return (0, 1) if interpolation == "KEY_LINEAR" else (-1, 0, 1, 2)
+
+
+def _dilate(mask: np.ndarray, axis: int, count: int, taps: tuple[int, ...]) -> np.ndarray:
+    """For cell bases -2..count along ``axis``: does any clamped tap hit a set point."""
+    bases = np.arange(-2, count + 1)
+    index = np.clip(bases[:, None] + np.asarray(taps), 0, count - 1)
+    return np.take(mask, index, axis=axis).any(axis=axis + 1)
+
+
+def _cell_index(coord: np.ndarray, count: int) -> np.ndarray:
+    if count <= 1:
+        return np.full(coord.shape, 2, dtype=np.intp)
+    base = np.floor((coord + 0.5) * (count - 1))
+    return (np.clip(base, -2, count) + 2).astype(np.intp)
+
+
+def affected_vertices(
+    co: np.ndarray,
+    moved: np.ndarray,
+    resolution: tuple[int, int, int],
+    interpolation,
+    *,
+    matrix: np.ndarray | None = None,
+    chunk_size: int = ffd.DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """Mask of the positions in ``co`` that the lattice displaces.
+
+    ``moved`` (from ``moved_points``) is dilated by the interpolation support once
+    per axis, so each vertex costs one transform and one table lookup.
+    """
+    u_res, v_res, w_res = (int(r) for r in resolution)
+    interp_u, interp_v, interp_w = ffd._normalize_interpolation(interpolation)
+
+    reach = np.asarray(moved, dtype=bool).reshape(w_res, v_res, u_res)
+    reach = _dilate(reach, 2, u_res, _axis_taps(u_res, interp_u))
+    reach = _dilate(reach, 1, v_res, _axis_taps(v_res, interp_v))
+    reach = _dilate(reach, 0, w_res, _axis_taps(w_res, interp_w))
+
+    co = np.asarray(co).reshape(-1, 3)
+    out = np.zeros(co.shape[0], dtype=bool)
+    if not reach.any():
+        return out
+
+    to_lattice = None if matrix is None else np.asarray(matrix, dtype=np.float64).reshape(4, 4)
+    step = max(1, int(chunk_size))
+    for start in range(0, co.shape[0], step):
+        local = co[start:start + step].astype(np.float64)
+        if to_lattice is not None:
+            local = local @ to_lattice[:3, :3].T + to_lattice[:3, 3]
+        out[start:start + step] = reach[
+            _cell_index(local[:, 2], w_res),
+            _cell_index(local[:, 1], v_res),
+            _cell_index(local[:, 0], u_res),
+        ]
+    return out
+
+
+def refresh_modifier(mesh_obj, mod, *, force: bool = False) -> int:
+    """Bring the modifier's influence group up to date; returns vertices added or removed.
+
+    Skipped when the moved lattice points, the object transforms and the vertex
+    count are unchanged since the last refresh. Modifiers that already use a
+    vertex group of their own are left alone. Vertices are taken before the
+    modifier stack, so this assumes the lattice modifier comes first.
+    """
+    lat_obj = mod.object
+    name = group_name(mod)
+    if lat_obj is None or lat_obj.type != 'LATTICE' or mod.vertex_group not in ("", name):
+        return 0
+
+    deform, resolution, interpolation = ffd.read_lattice(lat_obj)
+    moved = moved_points(deform, resolution)
+    matrix = ffd.lattice_space_matrix(mesh_obj, lat_obj)
+    signature = (resolution, interpolation, len(mesh_obj.data.vertices), moved.tobytes(), matrix.tobytes())
+
+    key = (mesh_obj.name, mod.name)
+    group = mesh_obj.vertex_groups.get(name)
+    previous = _state.get(key) if group is not None else None
+    if previous is not None and previous[0] == signature and not force and mod.vertex_group == name:
+        return 0
+
+    mask = affected_vertices(ffd.read_mesh_coords(mesh_obj), moved, resolution, interpolation, matrix=matrix)
+    if group is None:
+        group = mesh_obj.vertex_groups.new(name=name)
+        old = np.zeros_like(mask)
+    elif previous is None or previous[1].shape != mask.shape:
+        # Unknown contents (new session, or the mesh changed): start from empty.
+        group.remove(list(range(len(mesh_obj.data.vertices))))
+        old = np.zeros_like(mask)
+    else:
+        old = previous[1]
+
+    added = np.flatnonzero(mask & ~old)
+    removed = np.flatnonzero(old & ~mask)
+    if removed.size:
+        group.remove(removed.tolist())
+    if added.size:
+        group.add(added.tolist(), 1.0, 'REPLACE')
+
+    mod.vertex_group = group.name
+    mod.invert_vertex_group = False
+    _state[key] = (signature, mask)
+    return int(added.size + removed.size)
+
+
+def refresh_lattices(lattices, *, force: bool = False) -> int:
+    changed = 0
+    for lat_obj, users in scope.lattice_users(lattices).items():
+        for mesh_obj in users:
+            for mod in mesh_obj.modifiers:
+                if mod.type != 'LATTICE' or mod.object != lat_obj:
+                    continue
+                try:
+                    changed += refresh_modifier(mesh_obj, mod, force=force)
+                except Exception as e:
+                    print(f"BevelDeformer: influence group refresh failed for {mesh_obj.name}/{mod.name}: {e}")
+    return changed
+
+
+def detach(mesh_obj, mod) -> None:
+    """Drop the modifier's influence group (before it is applied, removed or disabled)."""
+    name = group_name(mod)
+    _state.pop((mesh_obj.name, mod.name), None)
+    if mod.vertex_group == name:
+        mod.vertex_group = ""
+    group = mesh_obj.vertex_groups.get(name)
+    if group is not None:
+        mesh_obj.vertex_groups.remove(group)
+
+
+def detach_all() -> int:
+    count = 0
+    for obj in bpy.data.objects:
+        if obj.type != 'MESH':
+            continue
+        for mod in obj.modifiers:
+            if mod.type == 'LATTICE' and obj.vertex_groups.get(group_name(mod)) is not None:
+                try:
+                    detach(obj, mod)
+                    count += 1
+                except Exception as e:
+                    print(f"BevelDeformer: failed to remove influence group from {obj.name}: {e}")
+    return count
+
+
+def mark_dirty(lat_obj) -> None:
+    """Queue a lattice whose points changed; refreshed together after a short delay."""
+    global _refresh_timer_running
+    if not is_enabled():
+        return
+    _dirty.add(lat_obj.name)
+    if _refresh_timer_running:
+        return
+    try:
+        bpy.app.timers.register(_refresh_timer, first_interval=_REFRESH_DELAY_SEC)
+        _refresh_timer_running = True
+    except Exception as e:
+        print(f"BevelDeformer: failed to register influence refresh timer: {e}")
+
+
+def refresh_pending() -> int:
+    """Refresh every queued lattice now."""
+    names = list(_dirty)
+    _dirty.clear()
+    if not is_enabled():
+        return 0
+    lattices = [obj for obj in (bpy.data.objects.get(name) for name in names) if obj is not None and obj.type == 'LATTICE']
+    return refresh_lattices(lattices)
+
+
+def _refresh_timer() -> float | None:
+    global _refresh_timer_running
+    _refresh_timer_running = False
+    try:
+        refresh_pending()
+    except Exception as e:
+        _dirty.clear()
+        print(f"BevelDeformer: influence refresh timer crashed: {e}")
+    return None
+
+
+def on_setting_changed(context) -> None:
+    if is_enabled(context):
+        lattices = [obj for obj in bpy.data.objects if obj.type == 'LATTICE']
+        refresh_lattices(lattices, force=True)
+    else:
+        _dirty.clear()
+        detach_all()
+
+
+@persistent
+def _discard_state_on_load(*_args) -> None:
+    _dirty.clear()
+    _state.clear()
+
+
+class BD_OT_refresh_influence_groups(Operator):
+    bl_idname = "bd.refresh_influence_groups"
+    bl_label = "Refresh Influence"
+    bl_description = "Recompute the automatic influence vertex groups of the target lattices (e.g. after editing points by hand)"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        if not is_enabled(context):
+            self.report({'WARNING'}, "Auto Influence Group is disabled")
+            return {'CANCELLED'}
+
+        lattices: set[bpy.types.Object] = set()
+        for obj in scope.scope_objects(context):
+            if obj.type == 'LATTICE':
+                lattices.add(obj)
+            elif obj.type == 'MESH':
+                lattices.update(
+                    mod.object for mod in obj.modifiers
+                    if mod.type == 'LATTICE' and mod.object is not None and mod.object.type == 'LATTICE'
+                )
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        changed = refresh_lattices(lattices, force=True)
+        self.report({'INFO'}, f"Refreshed influence of {len(lattices)} lattice(s), {changed} vertex change(s)")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_refresh_influence_groups,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+    bpy.app.handlers.load_pre.append(_discard_state_on_load)
+
+
+def unregister() -> None:
+    global _refresh_timer_running
+    if _discard_state_on_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_discard_state_on_load)
+    try:
+        if bpy.app.timers.is_registered(_refresh_timer):
+            bpy.app.timers.unregister(_refresh_timer)
+    except Exception:
+        pass
+    _refresh_timer_running = False
+    _dirty.clear()
+    _state.clear()
+
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,264 @@
+import time
+
+import bpy
+import numpy as np
+from bpy.props import EnumProperty, FloatProperty
+from bpy.types import Operator
+
+from . import deform_ops, gn_backend, kernels, layers, memstats, scope, snapshots, stages
+from .deform_ops import gather_target_lattices, group_by_signature, write_co_deform
+
+
+# A drag that costs more than one frame is coalesced: mouse moves only update the
+# target values and the next timer event applies the latest ones.
+_FRAME_BUDGET_SEC = 1.0 / 60.0
+_SHIFT_PIXELS = 400.0
+_OFFSET_PIXELS = 200.0
+_PRECISION = 0.1
+
+_DRAG_PARAMS = ("shift_factor", "offset_x", "offset_y", "offset_z")
+
+_AXIS_ITEMS = [
+    ("X", "X", "Vertical drag changes Offset X"),
+    ("Y", "Y", "Vertical drag changes Offset Y"),
+    ("Z", "Z", "Vertical drag changes Offset Z"),
+]
+
+
+class DragPlan:
+    """Everything a drag needs that does not depend on the dragged values.
+
+    Lattices are grouped by (resolution, locked axis) once, and each group keeps the
+    flat float32 points the chain starts from: the uniform grid (one row shared by
+    every member) with Reset to Uniform on, otherwise the captured co_deform.
+
+    As in Deform, lattices with a layer stack (all of them with ``into_layer``) take
+    the dragged values as stage layer ``layer`` and are rebuilt from their stacks.
+    Lattices on the Geometry Nodes backend are left alone: their meshes follow the
+    scene sliders, which the operator writes on every apply.
+    """
+
+    def __init__(
+        self,
+        lattices,
+        settings,
+        snapshot: snapshots.Snapshot | None = None,
+        *,
+        layer: str = layers.DEFAULT_LAYER,
+        into_layer: bool = False,
+    ):
+        chain, stage_params = deform_ops.settings_chain(settings)
+        self.chain = tuple(chain)
+        self.params = {"scale_factor": float(settings.scale_factor)}
+        self.params.update(stage_params)
+        self.reset_to_uniform = bool(settings.reset_to_uniform)
+        self.lattice_count = len(lattices)
+        lattices = [lat for lat in lattices if not lat.get("bd_gn_backend")]
+
+        self.layer = layer
+        self.layered = [lat for lat in lattices if into_layer or layers.has_layers(lat)]
+        layers.check_stage_layer(self.layered, layer)
+        layered = set(self.layered)
+        lattices = [lat for lat in lattices if lat not in layered]
+
+        if snapshot is None and not self.reset_to_uniform:
+            snapshot = snapshots.capture(lattices)
+
+        self.groups: list[tuple[tuple[int, int, int], int, list[bpy.types.Object], np.ndarray]] = []
+        for (resolution, locked_idx), members in group_by_signature(lattices).items():
+            if self.reset_to_uniform:
+                base = kernels.uniform_coords(resolution).reshape(1, -1)
+            else:
+                data, index = snapshot
+                spans = [index[obj.name] for obj in members]
+                base = np.stack([data[start:start + count * 3] for start, count in spans])
+            self.groups.append((resolution, locked_idx, members, base))
+
+    def apply(self, values: dict[str, float]) -> None:
+        params = dict(self.params)
+        params.update(values)
+        if self.layered:
+            layers.deform_into_layer(self.layered, self.layer, self.chain, params)
+        for resolution, locked_idx, members, base in self.groups:
+            grid = stages.run_chain(kernels.grid_from_flat(base, resolution), self.chain, params, locked_idx=locked_idx)
+            result = grid.reshape(len(base), -1).astype(np.float32)
+            for i, obj in enumerate(members):
+                write_co_deform(obj, result[0] if len(base) == 1 else result[i])
+
+
+def _drag_lattices(context) -> list[bpy.types.Object]:
+    lattices = gather_target_lattices(scope.scope_objects(context))
+    # Settings the node group cannot draw switch its meshes back to their lattices first.
+    gn_backend.fall_back_if_unsupported(context.scene, lattices)
+    return lattices
+
+
+def _drag_plan(context, lattices, snapshot: snapshots.Snapshot | None = None) -> DragPlan:
+    return DragPlan(
+        lattices,
+        context.scene.bd_deform_settings,
+        snapshot,
+        layer=layers.target_layer(context.scene),
+        into_layer=bool(context.scene.bd_layer_settings.deform_into_layer),
+    )
+
+
+def _write_settings(settings, values: dict[str, float]) -> None:
+    with deform_ops.suppress_live_update():
+        for name, value in values.items():
+            setattr(settings, name, value)
+
+
+class BD_OT_interactive_deform(Operator):
+    bl_idname = "bd.interactive_deform"
+    bl_label = "Interactive Shift/Offset"
+    bl_description = (
+        "Drag to deform the target lattices directly: horizontal movement sets Shift Factor, "
+        "vertical movement the offset along the chosen axis (X/Y/Z keys switch it, Shift for precision)"
+    )
+    bl_options = {"REGISTER", "UNDO", "BLOCKING", "GRAB_CURSOR"}
+
+    shift_factor: FloatProperty(name="Shift Factor", default=0.0, min=-1.0, max=1.0)
+    offset_x: FloatProperty(name="Offset X", default=0.0, soft_min=-5.0, soft_max=5.0)
+    offset_y: FloatProperty(name="Offset Y", default=0.0, soft_min=-5.0, soft_max=5.0)
+    offset_z: FloatProperty(name="Offset Z", default=0.0, soft_min=-5.0, soft_max=5.0)
+    axis: EnumProperty(name="Offset Axis", items=_AXIS_ITEMS, default="X")
+
+    def _values(self) -> dict[str, float]:
+        return {name: float(getattr(self, name)) for name in _DRAG_PARAMS}
+
+    @memstats.tracked
+    def execute(self, context):
+        # Redo and scripted calls: one synchronous pass with the operator's values.
+        lattices = _drag_lattices(context)
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        try:
+            _drag_plan(context, lattices).apply(self._values())
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        _write_settings(context.scene.bd_deform_settings, self._values())
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        settings = context.scene.bd_deform_settings
+        # A queued slider tick must land before the state is captured, not mid-drag.
+        deform_ops.flush_live_update()
+
+        lattices = _drag_lattices(context)
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        for name in _DRAG_PARAMS:
+            setattr(self, name, float(getattr(settings, name)))
+        self._settings = settings
+        self._initial = self._values()
+
+        self._captured = snapshots.capture(lattices)
+        try:
+            self._plan = _drag_plan(context, lattices, self._captured)
+        except ValueError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        self._lattices = lattices
+        self._stacks = layers.save_stacks(self._plan.layered)
+        self._last_mouse = (event.mouse_x, event.mouse_y)
+        self._dirty = False
+        self._apply_cost = 0.0
+        self._applied_at = 0.0
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(_FRAME_BUDGET_SEC, window=context.window)
+        wm.modal_handler_add(self)
+        self._set_header(context)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            self._finish(context)
+            layers.restore_stacks(self._stacks)
+            snapshots.restore(self._captured, self._lattices, raw=True)
+            _write_settings(self._settings, self._initial)
+            return {'CANCELLED'}
+
+        if event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER', 'SPACE'} and event.value == 'PRESS':
+            if self._dirty:
+                self._apply()
+            self._finish(context)
+            return {'FINISHED'}
+
+        if event.type in {'X', 'Y', 'Z'} and event.value == 'PRESS':
+            self.axis = event.type
+            self._set_header(context)
+            return {'RUNNING_MODAL'}
+
+        if event.type == 'MOUSEMOVE':
+            self._drag(event)
+            # Apply right away unless the last update overran the frame and is still "in flight".
+            if self._apply_cost <= _FRAME_BUDGET_SEC or time.perf_counter() - self._applied_at >= self._apply_cost:
+                self._apply()
+            self._set_header(context)
+        elif event.type == 'TIMER' and self._dirty:
+            self._apply()
+
+        return {'RUNNING_MODAL'}
+
+    def _drag(self, event) -> None:
+        scale = _PRECISION if event.shift else 1.0
+        dx = event.mouse_x - self._last_mouse[0]
+        dy = event.mouse_y - self._last_mouse[1]
+        self._last_mouse = (event.mouse_x, event.mouse_y)
+
+        self.shift_factor = float(np.clip(self.shift_factor + dx / _SHIFT_PIXELS * scale, -1.0, 1.0))
+        name = f"offset_{self.axis.lower()}"
+        setattr(self, name, getattr(self, name) + dy / _OFFSET_PIXELS * scale)
+        self._dirty = True
+
+    def _apply(self) -> None:
+        start = time.perf_counter()
+        try:
+            with memstats.track(self.bl_idname):
+                self._plan.apply(self._values())
+            # The sliders drive meshes on the Geometry Nodes backend (and show the drag).
+            _write_settings(self._settings, self._values())
+        except Exception as e:
+            print(f"BevelDeformer: interactive deform failed: {e}")
+        self._applied_at = time.perf_counter()
+        self._apply_cost = self._applied_at - start
+        self._dirty = False
+
+    def _set_header(self, context) -> None:
+        area = getattr(context, "area", None)
+        if area is None:
+            return
+        name = f"offset_{self.axis.lower()}"
+        area.header_text_set(
+            f"Shift {self.shift_factor:.3f}  Offset {self.axis} {getattr(self, name):.3f}  "
+            f"({self._plan.lattice_count} lattice(s), {self._apply_cost * 1000.0:.1f} ms)  "
+            "X/Y/Z: offset axis, Shift: precision, Esc: cancel"
+        )
+
+    def _finish(self, context) -> None:
+        context.window_manager.event_timer_remove(self._timer)
+        area = getattr(context, "area", None)
+        if area is not None:
+            area.header_text_set(None)
+
+
+_classes = (
+    BD_OT_interactive_deform,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
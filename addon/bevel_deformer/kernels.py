@@ -0,0 +1,150 @@
+from functools import lru_cache
+
+import numpy as np
+
+from .ffd import rest_coords
+
+
+_MEMO_SIZE = 64
+
+
+def _ease_linear(t: np.ndarray) -> np.ndarray:
+    return t
+
+
+def _ease_smooth(t: np.ndarray) -> np.ndarray:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _ease_in(t: np.ndarray) -> np.ndarray:
+    return t * t
+
+
+def _ease_out(t: np.ndarray) -> np.ndarray:
+    return 1.0 - (1.0 - t) * (1.0 - t)
+
+
+def _ease_sphere(t: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.clip(1.0 - (1.0 - t) ** 2, 0.0, 1.0))
+
+
+# Falloff/relax profiles: monotonic maps of [0, 1] onto [0, 1].
+PROFILES = {
+    "LINEAR": _ease_linear,
+    "SMOOTH": _ease_smooth,
+    "EASE_IN": _ease_in,
+    "EASE_OUT": _ease_out,
+    "SPHERE": _ease_sphere,
+}
+
+PROFILE_ITEMS = [
+    ("LINEAR", "Linear", "Straight ramp"),
+    ("SMOOTH", "Smooth", "Ease in and out (smoothstep)"),
+    ("EASE_IN", "Ease In", "Slow start, fast end"),
+    ("EASE_OUT", "Ease Out", "Fast start, slow end"),
+    ("SPHERE", "Sphere", "Circular rise"),
+]
+
+
+def _readonly(arr: np.ndarray) -> np.ndarray:
+    arr.setflags(write=False)
+    return arr
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def offset_ramp(resolution: int, profile: str = "LINEAR") -> np.ndarray:
+    """Per-row offset weight: first 2 rows fixed, last 2 rows full, ``profile`` in between.
+
+    Cached per (resolution, profile), so a live tick only gathers from the table.
+    """
+    n = int(resolution)
+    if n < 4:
+        return _readonly(np.zeros(n, dtype=np.float64))
+    t = np.clip((np.arange(n, dtype=np.float64) - 1.0) / (n - 3), 0.0, 1.0)
+    return _readonly(PROFILES[profile](t))
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def relax_steps(resolution: int, profile: str = "LINEAR") -> np.ndarray:
+    """Blend factors of the interior points 2..n-3 between the two shifted anchors."""
+    n = int(resolution)
+    t = (np.arange(2, max(n - 2, 2), dtype=np.float64) - 1.0) / max(n - 3, 1)
+    return _readonly(PROFILES[profile](t))
+
+
+def uniform_grid(resolution: tuple[int, int, int], batch: int = 1) -> np.ndarray:
+    """Uniform lattice points as a (B, W, V, U, 3) float64 grid."""
+    u_res, v_res, w_res = (int(r) for r in resolution)
+    grid = rest_coords(u_res, v_res, w_res).reshape(1, w_res, v_res, u_res, 3)
+    return np.repeat(grid, int(batch), axis=0)
+
+
+def grid_from_flat(co: np.ndarray, resolution: tuple[int, int, int]) -> np.ndarray:
+    u_res, v_res, w_res = (int(r) for r in resolution)
+    return np.asarray(co, dtype=np.float64).reshape(-1, w_res, v_res, u_res, 3)
+
+
+def _per_item(value, batch: int, dtype=np.float64) -> np.ndarray:
+    arr = np.asarray(value, dtype=dtype).reshape(-1)
+    if arr.size == 1:
+        return np.full(batch, arr[0], dtype=dtype)
+    if arr.size != batch:
+        raise ValueError(f"Expected a scalar or {batch} values, got {arr.size}")
+    return arr
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t) -> np.ndarray:
+    # Same formulation as mathutils.Vector.lerp.
+    return a * (1.0 - t) + b * t
+
+
+def _shift_axis(
+    grid: np.ndarray, axis: int, shift: np.ndarray, active: np.ndarray, profile: str = "LINEAR"
+) -> bool:
+    """Shift the second/second-to-last points of every line along ``axis`` and relax the interior.
+
+    Positive shift pulls them toward the boundary rows, negative toward the interior;
+    interior points are then spread between the two moved anchors along ``profile``.
+    """
+    lines = np.moveaxis(grid, 3 - axis, -2)
+    n = lines.shape[-2]
+    if n < 4:
+        return False
+
+    batch = grid.shape[0]
+    sf = shift.reshape(batch, 1, 1, 1)
+    mask = active.reshape(batch, 1, 1, 1)
+    positive = sf >= 0.0
+    t = np.abs(sf)
+
+    first = np.where(
+        positive,
+        _lerp(lines[..., 1, :], lines[..., 0, :], t),
+        _lerp(lines[..., 1, :], lines[..., 2, :], t),
+    )
+    # With 4 points the inward neighbour of the last anchor is the first anchor,
+    # which has already been moved at this point.
+    inner = first if n == 4 else lines[..., n - 3, :]
+    last = np.where(
+        positive,
+        _lerp(lines[..., n - 2, :], lines[..., n - 1, :], t),
+        _lerp(lines[..., n - 2, :], inner, t),
+    )
+
+    if n > 4:
+        steps = relax_steps(n, profile)
+        relaxed = _lerp(first[..., None, :], last[..., None, :], steps[:, None])
+        lines[..., 2 : n - 2, :] = np.where(mask[..., None], relaxed, lines[..., 2 : n - 2, :])
+
+    lines[..., 1, :] = np.where(mask, first, lines[..., 1, :])
+    lines[..., n - 2, :] = np.where(mask, last, lines[..., n - 2, :])
+    return True
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def uniform_coords(resolution: tuple[int, int, int]) -> np.ndarray:
+    """Read-only flat float32 uniform lattice points, shared between callers."""
+    co = np.ascontiguousarray(uniform_grid(resolution).reshape(-1, 3), dtype=np.float32)
+    co.setflags(write=False)
+    return co
+
@@ -1,12 +1,63 @@
+import hashlib
+import json
+
 import bpy
+from bpy.props import BoolProperty
 from bpy.types import Operator
 from mathutils import Matrix, Vector
 
+import numpy as np
+
+from . import deform_ops, ffd, gn_backend, influence, layers, memstats, scope
+from .batch import BatchOperator
+
+
+# Shared lattices record the names of the meshes they were fitted around as a
+# JSON list, so deform, apply and delete can treat the group as one unit.
+GROUP_MEMBERS_KEY = "bd_group_members"
+
+_WORLD_AXIS_INDEX = {"X": 0, "Y": 1, "Z": 2}
+
+# Per-mesh lattices store a hash of everything their cage was fitted from, so
+# Create can leave lattices whose inputs did not change (and their deformation) alone.
+FINGERPRINT_KEY = "bd_fingerprint"
+_FINGERPRINT_DIGITS = 6
+
 
 def _safe_dim(value: float, eps: float = 1e-4) -> float:
     return value if abs(value) > eps else eps
 
 
+def is_group_lattice(lat_obj: bpy.types.Object | None) -> bool:
+    return lat_obj is not None and lat_obj.type == 'LATTICE' and lat_obj.get(GROUP_MEMBERS_KEY) is not None
+
+
+def group_members(lat_obj: bpy.types.Object) -> list[bpy.types.Object]:
+    """Recorded member meshes of a shared lattice that still exist."""
+    try:
+        names = json.loads(lat_obj.get(GROUP_MEMBERS_KEY) or "[]")
+    except (TypeError, ValueError):
+        return []
+    members = (bpy.data.objects.get(name) for name in names)
+    return [obj for obj in members if obj is not None and obj.type == 'MESH']
+
+
+def _group_lattices_for_mesh(mesh_obj: bpy.types.Object) -> list[bpy.types.Object]:
+    return [
+        mod.object for mod in mesh_obj.modifiers
+        if mod.type == 'LATTICE' and is_group_lattice(mod.object)
+    ]
+
+
+def _mesh_lattices(mesh_obj: bpy.types.Object) -> list[bpy.types.Object]:
+    """The mesh's own lattice and the shared lattices it belongs to."""
+    lattices = _group_lattices_for_mesh(mesh_obj)
+    existing = _existing_lattice_for_mesh(mesh_obj)
+    if existing is not None:
+        lattices.append(existing)
+    return lattices
+
+
 def _existing_lattice_for_mesh(mesh_obj: bpy.types.Object) -> bpy.types.Object | None:
     expected_name = f"Lattice_{mesh_obj.name}"
     lat_obj = bpy.data.objects.get(expected_name)
@@ -29,6 +80,7 @@ def _remove_existing_lattice(mesh_obj: bpy.types.Object) -> bool:
             continue
         if mod.object != lat_obj:
             continue
+        influence.detach(mesh_obj, mod)
         mesh_obj.modifiers.remove(mod)
 
     lat_data = lat_obj.data
@@ -38,9 +90,30 @@ def _remove_existing_lattice(mesh_obj: bpy.types.Object) -> bool:
     return True
 
 
-def _remove_lattice_references(lat_obj: bpy.types.Object) -> int:
+def _leave_group_lattices(mesh_obj: bpy.types.Object) -> int:
+    """Detach a mesh from the shared lattices it uses; a lattice left with no users is deleted."""
+    left = 0
+    for lat_obj in _group_lattices_for_mesh(mesh_obj):
+        for mod in list(_iter_lattice_modifiers(mesh_obj, lattice_obj=lat_obj)):
+            influence.detach(mesh_obj, mod)
+            mesh_obj.modifiers.remove(mod)
+        remaining = [obj.name for obj in group_members(lat_obj) if obj != mesh_obj]
+        lat_obj[GROUP_MEMBERS_KEY] = json.dumps(remaining)
+        # The recorded names can be stale (renamed meshes), so confirm before deleting.
+        if not remaining and not scope.lattice_users([lat_obj])[lat_obj]:
+            _delete_lattice_object(lat_obj, [])
+        left += 1
+    return left
+
+
+def _remove_lattice_references(
+    lat_obj: bpy.types.Object, users: list[bpy.types.Object] | None = None
+) -> int:
+    if users is None:
+        users = scope.lattice_users([lat_obj])[lat_obj]
+
     removed = 0
-    for obj in bpy.data.objects:
+    for obj in users:
         if obj.type != 'MESH':
             continue
         for mod in list(obj.modifiers):
@@ -48,16 +121,19 @@ def _remove_lattice_references(lat_obj: bpy.types.Object) -> int:
                 continue
             if mod.object != lat_obj:
                 continue
+            influence.detach(obj, mod)
             obj.modifiers.remove(mod)
             removed += 1
     return removed
 
 
-def _delete_lattice_object(lat_obj: bpy.types.Object) -> bool:
+def _delete_lattice_object(
+    lat_obj: bpy.types.Object, users: list[bpy.types.Object] | None = None
+) -> bool:
     if lat_obj is None or lat_obj.type != 'LATTICE':
         return False
 
-    _remove_lattice_references(lat_obj)
+    _remove_lattice_references(lat_obj, users)
     lat_data = lat_obj.data
     bpy.data.objects.remove(lat_obj, do_unlink=True)
     if lat_data is not None and getattr(lat_data, "users", 0) == 0:
@@ -76,141 +152,263 @@ def _iter_lattice_modifiers(
         yield mod
 
 
-def _find_meshes_using_lattice(lat_obj: bpy.types.Object) -> list[bpy.types.Object]:
-    meshes: list[bpy.types.Object] = []
-    for obj in bpy.data.objects:
-        if obj.type != 'MESH':
-            continue
-        for mod in obj.modifiers:
-            if mod.type == 'LATTICE' and mod.object == lat_obj:
-                meshes.append(obj)
-                break
-    return meshes
+def _even_base_resolution(base_resolution: int) -> int:
+    base_res = int(max(2, base_resolution))
+    if base_res % 2 == 1:
+        base_res += 1
+    return base_res
 
 
-def create_lattice_multi(
+def _bounds(bbox: list[Vector]) -> tuple[Vector, Vector]:
+    min_v = Vector((min(v.x for v in bbox), min(v.y for v in bbox), min(v.z for v in bbox)))
+    max_v = Vector((max(v.x for v in bbox), max(v.y for v in bbox), max(v.z for v in bbox)))
+
+    local_center = (min_v + max_v) / 2
+    local_size = max_v - min_v
+    local_size = Vector((_safe_dim(local_size.x), _safe_dim(local_size.y), _safe_dim(local_size.z)))
+    return local_center, local_size
+
+
+def _local_bounds(obj: bpy.types.Object) -> tuple[Vector, Vector]:
+    return _bounds([Vector(v) for v in obj.bound_box])
+
+
+def _world_bounds(objects: list[bpy.types.Object]) -> tuple[Vector, Vector]:
+    return _bounds([obj.matrix_world @ Vector(v) for obj in objects for v in obj.bound_box])
+
+
+def _locked_local_axis(obj: bpy.types.Object, locked_world_axis: str) -> int:
+    rot_mat = obj.matrix_world.to_3x3().normalized()
+    axis = str(locked_world_axis).upper()
+    world_axis_map = {
+        "X": Vector((1, 0, 0)),
+        "Y": Vector((0, 1, 0)),
+        "Z": Vector((0, 0, 1)),
+    }
+    world_axis = world_axis_map.get(axis, Vector((1, 0, 0)))
+
+    scores = [
+        abs(rot_mat.col[0].dot(world_axis)),
+        abs(rot_mat.col[1].dot(world_axis)),
+        abs(rot_mat.col[2].dot(world_axis)),
+    ]
+    return int(scores.index(max(scores)))
+
+
+def _compute_resolutions(
+    d_list: list[float], locked_idx: int | None, base_res: int, locked_res: int = 2
+) -> list[int]:
+    resolutions = [2, 2, 2]
+
+    if locked_idx is not None:
+        active_dims = [d_list[i] for i in range(3) if i != locked_idx]
+        min_dim = min(active_dims) if active_dims else 1.0
+    else:
+        min_dim = min(d_list) if d_list else 1.0
+
+    for i in range(3):
+        if locked_idx is not None and i == locked_idx:
+            resolutions[i] = locked_res
+        else:
+            dim = d_list[i]
+            if abs(dim - min_dim) < 0.001:
+                resolutions[i] = base_res
+            else:
+                ratio = dim / min_dim if min_dim > 1e-8 else 1.0
+                target = ratio * base_res
+                even_res = round(target / 2) * 2
+                resolutions[i] = int(max(2, even_res))
+    return resolutions
+
+
+def lattice_fingerprint(
+    obj: bpy.types.Object,
+    *,
+    locked_enabled: bool,
+    base_res: int,
+    locked_world_axis: str,
+    locked_res: int = 2,
+) -> str:
+    """Hash of a per-mesh lattice's inputs, interpolation excluded (it is updated in place)."""
+    local_center, local_size = _local_bounds(obj)
+    basis = obj.matrix_world.to_3x3()
+    values = [round(float(v), _FINGERPRINT_DIGITS) for v in (*local_center, *local_size)]
+    values += [round(float(basis[row][col]), _FINGERPRINT_DIGITS) for row in range(3) for col in range(3)]
+    values += [bool(locked_enabled), int(base_res), int(locked_res), str(locked_world_axis) if locked_enabled else ""]
+    return hashlib.sha1(json.dumps(values).encode("utf-8")).hexdigest()
+
+
+def _mesh_lattice_resolutions(
+    obj: bpy.types.Object,
+    *,
+    locked_enabled: bool,
+    base_res: int,
+    locked_world_axis: str,
+    locked_res: int = 2,
+) -> tuple[int | None, list[int]]:
+    """(locked local axis, points per axis) of the lattice Create would fit to ``obj``."""
+    _local_center, local_size = _local_bounds(obj)
+    locked_idx = _locked_local_axis(obj, locked_world_axis) if locked_enabled else None
+    return locked_idx, _compute_resolutions(
+        [local_size.x, local_size.y, local_size.z], locked_idx, base_res, locked_res
+    )
+
+
+def _create_lattice_for_mesh(
+    obj: bpy.types.Object,
+    *,
+    locked_enabled: bool,
+    base_res: int,
+    locked_world_axis: str,
+    interpolation: str,
+    locked_res: int = 2,
+) -> bpy.types.Object:
+    local_center, local_size = _local_bounds(obj)
+    locked_idx, resolutions = _mesh_lattice_resolutions(
+        obj, locked_enabled=locked_enabled, base_res=base_res,
+        locked_world_axis=locked_world_axis, locked_res=locked_res,
+    )
+
+    lat_obj = _new_lattice_object(
+        f"Lattice_{obj.name}", resolutions, interpolation, _object_collection(obj),
+        locked_enabled=locked_enabled, locked_idx=locked_idx, locked_world_axis=locked_world_axis,
+    )
+
+    mat_trans = Matrix.Translation(local_center)
+    mat_scale = Matrix.Diagonal(local_size.to_4d())
+    mat_scale[3][3] = 1.0
+
+    lat_obj.matrix_world = obj.matrix_world @ mat_trans @ mat_scale
+
+    lat_obj.parent = obj
+    lat_obj.matrix_parent_inverse = obj.matrix_world.inverted()
+    lat_obj[FINGERPRINT_KEY] = lattice_fingerprint(
+        obj, locked_enabled=locked_enabled, base_res=base_res,
+        locked_world_axis=locked_world_axis, locked_res=locked_res,
+    )
+
+    _add_lattice_modifier(obj, lat_obj)
+    influence.mark_dirty(lat_obj)
+    return lat_obj
+
+
+def create_group_lattice(
     targets: list[bpy.types.Object],
     *,
-    locked_axis_enabled: bool,
-    base_resolution: int,
+    name: str,
+    locked_enabled: bool,
+    base_res: int,
     locked_world_axis: str,
     interpolation: str,
-) -> int:
-    if not targets:
-        return 0
+    collection=None,
+    locked_res: int = 2,
+) -> bpy.types.Object:
+    """One world-aligned lattice around the combined bounds of ``targets``, used by all of them."""
+    center, size = _world_bounds(targets)
+    locked_idx = _WORLD_AXIS_INDEX.get(str(locked_world_axis).upper(), 0) if locked_enabled else None
+    resolutions = _compute_resolutions([size.x, size.y, size.z], locked_idx, base_res, locked_res)
+
+    lat_obj = _new_lattice_object(
+        f"Lattice_Group_{name}", resolutions, interpolation, collection or _object_collection(targets[0]),
+        locked_enabled=locked_enabled, locked_idx=locked_idx, locked_world_axis=locked_world_axis,
+    )
+    mat_scale = Matrix.Diagonal(size.to_4d())
+    mat_scale[3][3] = 1.0
+    lat_obj.matrix_world = Matrix.Translation(center) @ mat_scale
+    lat_obj[GROUP_MEMBERS_KEY] = json.dumps([obj.name for obj in targets])
 
-    bpy.context.view_layer.update()
+    for obj in targets:
+        _add_lattice_modifier(obj, lat_obj)
+    influence.mark_dirty(lat_obj)
+    return lat_obj
 
-    prev_selected = list(bpy.context.selected_objects)
-    prev_active = bpy.context.view_layer.objects.active
 
-    created_lattices = []
+def _object_collection(obj: bpy.types.Object):
+    if getattr(obj, "users_collection", None):
+        if len(obj.users_collection) > 0:
+            return obj.users_collection[0]
+    return bpy.context.collection
 
-    base_res = int(max(2, base_resolution))
-    locked_enabled = bool(locked_axis_enabled)
-    locked_res = 2
-    if base_res % 2 == 1:
-        base_res += 1
 
-    for obj in targets:
-        try:
-            bbox = [Vector(v) for v in obj.bound_box]
-            min_v = Vector((min(v.x for v in bbox), min(v.y for v in bbox), min(v.z for v in bbox)))
-            max_v = Vector((max(v.x for v in bbox), max(v.y for v in bbox), max(v.z for v in bbox)))
-
-            local_center = (min_v + max_v) / 2
-            local_size = max_v - min_v
-            local_size = Vector((_safe_dim(local_size.x), _safe_dim(local_size.y), _safe_dim(local_size.z)))
-
-            locked_idx: int | None = None
-            if locked_enabled:
-                rot_mat = obj.matrix_world.to_3x3().normalized()
-                axis = str(locked_world_axis).upper()
-                world_axis_map = {
-                    "X": Vector((1, 0, 0)),
-                    "Y": Vector((0, 1, 0)),
-                    "Z": Vector((0, 0, 1)),
-                }
-                world_axis = world_axis_map.get(axis, Vector((1, 0, 0)))
-
-                scores = [
-                    abs(rot_mat.col[0].dot(world_axis)),
-                    abs(rot_mat.col[1].dot(world_axis)),
-                    abs(rot_mat.col[2].dot(world_axis)),
-                ]
-                locked_idx = int(scores.index(max(scores)))
-
-            d_list = [local_size.x, local_size.y, local_size.z]
-            resolutions = [2, 2, 2]
-
-            if locked_enabled and locked_idx is not None:
-                active_dims = [d_list[i] for i in range(3) if i != locked_idx]
-                min_dim = min(active_dims) if active_dims else 1.0
-            else:
-                locked_idx = None
-                min_dim = min(d_list) if d_list else 1.0
-
-            for i in range(3):
-                if locked_idx is not None and i == locked_idx:
-                    resolutions[i] = locked_res
-                else:
-                    dim = d_list[i]
-                    if abs(dim - min_dim) < 0.001:
-                        resolutions[i] = base_res
-                    else:
-                        ratio = dim / min_dim if min_dim > 1e-8 else 1.0
-                        target = ratio * base_res
-                        even_res = round(target / 2) * 2
-                        resolutions[i] = int(max(2, even_res))
-
-            lat_name = f"Lattice_{obj.name}"
-            lat_data = bpy.data.lattices.new(lat_name + "_Data")
-            lat_obj = bpy.data.objects.new(lat_name, lat_data)
-
-            lat_data.points_u = resolutions[0]
-            lat_data.points_v = resolutions[1]
-            lat_data.points_w = resolutions[2]
-
-            lat_data.interpolation_type_u = interpolation
-            lat_data.interpolation_type_v = interpolation
-            lat_data.interpolation_type_w = interpolation
-
-            target_collection = None
-            if getattr(obj, "users_collection", None):
-                if len(obj.users_collection) > 0:
-                    target_collection = obj.users_collection[0]
-            if target_collection is None:
-                target_collection = bpy.context.collection
-            target_collection.objects.link(lat_obj)
-
-            mat_trans = Matrix.Translation(local_center)
-            mat_scale = Matrix.Diagonal(local_size.to_4d())
-            mat_scale[3][3] = 1.0
-
-            lat_obj.matrix_world = obj.matrix_world @ mat_trans @ mat_scale
-
-            lat_obj.parent = obj
-            lat_obj.matrix_parent_inverse = obj.matrix_world.inverted()
-
-            # Persist per-lattice lock metadata so later operations can respect it
-            # even if scene settings change.
-            lat_obj["bd_locked_axis_enabled"] = bool(locked_enabled)
-            lat_obj["bd_locked_axis_idx"] = int(locked_idx) if locked_idx is not None else -1
-            lat_obj["bd_locked_world_axis"] = str(locked_world_axis)
-
-            mod = obj.modifiers.new(name="AutoLattice", type='LATTICE')
-            mod.object = lat_obj
-
-            created_lattices.append(lat_obj)
+def _new_lattice_object(
+    lat_name: str,
+    resolutions: list[int],
+    interpolation: str,
+    collection,
+    *,
+    locked_enabled: bool,
+    locked_idx: int | None,
+    locked_world_axis: str,
+) -> bpy.types.Object:
+    lat_data = bpy.data.lattices.new(lat_name + "_Data")
+    lat_obj = bpy.data.objects.new(lat_name, lat_data)
 
-        except Exception as e:
-            print(f"BevelDeformer: failed for {obj.name}: {e}")
+    lat_data.points_u = resolutions[0]
+    lat_data.points_v = resolutions[1]
+    lat_data.points_w = resolutions[2]
 
-    for lat in created_lattices:
-        lat.select_set(True)
-    if created_lattices:
-        bpy.context.view_layer.objects.active = created_lattices[-1]
+    lat_data.interpolation_type_u = interpolation
+    lat_data.interpolation_type_v = interpolation
+    lat_data.interpolation_type_w = interpolation
+
+    collection.objects.link(lat_obj)
+
+    # Persist per-lattice lock metadata so later operations can respect it
+    # even if scene settings change.
+    lat_obj["bd_locked_axis_enabled"] = bool(locked_enabled)
+    lat_obj["bd_locked_axis_idx"] = int(locked_idx) if locked_idx is not None else -1
+    lat_obj["bd_locked_world_axis"] = str(locked_world_axis)
+    return lat_obj
+
+
+def _add_lattice_modifier(obj: bpy.types.Object, lat_obj: bpy.types.Object):
+    mod = obj.modifiers.new(name="AutoLattice", type='LATTICE')
+    mod.object = lat_obj
+    return mod
+
+
+def _reusable_lattice(obj: bpy.types.Object, create_kwargs: dict) -> bpy.types.Object | None:
+    """The mesh's lattice if it was fitted from the same inputs and is still in use."""
+    lat_obj = _existing_lattice_for_mesh(obj)
+    if lat_obj is None or _group_lattices_for_mesh(obj):
+        return None
+    if not any(True for _mod in _iter_lattice_modifiers(obj, lattice_obj=lat_obj)):
+        return None
+
+    kwargs = {key: value for key, value in create_kwargs.items() if key != "interpolation"}
+    if lat_obj.get(FINGERPRINT_KEY) != lattice_fingerprint(obj, **kwargs):
+        return None
+    # Change Resolution and cage import resize lattices after they were fitted.
+    if list(deform_ops.lattice_resolution(lat_obj)) != _mesh_lattice_resolutions(obj, **kwargs)[1]:
+        return None
+    return lat_obj
 
+
+def _set_interpolation(lat_obj: bpy.types.Object, interpolation: str) -> bool:
+    lat = lat_obj.data
+    if (lat.interpolation_type_u, lat.interpolation_type_v, lat.interpolation_type_w) == (interpolation,) * 3:
+        return False
+    lat.interpolation_type_u = interpolation
+    lat.interpolation_type_v = interpolation
+    lat.interpolation_type_w = interpolation
+    influence.mark_dirty(lat_obj)
+    return True
+
+
+def _settings_create_kwargs(settings) -> dict:
+    return dict(
+        locked_enabled=bool(getattr(settings, "locked_axis_enabled", True)),
+        base_res=_even_base_resolution(int(settings.base_resolution)),
+        locked_world_axis=str(settings.locked_world_axis),
+        interpolation=str(settings.interpolation),
+    )
+
+
+def _select_created_lattices(
+    created_lattices: list[bpy.types.Object],
+    prev_selected: list[bpy.types.Object],
+    prev_active: bpy.types.Object | None,
+) -> None:
     if created_lattices:
         for obj in prev_selected:
             try:
@@ -232,20 +430,182 @@ def create_lattice_multi(
         except Exception:
             pass
 
+
+def create_lattice_multi(
+    targets: list[bpy.types.Object],
+    *,
+    locked_axis_enabled: bool,
+    base_resolution: int,
+    locked_world_axis: str,
+    interpolation: str,
+    select_result: bool = True,
+) -> int:
+    if not targets:
+        return 0
+
+    bpy.context.view_layer.update()
+
+    prev_selected = list(bpy.context.selected_objects) if select_result else []
+    prev_active = bpy.context.view_layer.objects.active
+
+    created_lattices = []
+    base_res = _even_base_resolution(base_resolution)
+
+    for obj in targets:
+        try:
+            created_lattices.append(
+                _create_lattice_for_mesh(
+                    obj,
+                    locked_enabled=bool(locked_axis_enabled),
+                    base_res=base_res,
+                    locked_world_axis=locked_world_axis,
+                    interpolation=interpolation,
+                )
+            )
+        except Exception as e:
+            print(f"BevelDeformer: failed for {obj.name}: {e}")
+
+    if select_result:
+        _select_created_lattices(created_lattices, prev_selected, prev_active)
     return len(created_lattices)
 
 
-class BD_OT_create_lattice_multi(Operator):
+def _cage_dimensions(lat_obj: bpy.types.Object) -> list[float]:
+    # Size of the cage in its parent's space, which is what create_lattice_multi() fitted.
+    mat = lat_obj.matrix_world
+    if lat_obj.parent is not None:
+        mat = lat_obj.parent.matrix_world.inverted_safe() @ mat
+    mat3 = mat.to_3x3()
+    return [_safe_dim(mat3.col[i].length) for i in range(3)]
+
+
+def target_lattice_resolution(lat_obj: bpy.types.Object, base_resolution: int) -> tuple[int, int, int]:
+    _enabled, locked_idx = deform_ops.get_lattice_locked_axis(lat_obj)
+    resolutions = _compute_resolutions(
+        _cage_dimensions(lat_obj), locked_idx, _even_base_resolution(base_resolution)
+    )
+    return tuple(resolutions)
+
+
+def resample_lattice_resolution(lat_obj: bpy.types.Object, resolution: tuple[int, int, int]) -> bool:
+    """Change ``points_u/v/w`` in place, carrying the current deformation over.
+
+    The old displacement field is sampled trilinearly at the new rest positions, so
+    the cage keeps its shape. The lattice object and the modifiers using it are not
+    touched, except for the resolution input of Geometry Nodes backend modifiers.
+    Returns False when the resolution is already ``resolution``.
+    """
+    lat = lat_obj.data
+    new_res = tuple(int(max(1, r)) for r in resolution)
+    old_deform, old_res, _interps = ffd.read_lattice(lat_obj)
+    if old_res == new_res:
+        return False
+
+    new_rest = ffd.rest_coords(*new_res)
+    resampled = ffd.deform_points(new_rest, old_deform, old_res, "KEY_LINEAR")
+    layers.resample(lat_obj, old_res, new_res)
+
+    lat.points_u = new_res[0]
+    lat.points_v = new_res[1]
+    lat.points_w = new_res[2]
+    if layers.has_layers(lat_obj):
+        # Stage layers are exact at any resolution, so a layered lattice is rebuilt from its stack.
+        resampled = layers.composite(lat_obj)
+    lat.points.foreach_set("co_deform", resampled.astype(np.float32).ravel())
+    influence.mark_dirty(lat_obj)
+    gn_backend.sync_lattice_inputs(lat_obj)
+    lat.update_tag()
+    return True
+
+
+def is_linked_mesh(obj: bpy.types.Object) -> bool:
+    """True when the object's mesh comes from a library, so modifiers cannot be applied to it."""
+    return obj.data is not None and obj.data.library is not None
+
+
+def apply_lattice_modifiers(context, mesh_obj: bpy.types.Object, lattices=None, *, fast: bool = False) -> int:
+    """Apply the mesh's lattice modifiers (only those targeting ``lattices`` when given)."""
+    applied = 0
+    for mod in list(_iter_lattice_modifiers(mesh_obj)):
+        lat_obj = mod.object
+        if lat_obj is None:
+            continue
+
+        if lattices and lat_obj not in lattices:
+            continue
+
+        try:
+            # The influence group only skips vertices the lattice leaves in place,
+            # so applying without it gives the same mesh.
+            influence.detach(mesh_obj, mod)
+            if fast and ffd.can_bake_directly(mesh_obj, mod):
+                ffd.bake_mesh(mesh_obj, lat_obj)
+                mesh_obj.modifiers.remove(mod)
+            else:
+                # Override the context instead of changing selection/active object.
+                with context.temp_override(
+                    object=mesh_obj,
+                    active_object=mesh_obj,
+                    selected_objects=[mesh_obj],
+                    selected_editable_objects=[mesh_obj],
+                ):
+                    bpy.ops.object.modifier_apply(modifier=mod.name)
+            applied += 1
+        except Exception as e:
+            print(
+                "BevelDeformer: failed to apply modifier "
+                f"{mod.name} on {getattr(mesh_obj, 'name', '<unknown>')}: {e}"
+            )
+    return applied
+
+
+def delete_unused_lattices(lattices) -> tuple[int, int]:
+    """Delete the lattices no mesh modifier uses any more; returns (deleted, still used)."""
+    remaining_users = scope.lattice_users(lattices)
+    deleted = 0
+    skipped = 0
+    for lat_obj in list(lattices):
+        try:
+            if remaining_users[lat_obj]:
+                skipped += 1
+                continue
+
+            if _delete_lattice_object(lat_obj, []):
+                deleted += 1
+        except Exception as e:
+            print(
+                "BevelDeformer: failed to delete lattice "
+                f"{getattr(lat_obj, 'name', '<unknown>')}: {e}"
+            )
+    return deleted, skipped
+
+
+class BD_OT_create_lattice_multi(BatchOperator, Operator):
     bl_idname = "bd.create_lattice_multi"
     bl_label = "Create Lattice (Per Mesh)"
     bl_options = {"REGISTER", "UNDO"}
 
+    batch_label = "Creating lattices"
+
+    rebuild_all: BoolProperty(
+        name="Rebuild All",
+        description="Recreate every lattice, even those whose mesh bounds, transform and settings are unchanged",
+        default=False,
+        options={'SKIP_SAVE'},
+    )
+
     def invoke(self, context, event):
-        targets = [o for o in context.selected_objects if o.type == 'MESH']
+        self.use_modal = True
+        targets = [o for o in scope.scope_objects(context) if o.type == 'MESH']
         if not targets:
             return self.execute(context)
 
-        existing = [o for o in targets if _existing_lattice_for_mesh(o) is not None]
+        # Lattices whose inputs are unchanged are kept, so only the others need confirming.
+        create_kwargs = _settings_create_kwargs(context.scene.bd_lattice_settings)
+        existing = [
+            o for o in targets
+            if _mesh_lattices(o) and (self.rebuild_all or _reusable_lattice(o, create_kwargs) is None)
+        ]
         if existing:
             self.report(
                 {'WARNING'},
@@ -255,68 +615,197 @@ class BD_OT_create_lattice_multi(Operator):
 
         return self.execute(context)
 
+    def batch_prepare(self, context):
+        settings = context.scene.bd_lattice_settings
+        targets = [o for o in scope.scope_objects(context) if o.type == 'MESH']
+        if not targets:
+            self.report({'WARNING'}, f"No mesh objects in {scope.scope_label(context)}")
+            return None
+
+        context.view_layer.update()
+        self._select_result = not scope.is_collection_scope(context)
+        self._prev_selected = list(context.selected_objects) if self._select_result else []
+        self._prev_active = context.view_layer.objects.active
+        self._create_kwargs = _settings_create_kwargs(settings)
+        self._created = []
+        self._overwritten = 0
+        self._kept = 0
+        self._reinterpolated = 0
+        self._reused = []
+        return targets
+
+    def batch_step(self, context, obj):
+        lat_obj = None if self.rebuild_all else _reusable_lattice(obj, self._create_kwargs)
+        if lat_obj is not None:
+            if _set_interpolation(lat_obj, self._create_kwargs["interpolation"]):
+                self._reinterpolated += 1
+            else:
+                self._kept += 1
+            self._reused.append(lat_obj)
+            return
+
+        # Replace and create per mesh so a stopped batch never leaves a mesh without its lattice.
+        removed = _remove_existing_lattice(obj)
+        if _leave_group_lattices(obj) or removed:
+            self._overwritten += 1
+        lat_obj = _create_lattice_for_mesh(obj, **self._create_kwargs)
+        self._created.append(lat_obj)
+        memstats.add_points(len(lat_obj.data.points))
+
+    def batch_finish(self, context, done, cancelled):
+        if self._select_result:
+            _select_created_lattices(self._created + self._reused, self._prev_selected, self._prev_active)
+
+        if self._overwritten > 0:
+            self.report({'INFO'}, f"Overwritten {self._overwritten} existing lattice(s)")
+
+        message = f"Created {len(self._created)} lattice(s)"
+        if self._kept:
+            message += f", kept {self._kept} unchanged"
+        if self._reinterpolated:
+            message += f", updated interpolation of {self._reinterpolated}"
+        if cancelled:
+            message += f", stopped after {done} of {len(self._batch_items)} mesh(es)"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class BD_OT_create_lattice_group(Operator):
+    bl_idname = "bd.create_lattice_group"
+    bl_label = "Create Lattice (Shared)"
+    bl_description = (
+        "Fit one world-aligned lattice around all meshes in scope and deform them together; "
+        "their previous lattices are replaced"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
     def execute(self, context):
         settings = context.scene.bd_lattice_settings
-        targets = [o for o in context.selected_objects if o.type == 'MESH']
+        targets = [o for o in scope.scope_objects(context) if o.type == 'MESH']
         if not targets:
-            self.report({'WARNING'}, "No mesh objects selected")
+            self.report({'WARNING'}, f"No mesh objects in {scope.scope_label(context)}")
             return {'CANCELLED'}
 
-        overwritten = 0
+        context.view_layer.update()
+        collection = None
+        if scope.is_collection_scope(context):
+            collection = context.scene.bd_scope_settings.collection
+            name = collection.name
+        else:
+            active = context.view_layer.objects.active
+            name = (active if active in targets else targets[0]).name
+
+        replaced = 0
         for obj in targets:
-            if _remove_existing_lattice(obj):
-                overwritten += 1
-
-        count = create_lattice_multi(
-            targets,
-            locked_axis_enabled=bool(getattr(settings, "locked_axis_enabled", True)),
-            base_resolution=int(settings.base_resolution),
-            locked_world_axis=str(settings.locked_world_axis),
-            interpolation=str(settings.interpolation),
+            removed = _remove_existing_lattice(obj)
+            if _leave_group_lattices(obj) or removed:
+                replaced += 1
+
+        try:
+            lat_obj = create_group_lattice(
+                targets,
+                name=name,
+                collection=collection,
+                **_settings_create_kwargs(settings),
+            )
+        except Exception as e:
+            self.report({'ERROR'}, f"Cannot create shared lattice: {e}")
+            return {'CANCELLED'}
+
+        if not scope.is_collection_scope(context):
+            _select_created_lattices([lat_obj], list(context.selected_objects), context.view_layer.objects.active)
+
+        self.report(
+            {'INFO'},
+            f"Created shared lattice '{lat_obj.name}' for {len(targets)} mesh(es)"
+            + (f", replaced lattices of {replaced}" if replaced else ""),
         )
+        return {'FINISHED'}
+
+
+class BD_OT_change_lattice_resolution(Operator):
+    bl_idname = "bd.change_lattice_resolution"
+    bl_label = "Change Resolution"
+    bl_description = "Resize existing lattices to the current Base Resolution, keeping their deformation"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        settings = context.scene.bd_lattice_settings
+        selected = scope.scope_objects(context)
+        if not selected:
+            self.report({'WARNING'}, f"No objects in {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        lattices: set[bpy.types.Object] = set()
+        for obj in selected:
+            if obj.type == 'LATTICE':
+                lattices.add(obj)
+            elif obj.type == 'MESH':
+                lattices.update(_mesh_lattices(obj))
+
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
 
-        if overwritten > 0:
-            self.report({'INFO'}, f"Overwritten {overwritten} existing lattice(s)")
+        changed = 0
+        skipped = 0
+        for lat_obj in lattices:
+            # Blender cannot resize lattices with shape keys or while they are in Edit Mode.
+            if lat_obj.data.shape_keys is not None or lat_obj.mode == 'EDIT':
+                skipped += 1
+                continue
+            try:
+                resolution = target_lattice_resolution(lat_obj, int(settings.base_resolution))
+                if resample_lattice_resolution(lat_obj, resolution):
+                    changed += 1
+            except Exception as e:
+                print(f"BevelDeformer: failed to change resolution for {getattr(lat_obj, 'name', '<unknown>')}: {e}")
 
-        self.report({'INFO'}, f"Created {count} lattice(s)")
+        self.report(
+            {'INFO'},
+            f"Changed resolution of {changed} lattice(s)"
+            + (f", skipped {skipped} (shape keys or Edit Mode)" if skipped else ""),
+        )
         return {'FINISHED'}
 
 
-class BD_OT_delete_lattice(Operator):
+class BD_OT_delete_lattice(BatchOperator, Operator):
     bl_idname = "bd.delete_lattice"
     bl_label = "Delete Lattice"
     bl_options = {"REGISTER", "UNDO"}
 
-    def execute(self, context):
-        selected = list(context.selected_objects)
+    batch_label = "Deleting lattices"
+
+    def batch_prepare(self, context):
+        selected = scope.scope_objects(context)
         if not selected:
-            self.report({'WARNING'}, "No objects selected")
-            return {'CANCELLED'}
+            self.report({'WARNING'}, f"No objects in {scope.scope_label(context)}")
+            return None
 
         lattices_to_delete = set()
         for obj in selected:
             if obj.type == 'MESH':
-                existing = _existing_lattice_for_mesh(obj)
-                if existing is not None:
-                    lattices_to_delete.add(existing)
+                lattices_to_delete.update(_mesh_lattices(obj))
             elif obj.type == 'LATTICE':
                 lattices_to_delete.add(obj)
 
         if not lattices_to_delete:
-            self.report({'WARNING'}, "No lattices found for selected objects")
-            return {'CANCELLED'}
-
-        deleted = 0
-        for lat_obj in list(lattices_to_delete):
-            try:
-                if _delete_lattice_object(lat_obj):
-                    deleted += 1
-            except Exception as e:
-                print(
-                    f"BevelDeformer: failed to delete lattice {getattr(lat_obj, 'name', '<unknown>')}: {e}"
-                )
-
-        self.report({'INFO'}, f"Deleted {deleted} lattice(s)")
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return None
+
+        self._users = scope.lattice_users(lattices_to_delete)
+        self._deleted = 0
+        return list(lattices_to_delete)
+
+    def batch_step(self, context, lat_obj):
+        if _delete_lattice_object(lat_obj, self._users[lat_obj]):
+            self._deleted += 1
+
+    def batch_finish(self, context, done, cancelled):
+        message = f"Deleted {self._deleted} lattice(s)"
+        if cancelled:
+            message += f", stopped with {len(self._batch_items) - done} left"
+        self.report({'INFO'}, message)
         return {'FINISHED'}
 
 
@@ -329,9 +818,9 @@ class BD_OT_apply_lattice_interpolation(Operator):
         settings = context.scene.bd_lattice_settings
         interpolation = str(settings.interpolation)
 
-        selected = list(context.selected_objects)
+        selected = scope.scope_objects(context)
         if not selected:
-            self.report({'WARNING'}, "No objects selected")
+            self.report({'WARNING'}, f"No objects in {scope.scope_label(context)}")
             return {'CANCELLED'}
 
         lattices: set[bpy.types.Object] = set()
@@ -339,12 +828,10 @@ class BD_OT_apply_lattice_interpolation(Operator):
             if obj.type == 'LATTICE':
                 lattices.add(obj)
             elif obj.type == 'MESH':
-                existing = _existing_lattice_for_mesh(obj)
-                if existing is not None:
-                    lattices.add(existing)
+                lattices.update(_mesh_lattices(obj))
 
         if not lattices:
-            self.report({'WARNING'}, "No lattices found for selected objects")
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
             return {'CANCELLED'}
 
         changed = 0
@@ -354,6 +841,7 @@ class BD_OT_apply_lattice_interpolation(Operator):
                 lat_data.interpolation_type_u = interpolation
                 lat_data.interpolation_type_v = interpolation
                 lat_data.interpolation_type_w = interpolation
+                influence.mark_dirty(lat_obj)
                 changed += 1
             except Exception as e:
                 print(f"BevelDeformer: failed to set interpolation for {getattr(lat_obj, 'name', '<unknown>')}: {e}")
@@ -362,129 +850,86 @@ class BD_OT_apply_lattice_interpolation(Operator):
         return {'FINISHED'}
 
 
-class BD_OT_apply_lattice(Operator):
+class BD_OT_apply_lattice(BatchOperator, Operator):
     bl_idname = "bd.apply_lattice"
     bl_label = "Apply Lattice"
     bl_options = {"REGISTER", "UNDO"}
 
-    def execute(self, context):
-        selected = list(context.selected_objects)
-        if not selected:
-            self.report({'WARNING'}, "No objects selected")
-            return {'CANCELLED'}
-
-        prev_selected = list(context.selected_objects)
-        prev_active = context.view_layer.objects.active
-
-        try:
-            if context.mode != 'OBJECT':
-                try:
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                except Exception:
-                    pass
-
-            meshes: set[bpy.types.Object] = set()
-            lattices: set[bpy.types.Object] = set()
-
-            for obj in selected:
-                if obj.type == 'MESH':
-                    meshes.add(obj)
-                    for mod in obj.modifiers:
-                        if mod.type == 'LATTICE' and mod.object is not None:
-                            lattices.add(mod.object)
-                elif obj.type == 'LATTICE':
-                    lattices.add(obj)
-
-            if lattices and not meshes:
-                for lat in list(lattices):
-                    for m in _find_meshes_using_lattice(lat):
-                        meshes.add(m)
-
-            if not meshes:
-                self.report({'WARNING'}, "No mesh objects found to apply")
-                return {'CANCELLED'}
-
-            applied_mods = 0
-            for mesh_obj in meshes:
-                if mesh_obj.type != 'MESH':
-                    continue
-
-                try:
-                    for obj in context.selected_objects:
-                        obj.select_set(False)
-                except Exception:
-                    pass
-
-                try:
-                    mesh_obj.select_set(True)
-                    context.view_layer.objects.active = mesh_obj
-                except Exception:
-                    continue
-
-                for mod in list(_iter_lattice_modifiers(mesh_obj)):
-                    lat_obj = mod.object
-                    if lat_obj is None:
-                        continue
-
-                    if lattices and lat_obj not in lattices:
-                        continue
-
-                    try:
-                        bpy.ops.object.modifier_apply(modifier=mod.name)
-                        applied_mods += 1
-                    except Exception as e:
-                        print(
-                            "BevelDeformer: failed to apply modifier "
-                            f"{mod.name} on {getattr(mesh_obj, 'name', '<unknown>')}: {e}"
-                        )
-
-            deleted_lattices = 0
-            skipped_lattices = 0
-            for lat_obj in list(lattices):
-                try:
-                    still_used = False
-                    for m in _find_meshes_using_lattice(lat_obj):
-                        still_used = True
-                        break
-
-                    if still_used:
-                        skipped_lattices += 1
-                        continue
-
-                    if _delete_lattice_object(lat_obj):
-                        deleted_lattices += 1
-                except Exception as e:
-                    print(
-                        "BevelDeformer: failed to delete lattice "
-                        f"{getattr(lat_obj, 'name', '<unknown>')}: {e}"
-                    )
+    batch_label = "Applying lattices"
 
-            self.report(
-                {'INFO'},
-                f"Applied {applied_mods} modifier(s), deleted {deleted_lattices} lattice(s)"
-                + (f", skipped {skipped_lattices} (still used)" if skipped_lattices else ""),
-            )
-            return {'FINISHED'}
+    def batch_prepare(self, context):
+        selected = scope.scope_objects(context)
+        if not selected:
+            self.report({'WARNING'}, f"No objects in {scope.scope_label(context)}")
+            return None
 
-        finally:
+        if context.mode != 'OBJECT':
             try:
-                for obj in context.selected_objects:
-                    obj.select_set(False)
-            except Exception:
-                pass
-            for obj in prev_selected:
-                try:
-                    obj.select_set(True)
-                except Exception:
-                    pass
-            try:
-                context.view_layer.objects.active = prev_active
+                bpy.ops.object.mode_set(mode='OBJECT')
             except Exception:
                 pass
 
+        meshes: set[bpy.types.Object] = set()
+        lattices: set[bpy.types.Object] = set()
+
+        for obj in selected:
+            if obj.type == 'MESH':
+                meshes.add(obj)
+                for mod in obj.modifiers:
+                    if mod.type == 'LATTICE' and mod.object is not None:
+                        lattices.add(mod.object)
+            elif obj.type == 'LATTICE':
+                lattices.add(obj)
+
+        if lattices and not meshes:
+            for users in scope.lattice_users(lattices).values():
+                meshes.update(users)
+
+        # A shared lattice is applied to all of its members, not just the selected ones.
+        group = [lat_obj for lat_obj in lattices if is_group_lattice(lat_obj)]
+        if group:
+            for lat_obj, users in scope.lattice_users(group).items():
+                meshes.update(users)
+                meshes.update(group_members(lat_obj))
+
+        meshes = [obj for obj in meshes if obj.type == 'MESH']
+        linked = [obj for obj in meshes if is_linked_mesh(obj)]
+        meshes = [obj for obj in meshes if not is_linked_mesh(obj)]
+        if not meshes:
+            if linked:
+                self.report({'WARNING'}, f"{len(linked)} mesh(es) use linked data; append them to apply")
+            else:
+                self.report({'WARNING'}, "No mesh objects found to apply")
+            return None
+
+        self._lattices = lattices
+        self._linked_meshes = len(linked)
+        self._fast_apply = bool(getattr(context.scene.bd_lattice_settings, "fast_apply", False))
+        self._applied_mods = 0
+        return meshes
+
+    def batch_step(self, context, mesh_obj):
+        self._applied_mods += apply_lattice_modifiers(context, mesh_obj, self._lattices, fast=self._fast_apply)
+
+    def batch_finish(self, context, done, cancelled):
+        # Only lattices nobody uses any more are deleted, so a stopped batch keeps
+        # the lattices of the meshes it did not reach.
+        deleted_lattices, skipped_lattices = delete_unused_lattices(self._lattices)
+
+        self.report(
+            {'INFO'},
+            f"Applied {self._applied_mods} modifier(s), deleted {deleted_lattices} lattice(s)"
+            + (f", skipped {skipped_lattices} (still used)" if skipped_lattices else "")
+            + (f", skipped {self._linked_meshes} linked mesh(es)" if self._linked_meshes else "")
+            + (f", stopped after {done} of {len(self._batch_items)} mesh(es)" if cancelled else ""),
+        )
+        return {'FINISHED'}
+
 
 _classes = (
     BD_OT_create_lattice_multi,
+    BD_OT_create_lattice_group,
+    BD_OT_change_lattice_resolution,
     BD_OT_delete_lattice,
     BD_OT_apply_lattice_interpolation,
     BD_OT_apply_lattice,
@@ -0,0 +1,460 @@
+import json
+import uuid
+from functools import lru_cache
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from bpy.props import StringProperty
+from bpy.types import Operator
+
+from . import ffd, kernels, memstats, scope, stages
+from .deform_ops import (
+    chain_memo_key,
+    gather_target_lattices,
+    get_lattice_locked_axis,
+    lattice_resolution,
+    write_co_deform,
+)
+
+
+# A lattice with a layer stack gets its points from the uniform grid plus the sum
+# of its enabled layers' displacements. Stage layers keep a chain and its values
+# and are recomputed on demand; displacement layers store only the points they
+# move (indices plus xyz offsets). Prefix sums of the stack are cached per lattice,
+# so editing a layer recomputes only that layer and the ones above it.
+
+LAYERS_KEY = "bd_layers"
+DEFAULT_LAYER = "Bevel"
+# Points written from outside the stack (snapshots, imported cages) land here.
+EDITS_LAYER = "Edits"
+STAGES = "STAGES"
+DISPLACEMENT = "DISPLACEMENT"
+EDIT_TOLERANCE = 1e-6
+
+# lattice name -> (resolution, layer signatures, prefix composites)
+_composites: dict[str, tuple[tuple[int, int, int], list[tuple], list[np.ndarray]]] = {}
+
+
+def read_layers(lat_obj) -> list[dict]:
+    """The lattice's stack, bottom first."""
+    raw = lat_obj.get(LAYERS_KEY)
+    if not raw:
+        return []
+    try:
+        return list(json.loads(raw))
+    except (TypeError, ValueError):
+        return []
+
+
+def has_layers(lat_obj) -> bool:
+    return bool(read_layers(lat_obj))
+
+
+def _write_layers(lat_obj, layers: list[dict]) -> None:
+    lat_obj[LAYERS_KEY] = json.dumps(layers)
+
+
+def _find(layers: list[dict], name: str) -> dict | None:
+    return next((layer for layer in layers if layer["name"] == name), None)
+
+
+def _data_keys(layer: dict) -> tuple[str, str]:
+    return f"bd_layer_{layer['key']}_index", f"bd_layer_{layer['key']}_delta"
+
+
+def _locked_idx(lat_obj) -> int:
+    locked_enabled, locked_idx = get_lattice_locked_axis(lat_obj)
+    return int(locked_idx) if locked_enabled and locked_idx is not None else -1
+
+
+def _signature(layer: dict, locked_idx: int) -> tuple:
+    if not layer.get("enabled", True):
+        return (layer["key"], False)
+    if layer["kind"] == STAGES:
+        return (layer["key"], True, tuple(layer["chain"]), locked_idx, tuple(sorted(layer["params"].items())))
+    return (layer["key"], True, layer["token"])
+
+
+@lru_cache(maxsize=stages._MEMO_SIZE)
+def _stage_delta(
+    resolution: tuple[int, int, int],
+    locked_idx: int,
+    chain: tuple[str, ...],
+    params: tuple[tuple[str, float], ...],
+) -> np.ndarray:
+    co = stages.uniform_chain(resolution, locked_idx, ("reset",) + chain, params)
+    delta = (co - kernels.uniform_coords(resolution)).ravel()
+    delta.setflags(write=False)
+    return delta
+
+
+def _displacement(lat_obj, layer: dict, count: int) -> np.ndarray | None:
+    if int(layer.get("points", -1)) != count:
+        return None
+    index_key, delta_key = _data_keys(layer)
+    index = np.asarray(lat_obj.get(index_key, ()), dtype=np.intp)
+    delta = np.zeros((count, 3), dtype=np.float32)
+    if index.size:
+        delta[index] = np.asarray(lat_obj[delta_key], dtype=np.float32).reshape(-1, 3)
+    return delta.ravel()
+
+
+def _layer_delta(lat_obj, layer: dict, resolution: tuple[int, int, int], locked_idx: int) -> np.ndarray | None:
+    if not layer.get("enabled", True):
+        return None
+    if layer["kind"] == STAGES:
+        chain = tuple(name for name in layer["chain"] if name in stages.STAGES)
+        return _stage_delta(resolution, locked_idx, chain, tuple(sorted(layer["params"].items())))
+    # Written for another resolution (and not resampled): nothing to add.
+    return _displacement(lat_obj, layer, resolution[0] * resolution[1] * resolution[2])
+
+
+def composite(lat_obj) -> np.ndarray:
+    """Flat float32 points of the whole stack; unchanged bottom layers come from the cache."""
+    resolution = lattice_resolution(lat_obj)
+    locked_idx = _locked_idx(lat_obj)
+    layers = read_layers(lat_obj)
+    signatures = [_signature(layer, locked_idx) for layer in layers]
+
+    prefix: list[np.ndarray] = []
+    cached = _composites.get(lat_obj.name)
+    if cached is not None and cached[0] == resolution:
+        for signature, old_signature, total in zip(signatures, cached[1], cached[2]):
+            if signature != old_signature:
+                break
+            prefix.append(total)
+
+    total = prefix[-1] if prefix else kernels.uniform_coords(resolution).ravel()
+    for layer in layers[len(prefix):]:
+        delta = _layer_delta(lat_obj, layer, resolution, locked_idx)
+        if delta is not None:
+            total = total + delta
+            total.setflags(write=False)
+        prefix.append(total)
+
+    _composites[lat_obj.name] = (resolution, signatures, prefix)
+    return total
+
+
+def rebuild(lat_obj) -> None:
+    write_co_deform(lat_obj, composite(lat_obj))
+
+
+def check_stage_layer(lattices, name: str) -> None:
+    """Raise ValueError when ``name`` holds captured edits on one of ``lattices``."""
+    for lat_obj in lattices:
+        layer = _find(read_layers(lat_obj), name)
+        if layer is not None and layer["kind"] != STAGES:
+            raise ValueError(f"{lat_obj.name}: layer '{name}' holds captured edits, not sliders")
+
+
+def set_stage_layer(lat_obj, name: str, chain: tuple[str, ...], params: dict) -> bool:
+    """Create or update the stage layer ``name``; returns False when nothing changed.
+
+    A displacement layer of that name is not overwritten: ValueError is raised instead.
+    """
+    check_stage_layer([lat_obj], name)
+    layers = read_layers(lat_obj)
+    values = dict(chain_memo_key(("reset",) + tuple(chain), params))
+    layer = _find(layers, name)
+    if layer is None:
+        layer = {"name": name, "key": uuid.uuid4().hex[:12], "enabled": True}
+        layers.append(layer)
+    elif layer["chain"] == list(chain) and layer["params"] == values:
+        return False
+
+    layer.update(kind=STAGES, chain=list(chain), params=values)
+    _write_layers(lat_obj, layers)
+    return True
+
+
+def _store_displacement(lat_obj, layer: dict, delta: np.ndarray) -> int:
+    delta = np.asarray(delta, dtype=np.float32).reshape(-1, 3)
+    index = np.flatnonzero(np.abs(delta).max(axis=1) > EDIT_TOLERANCE)
+    index_key, delta_key = _data_keys(layer)
+    lat_obj[index_key] = index.tolist()
+    lat_obj[delta_key] = delta[index].ravel().tolist()
+    # A fresh token per write tells the composite cache that the data changed.
+    layer.update(kind=DISPLACEMENT, points=len(delta), token=uuid.uuid4().hex[:12])
+    return int(index.size)
+
+
+def _drop_data(lat_obj, layer: dict) -> None:
+    for key in _data_keys(layer):
+        if key in lat_obj:
+            del lat_obj[key]
+
+
+def capture_edits(lat_obj, name: str) -> int:
+    """Move the difference between the current points and the stack into displacement layer ``name``.
+
+    Edits are added to the layer if it already holds displacements. Returns the number
+    of points the layer moves afterwards (0 when there was nothing to capture).
+    """
+    count = len(lat_obj.data.points)
+    current = np.empty(count * 3, dtype=np.float32)
+    lat_obj.data.points.foreach_get("co_deform", current)
+    edits = current - composite(lat_obj)
+    if not (np.abs(edits) > EDIT_TOLERANCE).any():
+        return 0
+
+    layers = read_layers(lat_obj)
+    layer = _find(layers, name)
+    if layer is None:
+        layer = {"name": name, "key": uuid.uuid4().hex[:12], "enabled": True}
+        layers.append(layer)
+    elif layer["kind"] == DISPLACEMENT and layer.get("enabled", True):
+        previous = _displacement(lat_obj, layer, count)
+        if previous is not None:
+            edits = edits + previous
+    else:
+        # Turning a stage layer (or a hidden one) into edits would fold its offsets in twice.
+        raise ValueError(f"layer '{name}' is a stage layer or disabled")
+
+    moved = _store_displacement(lat_obj, layer, edits)
+    _write_layers(lat_obj, layers)
+    return moved
+
+
+def check_edits_layer(lat_obj) -> None:
+    """Raise ValueError when ``write_points`` could not keep the stack of ``lat_obj`` in step."""
+    layer = _find(read_layers(lat_obj), EDITS_LAYER)
+    if layer is not None and (layer["kind"] != DISPLACEMENT or not layer.get("enabled", True)):
+        raise ValueError(f"{lat_obj.name}: layer '{EDITS_LAYER}' is a stage layer or disabled")
+
+
+def write_points(lat_obj, co) -> None:
+    """Write ``co`` as the lattice's points.
+
+    On a lattice with a stack the difference to the stack is captured in layer
+    ``EDITS_LAYER``, so the next rebuild keeps the shape. Raises ValueError, before
+    writing, when that layer cannot take it.
+    """
+    layered = has_layers(lat_obj)
+    if layered:
+        check_edits_layer(lat_obj)
+    write_co_deform(lat_obj, co)
+    if layered:
+        capture_edits(lat_obj, EDITS_LAYER)
+
+
+def remove_layer(lat_obj, name: str) -> bool:
+    layers = read_layers(lat_obj)
+    layer = _find(layers, name)
+    if layer is None:
+        return False
+    _drop_data(lat_obj, layer)
+    layers.remove(layer)
+    if layers:
+        _write_layers(lat_obj, layers)
+    else:
+        del lat_obj[LAYERS_KEY]
+        _composites.pop(lat_obj.name, None)
+    return True
+
+
+def set_layer_enabled(lat_obj, name: str, enabled: bool) -> bool:
+    layers = read_layers(lat_obj)
+    layer = _find(layers, name)
+    if layer is None or bool(layer.get("enabled", True)) == bool(enabled):
+        return False
+    layer["enabled"] = bool(enabled)
+    _write_layers(lat_obj, layers)
+    return True
+
+
+def flatten(lat_obj) -> bool:
+    """Drop the stack and keep the current points as plain lattice data."""
+    layers = read_layers(lat_obj)
+    if not layers:
+        return False
+    for layer in layers:
+        _drop_data(lat_obj, layer)
+    del lat_obj[LAYERS_KEY]
+    _composites.pop(lat_obj.name, None)
+    return True
+
+
+def resample(lat_obj, old_res: tuple[int, int, int], new_res: tuple[int, int, int]) -> None:
+    """Carry displacement layers over to a new resolution (stage layers are recomputed anyway)."""
+    layers = read_layers(lat_obj)
+    count = old_res[0] * old_res[1] * old_res[2]
+    changed = False
+    new_rest = ffd.rest_coords(*new_res)
+    for layer in layers:
+        if layer["kind"] != DISPLACEMENT:
+            continue
+        delta = _displacement(lat_obj, layer, count)
+        if delta is None:
+            continue
+        field = ffd.rest_coords(*old_res) + delta.reshape(-1, 3)
+        _store_displacement(lat_obj, layer, ffd.deform_points(new_rest, field, old_res, "KEY_LINEAR") - new_rest)
+        changed = True
+    if changed:
+        _write_layers(lat_obj, layers)
+
+
+def target_layer(scene) -> str:
+    """The layer sliders write to: the Layer field, or the default name when it is empty."""
+    settings = getattr(scene, "bd_layer_settings", None)
+    name = settings.name.strip() if settings is not None else ""
+    return name or DEFAULT_LAYER
+
+
+def save_stacks(lattices) -> dict:
+    """The raw stacks of ``lattices``, for ``restore_stacks`` (e.g. when a drag is cancelled)."""
+    return {lat_obj: lat_obj.get(LAYERS_KEY) for lat_obj in lattices}
+
+
+def restore_stacks(saved: dict) -> None:
+    for lat_obj, raw in saved.items():
+        if raw:
+            lat_obj[LAYERS_KEY] = raw
+        elif LAYERS_KEY in lat_obj:
+            del lat_obj[LAYERS_KEY]
+
+
+def deform_into_layer(lattices, name: str, chain: tuple[str, ...], params: dict) -> int:
+    """Set stage layer ``name`` on every lattice and write the new composites.
+
+    Raises ValueError, before changing anything, when ``name`` is a displacement layer
+    on one of them.
+    """
+    check_stage_layer(lattices, name)
+    for lat_obj in lattices:
+        set_stage_layer(lat_obj, name, chain, params)
+        rebuild(lat_obj)
+    return len(lattices)
+
+
+def layer_names(lattices) -> list[tuple[str, bool]]:
+    """(name, enabled) of the layers found on ``lattices``, in stack order."""
+    names: dict[str, bool] = {}
+    for lat_obj in lattices:
+        for layer in read_layers(lat_obj):
+            names[layer["name"]] = names.get(layer["name"], False) or bool(layer.get("enabled", True))
+    return list(names.items())
+
+
+def clear_cache() -> None:
+    _composites.clear()
+    _stage_delta.cache_clear()
+
+
+@persistent
+def _clear_cache_on_load(*_args) -> None:
+    clear_cache()
+
+
+def _target_lattices(context) -> list[bpy.types.Object]:
+    return gather_target_lattices(scope.scope_objects(context))
+
+
+class BD_OT_capture_edit_layer(Operator):
+    bl_idname = "bd.capture_edit_layer"
+    bl_label = "Capture Edits"
+    bl_description = "Store how the target lattices differ from their layer stack (e.g. hand edits) in the named layer"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @memstats.tracked
+    def execute(self, context):
+        name = context.scene.bd_layer_settings.name.strip()
+        if not name:
+            self.report({'WARNING'}, "Layer name is empty")
+            return {'CANCELLED'}
+        lattices = _target_lattices(context)
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        captured = 0
+        for lat_obj in lattices:
+            try:
+                if capture_edits(lat_obj, name):
+                    captured += 1
+            except ValueError as e:
+                self.report({'ERROR'}, f"{lat_obj.name}: {e}")
+                return {'CANCELLED'}
+        self.report({'INFO'}, f"Captured edits of {captured} lattice(s) in layer '{name}'")
+        return {'FINISHED'}
+
+
+class BD_OT_toggle_deform_layer(Operator):
+    bl_idname = "bd.toggle_deform_layer"
+    bl_label = "Toggle Layer"
+    bl_description = "Enable or disable the layer on the target lattices"
+    bl_options = {"REGISTER", "UNDO"}
+
+    name: StringProperty(name="Layer", default="", options={'SKIP_SAVE'})
+
+    @memstats.tracked
+    def execute(self, context):
+        lattices = [lat for lat in _target_lattices(context) if _find(read_layers(lat), self.name) is not None]
+        if not lattices:
+            self.report({'WARNING'}, f"No target lattice has layer '{self.name}'")
+            return {'CANCELLED'}
+        enabled = not any(_find(read_layers(lat), self.name).get("enabled", True) for lat in lattices)
+        for lat_obj in lattices:
+            set_layer_enabled(lat_obj, self.name, enabled)
+            rebuild(lat_obj)
+        return {'FINISHED'}
+
+
+class BD_OT_remove_deform_layer(Operator):
+    bl_idname = "bd.remove_deform_layer"
+    bl_label = "Remove Layer"
+    bl_description = "Remove the layer from the target lattices and rebuild them from the remaining layers"
+    bl_options = {"REGISTER", "UNDO"}
+
+    name: StringProperty(name="Layer", default="", options={'SKIP_SAVE'})
+
+    @memstats.tracked
+    def execute(self, context):
+        removed = 0
+        for lat_obj in _target_lattices(context):
+            if remove_layer(lat_obj, self.name):
+                rebuild(lat_obj)
+                removed += 1
+        if not removed:
+            self.report({'WARNING'}, f"No target lattice has layer '{self.name}'")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Removed layer '{self.name}' from {removed} lattice(s)")
+        return {'FINISHED'}
+
+
+class BD_OT_flatten_deform_layers(Operator):
+    bl_idname = "bd.flatten_deform_layers"
+    bl_label = "Flatten Layers"
+    bl_description = "Drop the layer stacks of the target lattices, keeping their current shape"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        count = sum(1 for lat_obj in _target_lattices(context) if flatten(lat_obj))
+        if not count:
+            self.report({'WARNING'}, f"No layer stacks found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Flattened {count} lattice(s)")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_capture_edit_layer,
+    BD_OT_toggle_deform_layer,
+    BD_OT_remove_deform_layer,
+    BD_OT_flatten_deform_layers,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+    bpy.app.handlers.load_pre.append(_clear_cache_on_load)
+
+
+def unregister() -> None:
+    if _clear_cache_on_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(_clear_cache_on_load)
+    clear_cache()
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
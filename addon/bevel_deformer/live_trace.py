@@ -0,0 +1,427 @@
+import json
+import math
+import time
+from dataclasses import dataclass, field
+
+import bpy
+from bpy.types import Operator
+
+from . import scope, stages
+
+
+# Live Preview traces: a timestamped stream of slider changes (only the settings
+# that changed, plus the size of the target selection) and of the live ticks that
+# ran, recorded during a real session. ``replay`` feeds the changes back against a
+# synthetic scene through the real schedule_live_update -> _live_update_timer ->
+# _apply_live_update path, on a virtual clock that advances by each tick's
+# measured cost, so a change to the timer logic can be judged on real traces.
+
+_FORMAT_VERSION = 1
+_REPLAY_COLLECTION = "BD_Replay"
+LATENCY_BUCKETS_MS = (50, 100, 200, 400, 800, 1600)
+
+_events: list[dict] | None = None
+_t0 = 0.0
+_last_state: dict = {}
+
+
+def traced_settings() -> tuple[str, ...]:
+    names = {"stage_chain", "reset_to_uniform"}
+    for stage in stages.STAGES.values():
+        names.update(stage.inputs)
+    return tuple(sorted(names))
+
+
+def _settings_state(settings) -> dict:
+    state = {}
+    for name in traced_settings():
+        value = getattr(settings, name, None)
+        if isinstance(value, (bool, int, float, str)):
+            state[name] = value
+    return state
+
+
+def is_recording() -> bool:
+    return _events is not None
+
+
+def start_recording(context) -> None:
+    global _events, _t0, _last_state
+    _events = []
+    _t0 = time.monotonic()
+    _last_state = {}
+
+
+def stop_recording() -> dict | None:
+    """Stop and return the trace (None when nothing was being recorded)."""
+    global _events
+    events, _events = _events, None
+    if events is None:
+        return None
+    from . import deform_ops
+
+    return {
+        "version": _FORMAT_VERSION,
+        "interval": deform_ops._LIVE_UPDATE_INTERVAL_SEC,
+        "events": events,
+    }
+
+
+def record_change(context) -> None:
+    global _last_state
+    if _events is None:
+        return
+    from . import deform_ops
+
+    try:
+        state = _settings_state(context.scene.bd_deform_settings)
+        lattices = deform_ops.gather_target_lattices(scope.scope_objects(context))
+        points = sum(len(lat.data.points) for lat in lattices)
+    except Exception as e:
+        print(f"BevelDeformer: trace recording failed: {e}")
+        return
+
+    changed = {name: value for name, value in state.items() if _last_state.get(name) != value}
+    _last_state = state
+    _events.append({
+        "t": round(time.monotonic() - _t0, 6),
+        "type": "change",
+        "params": changed,
+        "lattices": len(lattices),
+        "points": points,
+    })
+
+
+def record_tick(duration: float) -> None:
+    if _events is None:
+        return
+    _events.append({
+        "t": round(time.monotonic() - _t0, 6),
+        "type": "tick",
+        "duration": round(float(duration), 6),
+    })
+
+
+def save_trace(trace: dict, filepath: str) -> None:
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(trace, f)
+
+
+def load_trace(filepath: str) -> dict:
+    with open(filepath, encoding="utf-8") as f:
+        trace = json.load(f)
+    if int(trace.get("version", 0)) != _FORMAT_VERSION:
+        raise ValueError(f"unsupported trace version {trace.get('version')}")
+    return trace
+
+
+@dataclass
+class ReplayReport:
+    changes: int = 0
+    ticks: int = 0
+    missed_ticks: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+    tick_ms: list[float] = field(default_factory=list)
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Slider changes folded into one live tick on average."""
+        return self.changes / self.ticks if self.ticks else 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(math.ceil(q / 100.0 * len(ordered))) - 1)]
+
+    def histogram(self) -> dict[str, int]:
+        bins = {f"<{edge}ms": 0 for edge in LATENCY_BUCKETS_MS}
+        bins[f">={LATENCY_BUCKETS_MS[-1]}ms"] = 0
+        for value in self.latencies_ms:
+            for edge in LATENCY_BUCKETS_MS:
+                if value < edge:
+                    bins[f"<{edge}ms"] += 1
+                    break
+            else:
+                bins[f">={LATENCY_BUCKETS_MS[-1]}ms"] += 1
+        return bins
+
+    def format(self) -> list[str]:
+        lines = [
+            f"{self.changes} change(s), {self.ticks} tick(s), coalescing {self.coalescing_ratio:.2f}, "
+            f"missed {self.missed_ticks} tick(s)",
+            f"latency p50 {self.percentile(50):.1f} ms, p90 {self.percentile(90):.1f} ms, "
+            f"p99 {self.percentile(99):.1f} ms, max {max(self.latencies_ms, default=0.0):.1f} ms",
+        ]
+        if self.tick_ms:
+            lines.append(f"tick cost mean {sum(self.tick_ms) / len(self.tick_ms):.2f} ms, max {max(self.tick_ms):.2f} ms")
+        lines.append("histogram: " + ", ".join(f"{k} {v}" for k, v in self.histogram().items()))
+        return lines
+
+
+def recorded_report(trace: dict) -> ReplayReport:
+    """The same metrics as ``replay`` computed from the recorded ticks alone."""
+    report = ReplayReport()
+    interval = float(trace.get("interval", 0.15))
+    pending: list[float] = []
+    for event in trace["events"]:
+        if event["type"] == "change":
+            report.changes += 1
+            pending.append(float(event["t"]))
+        elif event["type"] == "tick":
+            duration = float(event["duration"])
+            report.ticks += 1
+            report.tick_ms.append(duration * 1000.0)
+            report.missed_ticks += duration > interval
+            end = float(event["t"])
+            report.latencies_ms.extend((end - t) * 1000.0 for t in pending)
+            pending.clear()
+    return report
+
+
+class _VirtualTimers:
+    """Stands in for bpy.app.timers; callbacks are run by ``replay`` at their due time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.due: dict = {}
+
+    def clock(self) -> float:
+        return self.now
+
+    def register(self, func, first_interval=0.0, persistent=False):
+        self.due[func] = self.now + float(first_interval)
+
+    def is_registered(self, func) -> bool:
+        return func in self.due
+
+    def unregister(self, func):
+        self.due.pop(func, None)
+
+    def next_due(self):
+        if not self.due:
+            return None, math.inf
+        func = min(self.due, key=self.due.get)
+        return func, self.due[func]
+
+
+def _resolution_for(points_per_lattice: float) -> tuple[int, int, int]:
+    side = max(2, int(round(math.sqrt(max(points_per_lattice, 8.0) / 2.0))))
+    return side, side, 2
+
+
+def build_replay_scene(
+    context, count: int, resolution: tuple[int, int, int]
+) -> tuple[bpy.types.Collection, list[bpy.types.Object]]:
+    """Synthetic lattices (no meshes) in a temporary collection."""
+    collection = bpy.data.collections.new(_REPLAY_COLLECTION)
+    context.scene.collection.children.link(collection)
+    lattices = []
+    for i in range(count):
+        lat_data = bpy.data.lattices.new(f"{_REPLAY_COLLECTION}_{i:04d}_Data")
+        lat_data.points_u, lat_data.points_v, lat_data.points_w = resolution
+        lat_obj = bpy.data.objects.new(f"{_REPLAY_COLLECTION}_{i:04d}", lat_data)
+        collection.objects.link(lat_obj)
+        lattices.append(lat_obj)
+    return collection, lattices
+
+
+def _remove_replay_scene(collection, lattices) -> None:
+    for lat_obj in lattices:
+        lat_data = lat_obj.data
+        bpy.data.objects.remove(lat_obj, do_unlink=True)
+        if lat_data is not None and getattr(lat_data, "users", 0) == 0:
+            bpy.data.lattices.remove(lat_data)
+    bpy.data.collections.remove(collection)
+
+
+def replay(context, trace: dict, *, max_lattices: int | None = None) -> ReplayReport:
+    """Replay the trace's changes through the live update loop on a synthetic scene.
+
+    Changes arrive at their recorded times, except while a tick is running: the UI
+    is blocked then, so they are delivered when it ends. A change's latency runs from
+    its recorded time to the end of the tick that picked it up; a tick is missed
+    when it takes longer than the timer interval. Scene settings, selection and the
+    scope are restored afterwards.
+    """
+    from . import deform_ops
+
+    if is_recording():
+        raise RuntimeError("stop trace recording before replaying")
+
+    changes = [e for e in trace["events"] if e["type"] == "change"]
+    report = ReplayReport()
+    if not changes:
+        return report
+
+    largest = max(changes, key=lambda e: int(e.get("lattices", 0)))
+    count = max(1, int(largest.get("lattices", 1)))
+    if max_lattices is not None:
+        count = min(count, int(max_lattices))
+    resolution = _resolution_for(int(largest.get("points", 0)) / max(1, int(largest.get("lattices", 1))))
+
+    settings = context.scene.bd_deform_settings
+    scope_settings = context.scene.bd_scope_settings
+    saved_state = _settings_state(settings)
+    saved_live = bool(settings.live_preview)
+    saved_scope = scope_settings.mode
+    saved_selection = list(context.selected_objects)
+    saved_active = context.view_layer.objects.active
+    saved_loop = (
+        deform_ops._clock, deform_ops._timer_api,
+        deform_ops._live_update_pending, deform_ops._live_update_timer_running,
+    )
+
+    timers = _VirtualTimers()
+    deform_ops._clock = timers.clock
+    deform_ops._timer_api = timers
+    deform_ops._live_update_pending = False
+    deform_ops._live_update_timer_running = False
+
+    collection, lattices = build_replay_scene(context, count, resolution)
+    try:
+        for obj in saved_selection:
+            obj.select_set(False)
+        scope_settings.mode = 'SELECTION'
+        settings.live_preview = True
+        # Only the trace's own changes may schedule ticks.
+        deform_ops._live_update_pending = False
+        timers.due.clear()
+
+        interval = deform_ops._LIVE_UPDATE_INTERVAL_SEC
+        waiting: list[float] = []
+        selected = 0
+        index = 0
+        while index < len(changes) or timers.due:
+            func, due = timers.next_due()
+            event = changes[index] if index < len(changes) else None
+            if event is not None and float(event["t"]) <= due:
+                timers.now = max(timers.now, float(event["t"]))
+                wanted = min(count, int(event.get("lattices", count)))
+                for lat_obj in lattices[selected:wanted]:
+                    lat_obj.select_set(True)
+                for lat_obj in lattices[wanted:selected]:
+                    lat_obj.select_set(False)
+                selected = wanted
+                for name, value in event["params"].items():
+                    if hasattr(settings, name):
+                        setattr(settings, name, value)
+                # Setting a slider normally schedules the update; make sure it did.
+                if not deform_ops._live_update_pending:
+                    deform_ops.schedule_live_update(context)
+                waiting.append(float(event["t"]))
+                report.changes += 1
+                index += 1
+                continue
+
+            timers.now = max(timers.now, due)
+            del timers.due[func]
+            is_tick = func is deform_ops._live_update_timer and deform_ops._live_update_pending
+            start = time.perf_counter()
+            next_interval = func()
+            cost = time.perf_counter() - start
+            timers.now += cost
+            if is_tick:
+                report.ticks += 1
+                report.tick_ms.append(cost * 1000.0)
+                report.missed_ticks += cost > interval
+                report.latencies_ms.extend((timers.now - t) * 1000.0 for t in waiting)
+                waiting.clear()
+            if next_interval is not None:
+                timers.due[func] = timers.now + float(next_interval)
+    finally:
+        try:
+            deform_ops.restore_interaction_lod()
+            for name, value in saved_state.items():
+                if getattr(settings, name, None) != value:
+                    setattr(settings, name, value)
+            settings.live_preview = saved_live
+            scope_settings.mode = saved_scope
+        finally:
+            (
+                deform_ops._clock, deform_ops._timer_api,
+                deform_ops._live_update_pending, deform_ops._live_update_timer_running,
+            ) = saved_loop
+            _remove_replay_scene(collection, lattices)
+            for obj in saved_selection:
+                try:
+                    obj.select_set(True)
+                except Exception:
+                    pass
+            context.view_layer.objects.active = saved_active
+    return report
+
+
+def _trace_path(context) -> str:
+    prefs = context.preferences.addons[__package__].preferences
+    # bpy.path.abspath resolves "//" against the working directory for unsaved files.
+    if prefs.trace_path.startswith("//") and not bpy.data.filepath:
+        raise ValueError("save the .blend first or set an absolute trace path")
+    return bpy.path.abspath(prefs.trace_path)
+
+
+class BD_OT_toggle_live_trace(Operator):
+    bl_idname = "bd.toggle_live_trace"
+    bl_label = "Record Live Trace"
+    bl_description = "Start recording Live Preview slider changes and ticks; run again to stop and save the trace"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        if not is_recording():
+            start_recording(context)
+            self.report({'INFO'}, "Recording Live Preview trace")
+            return {'FINISHED'}
+
+        trace = stop_recording()
+        try:
+            path = _trace_path(context)
+            save_trace(trace, path)
+        except Exception as e:
+            self.report({'ERROR'}, f"Cannot save trace: {e}")
+            return {'CANCELLED'}
+
+        changes = sum(1 for e in trace["events"] if e["type"] == "change")
+        self.report({'INFO'}, f"Saved trace with {changes} change(s) to {path}")
+        return {'FINISHED'}
+
+
+class BD_OT_replay_live_trace(Operator):
+    bl_idname = "bd.replay_live_trace"
+    bl_label = "Replay Live Trace"
+    bl_description = (
+        "Replay the saved trace against synthetic lattices and print latency, "
+        "missed ticks and coalescing compared with the recording"
+    )
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        try:
+            trace = load_trace(_trace_path(context))
+            report = replay(context, trace)
+        except Exception as e:
+            self.report({'ERROR'}, f"Replay failed: {e}")
+            return {'CANCELLED'}
+
+        for title, result in (("recorded", recorded_report(trace)), ("replayed", report)):
+            for line in result.format():
+                print(f"BevelDeformer: {title}: {line}")
+        self.report({'INFO'}, report.format()[0] + f", p90 {report.percentile(90):.1f} ms")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_toggle_live_trace,
+    BD_OT_replay_live_trace,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    global _events
+    _events = None
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,262 @@
+import functools
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import bpy
+from bpy.props import BoolProperty
+from bpy.types import Operator
+
+
+# Optional allocation accounting: while enabled, the outermost ``track`` block
+# (an operator or a live tick) records how far tracemalloc's traced memory rose
+# above its level at entry (peak) and how much was still held at exit (net).
+# Lattice points written inside the block are counted through ``add_points``.
+
+_MAX_RECORDS = 512
+
+# Peak bytes per lattice point for the default ``budget_check`` workload
+# (64 lattices of 8x8x2), recorded at ~71 and ~2 with headroom on top. The
+# headless tests hold the deform operator and Live Preview ticks to the same
+# limits (tools/headless/tests/test_memory_budget.py).
+BUDGETS: dict[str, float] = {
+    "deform": 96.0,
+    "deform_reset": 4.0,
+}
+
+
+@dataclass
+class Record:
+    label: str
+    points: int
+    peak: int
+    net: int
+
+    @property
+    def peak_per_point(self) -> float:
+        return self.peak / self.points if self.points else 0.0
+
+    @property
+    def net_per_point(self) -> float:
+        return self.net / self.points if self.points else 0.0
+
+
+_records: list[Record] = []
+_enabled = False
+_owns_tracing = False
+_tracking = False
+_points = 0
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled, _owns_tracing
+    if enabled and not _enabled:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _owns_tracing = True
+        _enabled = True
+    elif not enabled and _enabled:
+        _enabled = False
+        if _owns_tracing:
+            tracemalloc.stop()
+            _owns_tracing = False
+
+
+def add_points(count: int) -> None:
+    global _points
+    if _tracking:
+        _points += int(count)
+
+
+@contextmanager
+def track(label: str):
+    """Record allocations of the enclosed block; nested blocks count toward the outer one."""
+    global _tracking, _points
+    if not _enabled or _tracking:
+        yield
+        return
+
+    _tracking = True
+    _points = 0
+    tracemalloc.reset_peak()
+    before, _peak = tracemalloc.get_traced_memory()
+    try:
+        yield
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        _tracking = False
+        _records.append(Record(label, _points, max(peak - before, 0), current - before))
+        del _records[:-_MAX_RECORDS]
+
+
+def tracked(execute):
+    """Wrap an operator's ``execute`` in ``track(bl_idname)``."""
+
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        with track(self.bl_idname):
+            return execute(self, context)
+
+    return wrapper
+
+
+def records() -> list[Record]:
+    return list(_records)
+
+
+def clear() -> None:
+    _records.clear()
+
+
+def summary() -> dict[str, dict[str, float]]:
+    """Per label: call count, worst peak and mean net bytes per point, worst peak bytes."""
+    grouped: dict[str, list[Record]] = {}
+    for record in _records:
+        grouped.setdefault(record.label, []).append(record)
+
+    result = {}
+    for label, items in grouped.items():
+        result[label] = {
+            "calls": len(items),
+            "points": max(r.points for r in items),
+            "peak_per_point": max(r.peak_per_point for r in items),
+            "net_per_point": sum(r.net_per_point for r in items) / len(items),
+            "peak": max(r.peak for r in items),
+        }
+    return result
+
+
+def format_summary() -> list[str]:
+    lines = []
+    for label, row in sorted(summary().items()):
+        if not row["points"]:
+            lines.append(f"{label}: {row['calls']} call(s), peak {row['peak'] / 1024:.1f} KiB")
+            continue
+        lines.append(
+            f"{label}: {row['calls']} call(s), up to {row['points']} point(s), "
+            f"peak {row['peak_per_point']:.1f} B/pt ({row['peak'] / 1024:.1f} KiB), "
+            f"net {row['net_per_point']:.1f} B/pt"
+        )
+    return lines
+
+
+def _measure(label: str, func) -> Record:
+    was_enabled = _enabled
+    set_enabled(True)
+    try:
+        with track(label):
+            func()
+        return _records.pop()
+    finally:
+        set_enabled(was_enabled)
+
+
+def budget_check(batch: int = 64, resolution: tuple[int, int, int] = (8, 8, 2)) -> list[tuple[Record, float]]:
+    """Deform temporary lattices the way the Deform operator does and return (record, budget) pairs.
+
+    ``batch`` lattices are created in ``bpy.data`` (not linked to a scene), run
+    through ``process_lattice_smart_scale`` with and without Reset to Uniform, and
+    removed again. A record with ``peak_per_point > budget`` is a regression.
+    """
+    from .deform_ops import process_lattice_smart_scale
+
+    lattices = []
+    for i in range(batch):
+        data = bpy.data.lattices.new(f"BD_Budget_{i:03d}")
+        data.points_u, data.points_v, data.points_w = resolution
+        lattices.append(bpy.data.objects.new(data.name, data))
+
+    def deform(reset_to_uniform: bool, shift_factor: float):
+        process_lattice_smart_scale(
+            lattices=lattices, reset_to_uniform=reset_to_uniform, shift_factor=shift_factor,
+            scale_factor=1.2, offset_x=0.1, offset_y=0.2, offset_z=0.0,
+        )
+
+    results = []
+    try:
+        for label, reset_to_uniform in (("deform", False), ("deform_reset", True)):
+            # The first call fills the lookup-table caches; the second is measured.
+            deform(reset_to_uniform, 0.3)
+            record = _measure(label, lambda: deform(reset_to_uniform, 0.35))
+            results.append((record, BUDGETS[label]))
+    finally:
+        for lat_obj in lattices:
+            data = lat_obj.data
+            bpy.data.objects.remove(lat_obj)
+            bpy.data.lattices.remove(data)
+    return results
+
+
+class BD_OT_memory_report(Operator):
+    bl_idname = "bd.memory_report"
+    bl_label = "Memory Report"
+    bl_description = "Print peak and net allocations per lattice point of the recorded operators and live ticks"
+    bl_options = {"REGISTER"}
+
+    clear_after: BoolProperty(name="Clear", default=False, options={'SKIP_SAVE'})
+
+    def execute(self, context):
+        lines = format_summary()
+        if not lines:
+            state = "enabled" if _enabled else "disabled (see add-on preferences)"
+            self.report({'WARNING'}, f"Nothing recorded; memory accounting is {state}")
+            return {'CANCELLED'}
+
+        for line in lines:
+            print(f"BevelDeformer: {line}")
+        if self.clear_after:
+            clear()
+        self.report({'INFO'}, f"{lines[0]} (+{len(lines) - 1} more in the console)" if len(lines) > 1 else lines[0])
+        return {'FINISHED'}
+
+
+class BD_OT_memory_budget_check(Operator):
+    bl_idname = "bd.memory_budget_check"
+    bl_label = "Check Memory Budget"
+    bl_description = "Deform temporary lattices and compare allocations per point to the recorded budget"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        failed = []
+        for record, budget in budget_check():
+            verdict = "OK" if record.peak_per_point <= budget else "OVER BUDGET"
+            print(
+                f"BevelDeformer: budget {record.label}: peak {record.peak_per_point:.1f} B/pt "
+                f"(budget {budget:.1f}), net {record.net_per_point:.1f} B/pt - {verdict}"
+            )
+            if record.peak_per_point > budget:
+                failed.append(f"{record.label} {record.peak_per_point:.1f} > {budget:.1f} B/pt")
+
+        if failed:
+            self.report({'ERROR'}, "Allocation budget exceeded: " + ", ".join(failed))
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Allocation budget OK")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_memory_report,
+    BD_OT_memory_budget_check,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+    try:
+        prefs = bpy.context.preferences.addons[__package__].preferences
+        set_enabled(bool(getattr(prefs, "memory_accounting", False)))
+    except Exception:
+        pass
+
+
+def unregister() -> None:
+    set_enabled(False)
+    clear()
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,182 @@
+import bpy
+import numpy as np
+from bpy.props import EnumProperty, FloatProperty, IntProperty
+from bpy.types import Operator
+
+from . import kernels, layers, memstats, scope, stages
+from .deform_ops import gather_target_lattices, group_by_signature, settings_chain, write_co_deform
+
+
+RANDOM_PARAMS = ("shift_factor", "scale_factor", "offset_x", "offset_y", "offset_z")
+
+# Same limits as the scene sliders.
+_PARAM_LIMITS = {
+    "shift_factor": (-1.0, 1.0),
+    "scale_factor": (0.0, np.inf),
+}
+
+
+def draw_params(
+    count: int,
+    *,
+    seed: int,
+    base: dict[str, float],
+    spread: dict[str, float],
+    distribution: str = 'UNIFORM',
+) -> dict[str, np.ndarray]:
+    """Draw ``count`` values per parameter in one array operation.
+
+    UNIFORM draws from ``base ± spread``, NORMAL uses ``spread`` as the standard
+    deviation. The same seed and count always give the same values.
+    """
+    rng = np.random.default_rng(int(seed))
+    if distribution == 'NORMAL':
+        noise = rng.standard_normal((count, len(RANDOM_PARAMS)))
+    else:
+        noise = rng.uniform(-1.0, 1.0, (count, len(RANDOM_PARAMS)))
+
+    drawn: dict[str, np.ndarray] = {}
+    for i, name in enumerate(RANDOM_PARAMS):
+        values = float(base.get(name, 0.0)) + noise[:, i] * float(spread.get(name, 0.0))
+        low, high = _PARAM_LIMITS.get(name, (-np.inf, np.inf))
+        drawn[name] = np.clip(values, low, high)
+    return drawn
+
+
+def deform_lattices_with_params(
+    lattices: list[bpy.types.Object],
+    per_lattice: dict[str, np.ndarray],
+    *,
+    chain: tuple[str, ...],
+    constants: dict | None = None,
+    reset_to_uniform: bool = True,
+    layer: str = layers.DEFAULT_LAYER,
+    into_layer: bool = False,
+) -> int:
+    """Deform every lattice with its own parameter values, batched by (resolution, locked axis).
+
+    ``per_lattice`` maps parameter names to arrays aligned with ``lattices``. As in
+    Deform, lattices with a layer stack (all of them with ``into_layer``) get their
+    values as stage layer ``layer`` and are rebuilt from their stacks.
+    """
+    if not lattices:
+        return 0
+
+    position = {obj: i for i, obj in enumerate(lattices)}
+    layered = [obj for obj in lattices if into_layer or layers.has_layers(obj)]
+    layers.check_stage_layer(layered, layer)
+    for obj in layered:
+        values = dict(constants or {})
+        values.update({name: float(np.asarray(v)[position[obj]]) for name, v in per_lattice.items()})
+        layers.set_stage_layer(obj, layer, tuple(chain), values)
+        layers.rebuild(obj)
+
+    skip = set(layered)
+    plain = [obj for obj in lattices if obj not in skip]
+    chain = (("reset",) if reset_to_uniform else ()) + tuple(chain)
+
+    for (resolution, locked_idx), members in group_by_signature(plain).items():
+        rows = np.array([position[obj] for obj in members], dtype=np.intp)
+        if reset_to_uniform:
+            grid = kernels.uniform_grid(resolution, batch=len(members))
+        else:
+            count = resolution[0] * resolution[1] * resolution[2]
+            current = np.empty((len(members), count * 3), dtype=np.float32)
+            for i, obj in enumerate(members):
+                obj.data.points.foreach_get("co_deform", current[i])
+            grid = kernels.grid_from_flat(current, resolution)
+
+        params = dict(constants or {})
+        params.update({name: np.asarray(values)[rows] for name, values in per_lattice.items()})
+        stages.run_chain(grid, chain, params, locked_idx=locked_idx)
+
+        result = grid.reshape(len(members), -1).astype(np.float32)
+        for i, obj in enumerate(members):
+            write_co_deform(obj, result[i])
+
+    return len(lattices)
+
+
+def store_params(lattices: list[bpy.types.Object], per_lattice: dict[str, np.ndarray], seed: int) -> None:
+    for i, lat_obj in enumerate(lattices):
+        for name, values in per_lattice.items():
+            lat_obj[f"bd_{name}"] = float(values[i])
+        lat_obj["bd_random_seed"] = int(seed)
+
+
+class BD_OT_randomize_deform(Operator):
+    bl_idname = "bd.randomize_deform"
+    bl_label = "Randomize Deform"
+    bl_description = "Give every target lattice its own seeded Shift/Scale/Offset values around the current sliders"
+    bl_options = {"REGISTER", "UNDO"}
+
+    seed: IntProperty(name="Seed", default=0, min=0)
+    distribution: EnumProperty(
+        name="Distribution",
+        items=[
+            ("UNIFORM", "Uniform", "Values within slider ± spread"),
+            ("NORMAL", "Normal", "Gaussian around the slider with spread as standard deviation"),
+        ],
+        default="UNIFORM",
+    )
+    shift_spread: FloatProperty(name="Shift Spread", default=0.1, min=0.0, soft_max=1.0)
+    scale_spread: FloatProperty(name="Scale Spread", default=0.1, min=0.0, soft_max=1.0)
+    offset_spread: FloatProperty(name="Offset Spread", default=0.0, min=0.0, soft_max=1.0)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    @memstats.tracked
+    def execute(self, context):
+        settings = context.scene.bd_deform_settings
+        # Sorted so the seed maps to the same lattice regardless of selection order.
+        lattices = sorted(gather_target_lattices(scope.scope_objects(context)), key=lambda o: o.name)
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        chain, constants = settings_chain(settings)
+        base = {name: float(getattr(settings, name, 0.0)) for name in RANDOM_PARAMS}
+        spread = {
+            "shift_factor": self.shift_spread,
+            "scale_factor": self.scale_spread,
+            "offset_x": self.offset_spread,
+            "offset_y": self.offset_spread,
+            "offset_z": self.offset_spread,
+        }
+        drawn = draw_params(
+            len(lattices), seed=self.seed, base=base, spread=spread, distribution=self.distribution
+        )
+
+        try:
+            count = deform_lattices_with_params(
+                lattices,
+                drawn,
+                chain=chain,
+                constants=constants,
+                reset_to_uniform=bool(settings.reset_to_uniform),
+                layer=layers.target_layer(context.scene),
+                into_layer=bool(context.scene.bd_layer_settings.deform_into_layer),
+            )
+        except Exception as e:
+            self.report({'ERROR'}, f"Randomize failed: {e}")
+            return {'CANCELLED'}
+
+        store_params(lattices, drawn, self.seed)
+        self.report({'INFO'}, f"Randomized {count} lattice(s) (seed {self.seed})")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_randomize_deform,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
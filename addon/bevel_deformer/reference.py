@@ -0,0 +1,146 @@
+"""Loop implementation of the Deform chain, kept as the oracle for the NumPy kernels.
+
+This is the original per-point ``process_lattice_smart_scale`` (shift, offset, scale
+with linear relax and offset ramps) on plain tuples, without ``bpy``. It is slow on
+purpose: every fast path is checked against it by ``tools/headless/parity.py``, so
+change it only when the intended behaviour changes.
+"""
+
+Point = tuple[float, float, float]
+
+
+def _lerp(a: Point, b: Point, t: float) -> Point:
+    return (a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t, a[2] + (b[2] - a[2]) * t)
+
+
+def _shift_and_relax_line(coords: list[Point], shift_factor: float) -> None:
+    count = len(coords)
+    if count < 4:
+        return
+
+    sf = float(shift_factor)
+    if abs(sf) < 1e-8:
+        return
+
+    if sf >= 0.0:
+        coords[1] = _lerp(coords[1], coords[0], sf)
+        coords[count - 2] = _lerp(coords[count - 2], coords[count - 1], sf)
+    else:
+        t = abs(sf)
+        coords[1] = _lerp(coords[1], coords[2], t)
+        # With 4 points coords[count - 3] is coords[1], already moved above.
+        coords[count - 2] = _lerp(coords[count - 2], coords[count - 3], t)
+
+    if count <= 4:
+        return
+
+    start_anchor = coords[1]
+    end_anchor = coords[count - 2]
+    total_steps = (count - 2) - 1
+    for k in range(2, count - 2):
+        coords[k] = _lerp(start_anchor, end_anchor, (k - 1) / total_steps)
+
+
+def _offset_ramp_factor(index: int, resolution: int) -> float:
+    if resolution < 4:
+        return 0.0
+    if index <= 1:
+        return 0.0
+    if index >= resolution - 2:
+        return 1.0
+    return (index - 1) / (resolution - 3)
+
+
+def uniform_points(resolution: tuple[int, int, int]) -> list[Point]:
+    u_res, v_res, w_res = resolution
+    points = []
+    for w in range(w_res):
+        z_pos = -0.5 + (w / (w_res - 1)) if w_res > 1 else 0.0
+        for v in range(v_res):
+            y_pos = -0.5 + (v / (v_res - 1)) if v_res > 1 else 0.0
+            for u in range(u_res):
+                x_pos = -0.5 + (u / (u_res - 1)) if u_res > 1 else 0.0
+                points.append((x_pos, y_pos, z_pos))
+    return points
+
+
+def process_points(
+    points: list[Point],
+    resolution: tuple[int, int, int],
+    *,
+    scale_factor: float,
+    shift_factor: float,
+    offset_x: float,
+    offset_y: float,
+    offset_z: float,
+    reset_to_uniform: bool,
+    locked_idx: int | None = None,
+) -> list[Point]:
+    """Deform one lattice's points (``co_deform`` order: u fastest, then v, then w)."""
+    u_res, v_res, w_res = resolution
+    points = uniform_points(resolution) if reset_to_uniform else list(points)
+
+    def get_idx(u, v, w):
+        return w * (u_res * v_res) + v * u_res + u
+
+    shifted_u = False
+    shifted_v = False
+    shifted_w = False
+
+    do_shift = abs(float(shift_factor)) > 1e-8
+
+    if do_shift and u_res >= 4:
+        shifted_u = True
+        for w in range(w_res):
+            for v in range(v_res):
+                coords = [points[get_idx(u, v, w)] for u in range(u_res)]
+                _shift_and_relax_line(coords, float(shift_factor))
+                for u in range(u_res):
+                    points[get_idx(u, v, w)] = coords[u]
+
+    if do_shift and v_res >= 4:
+        shifted_v = True
+        for w in range(w_res):
+            for u in range(u_res):
+                coords = [points[get_idx(u, v, w)] for v in range(v_res)]
+                _shift_and_relax_line(coords, float(shift_factor))
+                for v in range(v_res):
+                    points[get_idx(u, v, w)] = coords[v]
+
+    if do_shift and w_res >= 4:
+        shifted_w = True
+        for v in range(v_res):
+            for u in range(u_res):
+                coords = [points[get_idx(u, v, w)] for w in range(w_res)]
+                _shift_and_relax_line(coords, float(shift_factor))
+                for w in range(w_res):
+                    points[get_idx(u, v, w)] = coords[w]
+
+    do_offset = (
+        abs(float(offset_x)) > 1e-8
+        or abs(float(offset_y)) > 1e-8
+        or abs(float(offset_z)) > 1e-8
+    )
+    if do_offset:
+        fx = [_offset_ramp_factor(i, u_res) for i in range(u_res)]
+        fy = [_offset_ramp_factor(i, v_res) for i in range(v_res)]
+        fz = [_offset_ramp_factor(i, w_res) for i in range(w_res)]
+
+        for w in range(w_res):
+            dz = 0.0 if locked_idx == 2 else float(offset_z) * fz[w]
+            for v in range(v_res):
+                dy = 0.0 if locked_idx == 1 else float(offset_y) * fy[v]
+                for u in range(u_res):
+                    dx = 0.0 if locked_idx == 0 else float(offset_x) * fx[u]
+                    idx = get_idx(u, v, w)
+                    p = points[idx]
+                    points[idx] = (p[0] + dx, p[1] + dy, p[2] + dz)
+
+    scale_u = scale_factor if shifted_u else 1.0
+    scale_v = scale_factor if shifted_v else 1.0
+    scale_w = scale_factor if shifted_w else 1.0
+
+    if scale_u != 1.0 or scale_v != 1.0 or scale_w != 1.0:
+        points = [(p[0] * scale_u, p[1] * scale_v, p[2] * scale_w) for p in points]
+
+    return points
@@ -0,0 +1,54 @@
+import bpy
+
+
+def is_collection_scope(context) -> bool:
+    settings = getattr(context.scene, "bd_scope_settings", None)
+    return settings is not None and settings.mode == 'COLLECTION'
+
+
+def scope_objects(context) -> list[bpy.types.Object]:
+    """Objects an operation works on: the selection, or the scope collection's objects.
+
+    Collection scope never reads or changes selection, so large (linked) sets can be
+    processed without selecting them first.
+    """
+    if not is_collection_scope(context):
+        return list(context.selected_objects)
+
+    settings = context.scene.bd_scope_settings
+    collection = settings.collection
+    if collection is None:
+        return []
+    if bool(settings.recursive):
+        return list(collection.all_objects)
+    return list(collection.objects)
+
+
+def scope_label(context) -> str:
+    if not is_collection_scope(context):
+        return "selected objects"
+    collection = context.scene.bd_scope_settings.collection
+    return f"collection '{collection.name}'" if collection is not None else "scope collection (none set)"
+
+
+def lattice_users(lattices) -> dict[bpy.types.Object, list[bpy.types.Object]]:
+    """Meshes whose lattice modifiers target each lattice.
+
+    Uses a single ``bpy.data.user_map`` call for the whole batch instead of
+    iterating ``bpy.data.objects`` once per lattice.
+    """
+    lattices = [lat for lat in lattices if lat is not None]
+    result: dict[bpy.types.Object, list[bpy.types.Object]] = {lat: [] for lat in lattices}
+    if not lattices:
+        return result
+
+    user_map = bpy.data.user_map(subset=lattices, key_types={'OBJECT'}, value_types={'OBJECT'})
+    for lat_obj in lattices:
+        for user in user_map.get(lat_obj, ()):
+            if getattr(user, "type", None) != 'MESH':
+                continue
+            for mod in user.modifiers:
+                if mod.type == 'LATTICE' and mod.object == lat_obj:
+                    result[lat_obj].append(user)
+                    break
+    return result
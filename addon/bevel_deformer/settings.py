@@ -1,7 +1,18 @@
 import bpy
-from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, PointerProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, PointerProperty, StringProperty
 from bpy.types import PropertyGroup
 
+from .kernels import PROFILE_ITEMS
+
+
+def _auto_influence_update(self, context) -> None:
+    try:
+        from . import influence
+
+        influence.on_setting_changed(context)
+    except Exception as e:
+        print(f"BevelDeformer: influence group update failed: {e}")
+
 
 def _schedule_live_deform_update(self, context) -> None:
     if not getattr(self, "live_preview", False):
@@ -15,6 +26,137 @@ def _schedule_live_deform_update(self, context) -> None:
         print(f"BevelDeformer: live update scheduling failed: {e}")
 
 
+def _check_gn_backend(self, context) -> None:
+    # Settings the Geometry Nodes backend cannot follow switch its meshes back to lattices.
+    try:
+        from . import gn_backend
+
+        gn_backend.fall_back_if_unsupported(context.scene)
+    except Exception as e:
+        print(f"BevelDeformer: Geometry Nodes backend check failed: {e}")
+
+
+def _deform_mode_update(self, context) -> None:
+    _check_gn_backend(self, context)
+    _schedule_live_deform_update(self, context)
+
+
+_AXIS_ITEMS = [
+    ("X", "X", "Lattice X (U)"),
+    ("Y", "Y", "Lattice Y (V)"),
+    ("Z", "Z", "Lattice Z (W)"),
+]
+
+
+class BD_ScopeSettings(PropertyGroup):
+    mode: EnumProperty(
+        name="Scope",
+        description="Which objects create, deform, reset, apply and delete operate on",
+        items=[
+            ("SELECTION", "Selection", "Operate on the selected objects"),
+            ("COLLECTION", "Collection", "Operate on the objects of a collection without touching selection"),
+        ],
+        default="SELECTION",
+    )
+    collection: PointerProperty(
+        name="Collection",
+        description="Collection whose objects are processed when Scope is Collection",
+        type=bpy.types.Collection,
+    )
+    recursive: BoolProperty(
+        name="Include Children",
+        description="Also process objects of nested child collections",
+        default=True,
+    )
+
+
+class BD_AssetSettings(PropertyGroup):
+    filepath: StringProperty(
+        name="Library",
+        description="External .blend file holding the assets",
+        subtype='FILE_PATH',
+    )
+    name_filter: StringProperty(
+        name="Filter",
+        description="Comma separated name patterns to load, e.g. Rock_*, Cliff_0? (empty = everything)",
+        default="",
+    )
+    mode: EnumProperty(
+        name="Mode",
+        description="How the assets are brought into this file",
+        items=[
+            ("LINK", "Link", "Local objects around linked mesh data: nothing is copied and lattices can be added"),
+            ("INSTANCE", "Instance", "Link collections and place collection-instance empties (no lattices)"),
+            ("APPEND", "Append", "Append full copies of the objects"),
+        ],
+        default="LINK",
+    )
+    create_lattices: BoolProperty(
+        name="Create Lattices",
+        description="Create a lattice for every placed mesh with the current Lattice settings",
+        default=True,
+    )
+
+
+class BD_SnapshotSettings(PropertyGroup):
+    name: StringProperty(
+        name="Snapshot",
+        description="Name to store the current lattice deformation under, or to restore",
+        default="A",
+    )
+    storage: EnumProperty(
+        name="Storage",
+        description="Where new snapshots are kept",
+        items=[
+            ("MEMORY", "Memory", "Kept for this session only"),
+            ("FILE", "File", "Raw .npy files next to the .blend, memory-mapped on restore (not saved in the .blend)"),
+        ],
+        default="MEMORY",
+    )
+    directory: StringProperty(
+        name="Folder",
+        description="Folder for file snapshots",
+        subtype='DIR_PATH',
+        default="//bd_snapshots",
+    )
+
+
+class BD_LayerSettings(PropertyGroup):
+    name: StringProperty(
+        name="Layer",
+        description="Deform layer that sliders and Capture Edits write to",
+        default="Bevel",
+    )
+    deform_into_layer: BoolProperty(
+        name="Deform Into Layer",
+        description=(
+            "Deform and Live Preview store the sliders in the named layer of each target lattice "
+            "and rebuild it from its layer stack, instead of overwriting its points. "
+            "Lattices that already have layers always do"
+        ),
+        default=False,
+    )
+
+
+class BD_CageSettings(PropertyGroup):
+    filepath: StringProperty(
+        name="Cage File",
+        description="Binary .bdcage file to export lattice cages to or import them from",
+        subtype='FILE_PATH',
+        default="//bd_cages.bdcage",
+    )
+    create_missing: BoolProperty(
+        name="Create Missing",
+        description="Create lattices for cages that have no lattice of the same name (placed by the stored world matrix)",
+        default=False,
+    )
+    apply_transform: BoolProperty(
+        name="Apply Transform",
+        description="Also move existing lattices to the stored world matrix",
+        default=False,
+    )
+
+
 class BD_LatticeSettings(PropertyGroup):
     locked_axis_enabled: BoolProperty(
         name="Locked Axis",
@@ -56,6 +198,20 @@ class BD_LatticeSettings(PropertyGroup):
         ],
         default="KEY_BSPLINE",
     )
+    fast_apply: BoolProperty(
+        name="Fast Apply",
+        description="Apply Lattice bakes with the built-in evaluator instead of the modifier stack when the result is identical (first modifier, no vertex group, no shape keys)",
+        default=False,
+    )
+    auto_influence: BoolProperty(
+        name="Auto Influence Group",
+        description=(
+            "Keep a vertex group on each lattice modifier with only the vertices the deformation can move, "
+            "so dense meshes skip untouched vertices. Refreshed shortly after the lattice changes"
+        ),
+        default=False,
+        update=_auto_influence_update,
+    )
 
 
 class BD_DeformSettings(PropertyGroup):
@@ -105,14 +261,100 @@ class BD_DeformSettings(PropertyGroup):
         max=1.0,
         update=_schedule_live_deform_update,
     )
+    stage_chain: StringProperty(
+        name="Stage Chain",
+        description="Deform stages applied in order, comma separated (shift, offset, scale, taper, twist, bend)",
+        default="shift, offset, scale",
+        update=_deform_mode_update,
+    )
+    taper_factor: FloatProperty(
+        name="Taper",
+        description="Scale across the taper axis, from 1 at its start to 1 + Taper at its end",
+        default=0.0,
+        soft_min=-1.0,
+        soft_max=1.0,
+        update=_schedule_live_deform_update,
+    )
+    taper_axis: EnumProperty(
+        name="Taper Axis",
+        description="Lattice axis along which the taper grows",
+        items=_AXIS_ITEMS,
+        default="X",
+        update=_schedule_live_deform_update,
+    )
+    twist_angle: FloatProperty(
+        name="Twist",
+        description="Rotation between the two ends of the twist axis",
+        default=0.0,
+        subtype='ANGLE',
+        update=_schedule_live_deform_update,
+    )
+    twist_axis: EnumProperty(
+        name="Twist Axis",
+        description="Lattice axis the twist rotates around",
+        items=_AXIS_ITEMS,
+        default="X",
+        update=_schedule_live_deform_update,
+    )
+    bend_angle: FloatProperty(
+        name="Bend",
+        description="Arc angle the bend axis is curled into",
+        default=0.0,
+        subtype='ANGLE',
+        update=_schedule_live_deform_update,
+    )
+    bend_axis: EnumProperty(
+        name="Bend Axis",
+        description="Lattice axis that gets curled (toward the next non-locked axis)",
+        items=_AXIS_ITEMS,
+        default="X",
+        update=_schedule_live_deform_update,
+    )
+    offset_falloff: EnumProperty(
+        name="Offset Falloff",
+        description="Profile of the offset ramp between the fixed and the fully offset rows",
+        items=PROFILE_ITEMS,
+        default="LINEAR",
+        update=_deform_mode_update,
+    )
+    relax_profile: EnumProperty(
+        name="Relax Profile",
+        description="How interior points are spread between the two shifted rows",
+        items=PROFILE_ITEMS,
+        default="LINEAR",
+        update=_deform_mode_update,
+    )
     reset_to_uniform: BoolProperty(
         name="Reset To Uniform",
         description="Reset lattice points to a uniform grid before modifications",
         default=True,
+        update=_check_gn_backend,
+    )
+    interaction_lod: BoolProperty(
+        name="Interaction LOD",
+        description="Use cheaper lattice evaluation while Live Preview sliders are being dragged",
+        default=False,
+    )
+    lod_linear_interpolation: BoolProperty(
+        name="Linear While Dragging",
+        description="Temporarily switch affected lattices to Linear interpolation during a drag",
+        default=True,
+    )
+    lod_vertex_threshold: IntProperty(
+        name="Hide Above Vertices",
+        description="Temporarily hide lattice modifiers on meshes with more vertices than this during a drag (0 = never hide)",
+        default=0,
+        min=0,
+        soft_max=1000000,
     )
 
 
 _classes = (
+    BD_ScopeSettings,
+    BD_AssetSettings,
+    BD_SnapshotSettings,
+    BD_LayerSettings,
+    BD_CageSettings,
     BD_LatticeSettings,
     BD_DeformSettings,
 )
@@ -122,11 +364,26 @@ def register() -> None:
     for cls in _classes:
         bpy.utils.register_class(cls)
 
+    bpy.types.Scene.bd_scope_settings = PointerProperty(type=BD_ScopeSettings)
+    bpy.types.Scene.bd_asset_settings = PointerProperty(type=BD_AssetSettings)
+    bpy.types.Scene.bd_snapshot_settings = PointerProperty(type=BD_SnapshotSettings)
+    bpy.types.Scene.bd_layer_settings = PointerProperty(type=BD_LayerSettings)
+    bpy.types.Scene.bd_cage_settings = PointerProperty(type=BD_CageSettings)
     bpy.types.Scene.bd_lattice_settings = PointerProperty(type=BD_LatticeSettings)
     bpy.types.Scene.bd_deform_settings = PointerProperty(type=BD_DeformSettings)
 
 
 def unregister() -> None:
+    if hasattr(bpy.types.Scene, "bd_scope_settings"):
+        del bpy.types.Scene.bd_scope_settings
+    if hasattr(bpy.types.Scene, "bd_asset_settings"):
+        del bpy.types.Scene.bd_asset_settings
+    if hasattr(bpy.types.Scene, "bd_snapshot_settings"):
+        del bpy.types.Scene.bd_snapshot_settings
+    if hasattr(bpy.types.Scene, "bd_layer_settings"):
+        del bpy.types.Scene.bd_layer_settings
+    if hasattr(bpy.types.Scene, "bd_cage_settings"):
+        del bpy.types.Scene.bd_cage_settings
     if hasattr(bpy.types.Scene, "bd_lattice_settings"):
         del bpy.types.Scene.bd_lattice_settings
     if hasattr(bpy.types.Scene, "bd_deform_settings"):
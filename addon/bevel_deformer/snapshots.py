@@ -0,0 +1,284 @@
+import json
+import os
+import re
+
+import bpy
+import numpy as np
+from bpy.props import StringProperty
+from bpy.types import Operator
+
+from . import layers, scope
+from .deform_ops import gather_target_lattices, write_co_deform
+
+
+# A snapshot is one flat float32 array holding the co_deform of every captured
+# lattice back to back, plus {lattice name: (start, point count)} into it.
+Snapshot = tuple[np.ndarray, dict[str, tuple[int, int]]]
+
+_FORMAT_VERSION = 1
+
+_memory: dict[str, Snapshot] = {}
+# npy path -> (mtime_ns, snapshot with a memory-mapped array)
+_mapped: dict[str, tuple[int, Snapshot]] = {}
+# snapshot folder -> (mtime_ns, names of the file snapshots in it)
+_listed: dict[str, tuple[int, list[str]]] = {}
+
+
+def capture(lattices: list[bpy.types.Object]) -> Snapshot:
+    """Read every lattice's co_deform with one ``foreach_get`` straight into a shared buffer."""
+    counts = [len(obj.data.points) for obj in lattices]
+    data = np.empty(sum(counts) * 3, dtype=np.float32)
+    index: dict[str, tuple[int, int]] = {}
+    start = 0
+    for obj, count in zip(lattices, counts):
+        obj.data.points.foreach_get("co_deform", data[start:start + count * 3])
+        index[obj.name] = (start, count)
+        start += count * 3
+    return data, index
+
+
+def restore(snapshot: Snapshot, lattices: list[bpy.types.Object], *, raw: bool = False) -> tuple[int, int]:
+    """Write snapshot points back with one ``foreach_set`` per lattice.
+
+    On lattices with a layer stack the difference goes into the edits layer (see
+    ``layers.write_points``) unless ``raw`` is set, for callers that restore the
+    stacks themselves. Returns (restored, skipped); lattices missing from the
+    snapshot, whose point count changed since it was taken or whose edits layer
+    cannot take the points are skipped.
+    """
+    data, index = snapshot
+    restored = 0
+    skipped = 0
+    for obj in lattices:
+        entry = index.get(obj.name)
+        if entry is None or entry[1] != len(obj.data.points):
+            skipped += 1
+            continue
+        start, count = entry
+        co = data[start:start + count * 3]
+        if raw:
+            write_co_deform(obj, co)
+        else:
+            try:
+                layers.write_points(obj, co)
+            except ValueError as e:
+                print(f"BevelDeformer: snapshot not restored: {e}")
+                skipped += 1
+                continue
+        restored += 1
+    return restored, skipped
+
+
+def _snapshot_folder(directory: str) -> str:
+    # bpy.path.abspath resolves "//" against the working directory for unsaved files.
+    if str(directory).startswith("//") and not bpy.data.filepath:
+        raise ValueError("save the .blend first or choose an absolute snapshot folder")
+    return os.path.abspath(bpy.path.abspath(str(directory)))
+
+
+def _snapshot_paths(directory: str, name: str) -> tuple[str, str]:
+    stem = re.sub(r"[^\w.-]", "_", str(name)) or "snapshot"
+    base = os.path.join(_snapshot_folder(directory), stem)
+    return base + ".npy", base + ".json"
+
+
+def write_file(directory: str, name: str, snapshot: Snapshot) -> str:
+    """Store a snapshot as a raw .npy array plus a small JSON index beside it."""
+    npy_path, json_path = _snapshot_paths(directory, name)
+    os.makedirs(os.path.dirname(npy_path), exist_ok=True)
+
+    # Drop any open mapping of the old file before it is truncated and rewritten.
+    _mapped.pop(npy_path, None)
+    _listed.pop(os.path.dirname(npy_path), None)
+    data, index = snapshot
+    np.save(npy_path, data)
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"version": _FORMAT_VERSION, "name": str(name), "lattices": index}, f)
+    return npy_path
+
+
+def read_file(directory: str, name: str) -> Snapshot:
+    """Open a file snapshot memory-mapped; reopened only when the file changes."""
+    npy_path, json_path = _snapshot_paths(directory, name)
+    mtime = os.stat(npy_path).st_mtime_ns
+    cached = _mapped.get(npy_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(json_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    index = {key: (int(start), int(count)) for key, (start, count) in meta["lattices"].items()}
+    snapshot = (np.load(npy_path, mmap_mode='r'), index)
+    _mapped[npy_path] = (mtime, snapshot)
+    return snapshot
+
+
+def find_snapshot(settings, name: str) -> Snapshot | None:
+    """Memory snapshots win over file snapshots of the same name."""
+    if name in _memory:
+        return _memory[name]
+    try:
+        return read_file(settings.directory, name)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def delete_snapshot(settings, name: str) -> bool:
+    removed = _memory.pop(name, None) is not None
+    try:
+        npy_path, json_path = _snapshot_paths(settings.directory, name)
+    except ValueError:
+        return removed
+    _mapped.pop(npy_path, None)
+    _listed.pop(os.path.dirname(npy_path), None)
+    for path in (npy_path, json_path):
+        if os.path.exists(path):
+            os.remove(path)
+            removed = True
+    return removed
+
+
+def _file_names(directory: str) -> list[str]:
+    """File snapshots in the folder; listed again only when the folder changes."""
+    folder = _snapshot_folder(directory)
+    mtime = os.stat(folder).st_mtime_ns
+    cached = _listed.get(folder)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    names = [os.path.splitext(f)[0] for f in os.listdir(folder) if f.endswith(".json")]
+    _listed[folder] = (mtime, names)
+    return names
+
+
+def snapshot_names(settings) -> list[str]:
+    """Memory snapshots, plus the folder's file snapshots while File storage is selected.
+
+    Called on every panel redraw, so the folder costs one ``stat`` unless it changed.
+    """
+    names = set(_memory)
+    if settings.storage == 'FILE':
+        try:
+            names.update(_file_names(settings.directory))
+        except (OSError, ValueError):
+            pass
+    return sorted(names)
+
+
+def clear_memory() -> None:
+    _memory.clear()
+    _mapped.clear()
+    _listed.clear()
+
+
+class BD_OT_capture_snapshot(Operator):
+    bl_idname = "bd.capture_snapshot"
+    bl_label = "Snapshot"
+    bl_description = "Store the current deformation of the target lattices under the snapshot name"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        settings = context.scene.bd_snapshot_settings
+        name = settings.name.strip()
+        if not name:
+            self.report({'WARNING'}, "Snapshot name is empty")
+            return {'CANCELLED'}
+
+        lattices = sorted(gather_target_lattices(scope.scope_objects(context)), key=lambda o: o.name)
+        if not lattices:
+            self.report({'WARNING'}, f"No lattices found for {scope.scope_label(context)}")
+            return {'CANCELLED'}
+
+        snapshot = capture(lattices)
+        if settings.storage == 'FILE':
+            try:
+                write_file(settings.directory, name, snapshot)
+            except Exception as e:
+                self.report({'ERROR'}, f"Cannot write snapshot: {e}")
+                return {'CANCELLED'}
+            _memory.pop(name, None)
+        else:
+            _memory[name] = snapshot
+
+        self.report({'INFO'}, f"Snapshot '{name}': {len(lattices)} lattice(s)")
+        return {'FINISHED'}
+
+
+class BD_OT_restore_snapshot(Operator):
+    bl_idname = "bd.restore_snapshot"
+    bl_label = "Restore"
+    bl_description = (
+        "Restore the target lattices from a snapshot "
+        "(every lattice in the snapshot when the scope holds none)"
+    )
+    bl_options = {"REGISTER", "UNDO"}
+
+    name: StringProperty(name="Snapshot", default="", options={'SKIP_SAVE'})
+
+    def execute(self, context):
+        settings = context.scene.bd_snapshot_settings
+        name = (self.name or settings.name).strip()
+        snapshot = find_snapshot(settings, name)
+        if snapshot is None:
+            self.report({'WARNING'}, f"No snapshot named '{name}'")
+            return {'CANCELLED'}
+
+        lattices = gather_target_lattices(scope.scope_objects(context))
+        if not lattices:
+            lattices = [
+                obj for obj in (bpy.data.objects.get(key) for key in snapshot[1])
+                if obj is not None and obj.type == 'LATTICE'
+            ]
+
+        try:
+            restored, skipped = restore(snapshot, lattices)
+        except Exception as e:
+            self.report({'ERROR'}, f"Restore failed: {e}")
+            return {'CANCELLED'}
+
+        settings.name = name
+        self.report(
+            {'INFO'},
+            f"Restored {restored} lattice(s) from '{name}'"
+            + (f", skipped {skipped} (not in snapshot or resolution changed)" if skipped else ""),
+        )
+        return {'FINISHED'}
+
+
+class BD_OT_delete_snapshot(Operator):
+    bl_idname = "bd.delete_snapshot"
+    bl_label = "Delete Snapshot"
+    bl_description = "Forget the named snapshot (and delete its files)"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        settings = context.scene.bd_snapshot_settings
+        name = settings.name.strip()
+        try:
+            removed = delete_snapshot(settings, name)
+        except Exception as e:
+            self.report({'ERROR'}, f"Cannot delete snapshot: {e}")
+            return {'CANCELLED'}
+        if not removed:
+            self.report({'WARNING'}, f"No snapshot named '{name}'")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Deleted snapshot '{name}'")
+        return {'FINISHED'}
+
+
+_classes = (
+    BD_OT_capture_snapshot,
+    BD_OT_restore_snapshot,
+    BD_OT_delete_snapshot,
+)
+
+
+def register() -> None:
+    for cls in _classes:
+        bpy.utils.register_class(cls)
+
+
+def unregister() -> None:
+    for cls in reversed(_classes):
+        bpy.utils.unregister_class(cls)
+    clear_memory()
@@ -0,0 +1,255 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+
+from .kernels import _per_item, _shift_axis, offset_ramp, uniform_grid
+
+
+_SHIFT_EPS = 1e-8
+_OFFSET_EPS = 1e-8
+_ANGLE_EPS = 1e-8
+_MEMO_SIZE = 64
+
+AXES = ("X", "Y", "Z")
+DEFAULT_CHAIN = ("shift", "offset", "scale")
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One array-to-array deform step.
+
+    ``func(grid, params, state)`` works in place on a (B, W, V, U, 3) grid. ``params``
+    maps every declared name to one value per batch item and every option (an enum
+    such as a falloff profile) to one string for the whole batch; ``state`` carries values
+    shared along the chain (``locked``: locked axis per item or -1, ``shifted``: a
+    (B, 3) mask of axes the shift stage moved).
+    """
+
+    name: str
+    label: str
+    params: tuple[str, ...]
+    func: Callable
+    axis_param: str | None = None
+    options: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def all_params(self) -> tuple[str, ...]:
+        return self.params + ((self.axis_param,) if self.axis_param else ())
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        return self.all_params + tuple(option for option, _default in self.options)
+
+
+STAGES: dict[str, Stage] = {}
+
+
+def register_stage(
+    name: str,
+    label: str,
+    params: tuple[str, ...] = (),
+    axis_param: str | None = None,
+    options: tuple[tuple[str, str], ...] = (),
+):
+    """Decorator adding a stage function to the registry under ``name``.
+
+    ``options`` are ``(name, default)`` pairs of batch-wide string settings.
+    """
+
+    def decorator(func):
+        STAGES[name] = Stage(name, label, tuple(params), func, axis_param, tuple(options))
+        return func
+
+    return decorator
+
+
+def parse_chain(text: str) -> tuple[str, ...]:
+    """Stage names from a comma/space separated string; unknown names are dropped."""
+    names = [part.strip().lower() for part in str(text).replace(",", " ").split()]
+    return tuple(name for name in names if name in STAGES)
+
+
+def chain_params(chain: tuple[str, ...]) -> tuple[str, ...]:
+    """Float parameters read by ``chain``, in chain order without duplicates."""
+    seen: dict[str, None] = {}
+    for name in chain:
+        for param in STAGES[name].params:
+            seen.setdefault(param, None)
+    return tuple(seen)
+
+
+def params_from_settings(settings, chain: tuple[str, ...]) -> dict[str, float]:
+    params: dict[str, float] = {}
+    for name in chain:
+        stage = STAGES[name]
+        for param in stage.params:
+            params[param] = float(getattr(settings, param, 0.0))
+        if stage.axis_param:
+            params[stage.axis_param] = float(AXES.index(str(getattr(settings, stage.axis_param, "X"))))
+        for option, default in stage.options:
+            params[option] = str(getattr(settings, option, default))
+    return params
+
+
+def run_chain(
+    grid: np.ndarray,
+    chain: tuple[str, ...],
+    params: dict,
+    *,
+    locked_idx=None,
+) -> np.ndarray:
+    """Run ``chain`` over a (B, W, V, U, 3) grid in place.
+
+    All stages mutate the same buffer, so a chain costs one read and one write of
+    the lattice points however many stages it has. Each parameter is a scalar or
+    one value per batch item.
+    """
+    batch = grid.shape[0]
+    state = {
+        "locked": _per_item(-1 if locked_idx is None else locked_idx, batch, dtype=np.int64),
+        "shifted": np.zeros((batch, 3), dtype=bool),
+    }
+    for name in chain:
+        stage = STAGES[name]
+        values = {p: _per_item(params.get(p, 0.0), batch) for p in stage.all_params}
+        values.update((option, str(params.get(option, default))) for option, default in stage.options)
+        stage.func(grid, values, state)
+    return grid
+
+
+def _column(values: np.ndarray) -> np.ndarray:
+    return values.reshape(-1, 1, 1, 1)
+
+
+@register_stage("reset", "Reset")
+def _reset(grid, params, state):
+    grid[...] = uniform_grid(grid.shape[3:0:-1])
+
+
+@register_stage("shift", "Shift", params=("shift_factor",), options=(("relax_profile", "LINEAR"),))
+def _shift(grid, params, state):
+    shift = params["shift_factor"]
+    do_shift = np.abs(shift) > _SHIFT_EPS
+    if not do_shift.any():
+        return
+    for axis in range(3):
+        if _shift_axis(grid, axis, shift, do_shift, params["relax_profile"]):
+            state["shifted"][:, axis] |= do_shift
+
+
+@register_stage(
+    "offset", "Offset", params=("offset_x", "offset_y", "offset_z"), options=(("offset_falloff", "LINEAR"),)
+)
+def _offset(grid, params, state):
+    offsets = np.stack([params["offset_x"], params["offset_y"], params["offset_z"]], axis=1)
+    do_offset = (np.abs(offsets) > _OFFSET_EPS).any(axis=1)
+    if not do_offset.any():
+        return
+    offsets[~do_offset] = 0.0
+    for axis in range(3):
+        offsets[state["locked"] == axis, axis] = 0.0
+
+    w_res, v_res, u_res = grid.shape[1:4]
+    falloff = params["offset_falloff"]
+    grid[..., 0] += _column(offsets[:, 0]) * offset_ramp(u_res, falloff)
+    grid[..., 1] += _column(offsets[:, 1]) * offset_ramp(v_res, falloff)[:, None]
+    grid[..., 2] += _column(offsets[:, 2]) * offset_ramp(w_res, falloff)[:, None, None]
+
+
+@register_stage("scale", "Scale", params=("scale_factor",))
+def _scale(grid, params, state):
+    # Scale only applies on axes where the shift stage moved points.
+    for axis in range(3):
+        shifted = state["shifted"][:, axis]
+        if not shifted.any():
+            continue
+        factor = np.where(shifted, params["scale_factor"], 1.0)
+        if np.all(factor == 1.0):
+            continue
+        grid[..., axis] *= _column(factor)
+
+
+def _axis_groups(axes: np.ndarray, active: np.ndarray):
+    for axis in range(3):
+        mask = active & (axes == axis)
+        if mask.any():
+            yield axis, mask
+
+
+@register_stage("taper", "Taper", params=("taper_factor",), axis_param="taper_axis")
+def _taper(grid, params, state):
+    factor = params["taper_factor"]
+    active = np.abs(factor) > _OFFSET_EPS
+    for axis, mask in _axis_groups(params["taper_axis"].astype(np.int64), active):
+        items = grid[mask]
+        # 1 at the start of the axis, 1 + factor at its end.
+        k = 1.0 + _column(factor[mask]) * (items[..., axis] + 0.5)
+        locked = state["locked"][mask]
+        for other in range(3):
+            if other == axis:
+                continue
+            items[..., other] *= np.where(_column(locked == other), 1.0, k)
+        grid[mask] = items
+
+
+def _rotate_plane(items, a, b, phi):
+    cos, sin = np.cos(phi), np.sin(phi)
+    pa = items[..., a].copy()
+    pb = items[..., b]
+    items[..., a] = pa * cos - pb * sin
+    items[..., b] = pa * sin + pb * cos
+
+
+@register_stage("twist", "Twist", params=("twist_angle",), axis_param="twist_axis")
+def _twist(grid, params, state):
+    angle = params["twist_angle"]
+    axes = params["twist_axis"].astype(np.int64)
+    # Twisting would move points along the locked axis unless it is the twist axis.
+    locked = state["locked"]
+    active = (np.abs(angle) > _ANGLE_EPS) & ((locked < 0) | (locked == axes))
+    for axis, mask in _axis_groups(axes, active):
+        items = grid[mask]
+        phi = _column(angle[mask]) * items[..., axis]
+        _rotate_plane(items, (axis + 1) % 3, (axis + 2) % 3, phi)
+        grid[mask] = items
+
+
+@register_stage("bend", "Bend", params=("bend_angle",), axis_param="bend_axis")
+def _bend(grid, params, state):
+    angle = params["bend_angle"]
+    axes = params["bend_axis"].astype(np.int64)
+    locked = state["locked"]
+    active = (np.abs(angle) > _ANGLE_EPS) & (locked != axes)
+    for axis, mask in _axis_groups(axes, active):
+        # Curl the bend axis toward the next axis that is not locked.
+        toward = np.where(locked[mask] == (axis + 1) % 3, (axis + 2) % 3, (axis + 1) % 3)
+        for b in np.unique(toward):
+            sub = np.flatnonzero(mask)[toward == b]
+            items = grid[sub]
+            theta = _column(angle[sub])
+            radius = 1.0 / theta
+            phi = items[..., axis] * theta
+            dist = radius - items[..., b]
+            items[..., axis] = dist * np.sin(phi)
+            items[..., b] = radius - dist * np.cos(phi)
+            grid[sub] = items
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def uniform_chain(
+    resolution: tuple[int, int, int],
+    locked_idx: int,
+    chain: tuple[str, ...],
+    params: tuple[tuple[str, float], ...],
+) -> np.ndarray:
+    """Memoized ``run_chain`` of a uniform grid as a read-only flat float32 array.
+
+    With a reset to uniform the result depends only on these arguments, so every
+    lattice that shares them (and every live tick that repeats them) reuses one array.
+    """
+    grid = run_chain(uniform_grid(resolution), chain, dict(params), locked_idx=locked_idx)
+    co = np.ascontiguousarray(grid.reshape(-1, 3), dtype=np.float32)
+    co.setflags(write=False)
+    return co
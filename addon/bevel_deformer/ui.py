@@ -1,6 +1,12 @@
 import bpy
 from bpy.types import Panel
 
+from . import layers, snapshots, stages
+from .deform_ops import gather_target_lattices
+
+
+_MAX_SNAPSHOT_BUTTONS = 12
+
 
 def _get_locked_axis_for_ui(obj) -> tuple[bool, int | None]:
     if obj is None:
@@ -61,9 +67,20 @@ class BD_PT_panel(Panel):
     def draw(self, context):
         layout = self.layout
 
+        scope_settings = context.scene.bd_scope_settings
         lattice_settings = context.scene.bd_lattice_settings
         deform_settings = context.scene.bd_deform_settings
 
+        col = layout.column(align=True)
+        col.label(text="Scope")
+        row = col.row(align=True)
+        row.prop(scope_settings, "mode", expand=True)
+        if scope_settings.mode == 'COLLECTION':
+            col.prop(scope_settings, "collection")
+            col.prop(scope_settings, "recursive")
+
+        layout.separator()
+
         col = layout.column(align=True)
         col.label(text="Lattice")
         col.prop(lattice_settings, "locked_axis_enabled")
@@ -73,7 +90,13 @@ class BD_PT_panel(Panel):
             col.label(text="Locked axis resolution is fixed to 2")
         col.prop(lattice_settings, "interpolation")
         col.operator("bd.create_lattice_multi")
+        col.operator("bd.create_lattice_group")
+        col.operator("bd.change_lattice_resolution")
         col.operator("bd.apply_lattice_interpolation")
+        col.prop(lattice_settings, "fast_apply")
+        row = col.row(align=True)
+        row.prop(lattice_settings, "auto_influence")
+        row.operator("bd.refresh_influence_groups", text="", icon='FILE_REFRESH')
         row = col.row(align=True)
         row.operator("bd.apply_lattice")
         row.operator("bd.delete_lattice")
@@ -83,8 +106,15 @@ class BD_PT_panel(Panel):
         col = layout.column(align=True)
         col.label(text="Deform")
         col.prop(deform_settings, "live_preview")
+        if bool(getattr(deform_settings, "live_preview", False)):
+            col.prop(deform_settings, "interaction_lod")
+            if bool(getattr(deform_settings, "interaction_lod", False)):
+                sub = col.column(align=True)
+                sub.prop(deform_settings, "lod_linear_interpolation")
+                sub.prop(deform_settings, "lod_vertex_threshold")
         col.prop(deform_settings, "reset_to_uniform")
         col.prop(deform_settings, "shift_factor")
+        col.prop(deform_settings, "relax_profile")
         col.prop(deform_settings, "scale_factor")
         col.separator(factor=0.5)
         col.label(text="Dimensions")
@@ -101,8 +131,93 @@ class BD_PT_panel(Panel):
         row = col.row(align=True)
         row.enabled = not (locked_enabled and locked_idx == 2)
         row.prop(deform_settings, "offset_z")
+        col.prop(deform_settings, "offset_falloff")
+        col.separator(factor=0.5)
+        col.prop(deform_settings, "stage_chain", text="Stages")
+        chain = stages.parse_chain(deform_settings.stage_chain)
+        for name, value_prop in (("taper", "taper_factor"), ("twist", "twist_angle"), ("bend", "bend_angle")):
+            if name not in chain:
+                continue
+            row = col.row(align=True)
+            row.prop(deform_settings, value_prop)
+            row.prop(deform_settings, stages.STAGES[name].axis_param, text="")
         col.operator("bd.deform_selected_lattices")
+        col.operator("bd.interactive_deform")
+        col.operator("bd.randomize_deform")
         col.operator("bd.reset_selected_lattices")
+        col.operator("bd.bake_deform_animation")
+        col.separator(factor=0.5)
+        col.label(text="Geometry Nodes Backend")
+        row = col.row(align=True)
+        row.operator("bd.enable_gn_backend")
+        row.operator("bd.disable_gn_backend")
+        col.operator("bd.gn_parity_check")
+
+        snapshot_settings = context.scene.bd_snapshot_settings
+        layout.separator()
+
+        col = layout.column(align=True)
+        col.label(text="Snapshots")
+        row = col.row(align=True)
+        row.prop(snapshot_settings, "storage", expand=True)
+        if snapshot_settings.storage == 'FILE':
+            col.prop(snapshot_settings, "directory")
+        row = col.row(align=True)
+        row.prop(snapshot_settings, "name", text="")
+        row.operator("bd.capture_snapshot", text="", icon='IMAGE_REFERENCE')
+        row.operator("bd.restore_snapshot", text="", icon='LOOP_BACK')
+        row.operator("bd.delete_snapshot", text="", icon='X')
+        names = snapshots.snapshot_names(snapshot_settings)
+        if names:
+            grid = col.grid_flow(columns=4, align=True)
+            for name in names[:_MAX_SNAPSHOT_BUTTONS]:
+                grid.operator("bd.restore_snapshot", text=name).name = name
+
+        layer_settings = context.scene.bd_layer_settings
+        layout.separator()
+
+        col = layout.column(align=True)
+        col.label(text="Deform Layers")
+        row = col.row(align=True)
+        row.prop(layer_settings, "name", text="")
+        row.operator("bd.capture_edit_layer", text="", icon='GREASEPENCIL')
+        col.prop(layer_settings, "deform_into_layer")
+        # Only the active object's lattices are listed, so drawing stays cheap for big scopes.
+        active = context.view_layer.objects.active
+        for name, enabled in layers.layer_names(gather_target_lattices([active] if active else [])):
+            row = col.row(align=True)
+            row.label(text=name)
+            row.operator("bd.toggle_deform_layer", text="", icon='HIDE_OFF' if enabled else 'HIDE_ON').name = name
+            row.operator("bd.remove_deform_layer", text="", icon='X').name = name
+        col.operator("bd.flatten_deform_layers")
+
+        cage_settings = context.scene.bd_cage_settings
+        layout.separator()
+
+        col = layout.column(align=True)
+        col.label(text="Cage Exchange")
+        col.prop(cage_settings, "filepath", text="")
+        row = col.row(align=True)
+        row.prop(cage_settings, "create_missing")
+        row.prop(cage_settings, "apply_transform")
+        row = col.row(align=True)
+        row.operator("bd.export_cages")
+        row.operator("bd.import_cages")
+
+        asset_settings = context.scene.bd_asset_settings
+        layout.separator()
+
+        col = layout.column(align=True)
+        col.label(text="Assets")
+        col.prop(asset_settings, "filepath")
+        col.prop(asset_settings, "name_filter")
+        row = col.row(align=True)
+        row.prop(asset_settings, "mode", expand=True)
+        if asset_settings.mode != 'INSTANCE':
+            col.prop(asset_settings, "create_lattices")
+        row = col.row(align=True)
+        row.operator("bd.load_library_assets")
+        row.operator("bd.refresh_library_index", text="", icon='FILE_REFRESH')
 
 
 _classes = (
@@ -0,0 +1,130 @@
+"""Benchmark Bevel Deformer operators on a synthetic scene in plain CPython.
+
+    python tools/headless/bench.py --objects 100000
+
+Uses the ``bpy``/``mathutils`` stand-in next to this file, so no Blender install
+is needed. Timings cover the add-on's own Python/NumPy work plus the stand-in's
+bookkeeping; Blender's depsgraph and drawing are not part of them.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(os.path.dirname(HERE)), "addon")]
+
+import numpy as np  # noqa: E402
+
+import bpy  # noqa: E402
+import bevel_deformer  # noqa: E402
+
+
+def build_scene(count: int, vertices: int, seed: int = 0) -> list:
+    """``count`` selected mesh objects of ``vertices`` random points, spread on a grid."""
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(-1.0, 1.0, (vertices, 3)) * (2.0, 1.0, 0.25)
+    side = int(np.ceil(np.sqrt(count)))
+    collection = bpy.context.scene.collection
+    meshes = []
+    for i in range(count):
+        mesh = bpy.data.meshes.new(f"Bench_{i:06d}")
+        mesh.from_pydata(base, [], [])
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        obj.location = (float(i % side) * 5.0, float(i // side) * 5.0, 0.0)
+        collection.objects.link(obj)
+        obj.select_set(True)
+        meshes.append(obj)
+    return meshes
+
+
+def _lattices() -> list:
+    return [obj for obj in bpy.data.objects if obj.type == 'LATTICE']
+
+
+def _select(objects) -> None:
+    for obj in list(bpy.context.selected_objects):
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+
+
+def run(count: int, vertices: int) -> list[tuple[str, float, int]]:
+    bpy.reset()
+    bevel_deformer.register()
+    try:
+        return _run_steps(count, vertices)
+    finally:
+        bevel_deformer.unregister()
+
+
+def _run_steps(count: int, vertices: int) -> list[tuple[str, float, int]]:
+    from bevel_deformer import snapshots
+
+    scene = bpy.context.scene
+    deform = scene.bd_deform_settings
+    deform.live_preview = False
+
+    rows = []
+
+    def step(label, func):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        rows.append((label, elapsed, count))
+        print(f"{label:<28} {elapsed:9.3f} s  {elapsed / count * 1e6:9.1f} us/object", flush=True)
+
+    step("build scene", lambda: build_scene(count, vertices))
+    meshes = list(bpy.context.selected_objects)
+
+    step("create lattices", lambda: bpy.ops.bd.create_lattice_multi())
+    _select(_lattices())
+
+    deform.shift_factor = 0.3
+    deform.offset_x = 0.2
+    step("deform (reset, memoized)", lambda: bpy.ops.bd.deform_selected_lattices())
+    deform.reset_to_uniform = False
+    step("deform (accumulate)", lambda: bpy.ops.bd.deform_selected_lattices())
+    deform.reset_to_uniform = True
+
+    deform.live_preview = True
+
+    def live_tick():
+        deform.shift_factor = 0.35
+        bpy.app.timers.advance(1.0)
+
+    step("live tick", live_tick)
+    deform.live_preview = False
+
+    step("randomize", lambda: bpy.ops.bd.randomize_deform(seed=1))
+
+    scene.bd_snapshot_settings.name = "bench"
+    step("snapshot capture", lambda: bpy.ops.bd.capture_snapshot())
+    step("snapshot restore", lambda: bpy.ops.bd.restore_snapshot(name="bench"))
+
+    scene.bd_lattice_settings.fast_apply = True
+    _select(meshes)
+    step("apply (fast)", lambda: bpy.ops.bd.apply_lattice())
+
+    bpy.ops.bd.create_lattice_multi()
+    _select(meshes)
+    step("delete lattices", lambda: bpy.ops.bd.delete_lattice())
+
+    snapshots.clear_memory()
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=10000, help="number of mesh objects")
+    parser.add_argument("--vertices", type=int, default=64, help="vertices per mesh")
+    args = parser.parse_args(argv)
+
+    print(f"Bevel Deformer headless benchmark: {args.objects} object(s), {args.vertices} vertices each")
+    run(args.objects, args.vertices)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""Headless stand-in for the subset of Blender's ``bpy`` that Bevel Deformer uses.
+
+Put the directory containing this package first on ``sys.path`` (before the
+add-on) and ``import bpy`` works in plain CPython. Call :func:`reset` to start
+from an empty file with one scene, then build objects through ``bpy.data`` the
+same way a Blender script would.
+"""
+
+from . import app, ops, path, props, types, utils
+from .types import (
+    Action,
+    Collection,
+    ID,
+    Key,
+    Lattice,
+    Library,
+    Material,
+    Mesh,
+    NodeTree,
+    Object,
+    Scene,
+    ViewLayer,
+)
+
+
+class _IDCollection(types.bpy_struct):
+    def __init__(self, factory):
+        self._factory = factory
+        self._items = {}
+
+    def _unique(self, name, exclude=None):
+        if name not in self._items or self._items[name] is exclude:
+            return name
+        i = 1
+        while f"{name}.{i:03d}" in self._items:
+            i += 1
+        return f"{name}.{i:03d}"
+
+    def _rename(self, id_block, name):
+        old = id_block.__dict__.get("name")
+        if old == name:
+            return name
+        name = self._unique(str(name), exclude=id_block)
+        if self._items.get(old) is id_block:
+            del self._items[old]
+        self._items[name] = id_block
+        return name
+
+    def _add(self, id_block, name):
+        name = self._unique(str(name))
+        id_block.__dict__["name"] = name
+        id_block.__dict__["_registry"] = self
+        self._items[name] = id_block
+        return id_block
+
+    def new(self, name, *args, **kwargs):
+        return self._add(self._factory(name, *args, **kwargs), name)
+
+    def remove(self, id_block, do_unlink=True, do_id_user=True, do_ui_user=True):
+        name = id_block.__dict__.get("name")
+        if self._items.get(name) is not id_block:
+            raise ReferenceError(f"ID '{name}' not found in collection")
+        if isinstance(id_block, Object):
+            _unlink_object(id_block)
+        del self._items[name]
+        id_block.__dict__.pop("_registry", None)
+
+    def get(self, name, default=None):
+        return self._items.get(name, default)
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self._items.values())[key]
+        return self._items[key]
+
+    def __contains__(self, item):
+        if isinstance(item, str):
+            return item in self._items
+        return self._items.get(getattr(item, "name", None)) is item
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def keys(self):
+        return list(self._items.keys())
+
+    def values(self):
+        return list(self._items.values())
+
+    def items(self):
+        return list(self._items.items())
+
+
+def _unlink_object(obj):
+    for coll in list(obj.users_collection):
+        coll.objects.unlink(obj)
+    for scene in data.scenes:
+        scene._view_layer._set_selected(obj, False)
+        if scene._view_layer.objects.active is obj:
+            scene._view_layer.objects.active = None
+    obj.data = None
+    obj.parent = None
+    for mod in obj.modifiers:
+        if getattr(mod, "object", None) is not None:
+            mod.object = None
+    for other in {id(o): o for o in obj._referrers.values()}.values():
+        if other.parent is obj:
+            other.parent = None
+        for mod in other.modifiers:
+            if getattr(mod, "object", None) is obj:
+                mod.object = None
+
+
+class _Namespace:
+    pass
+
+
+class _LibraryLoad:
+    """``libraries.load`` context manager over sources registered with :func:`add_library_source`."""
+
+    def __init__(self, libraries, filepath, link=False):
+        import os
+
+        self._libraries = libraries
+        self._path = os.path.normcase(os.path.abspath(filepath))
+        self._link = link
+        if self._path not in libraries._sources:
+            raise OSError(f"Cannot read file '{filepath}'")
+
+    def __enter__(self):
+        source = self._libraries._sources[self._path]
+        self._from = _Namespace()
+        self._to = _Namespace()
+        for kind in ("objects", "collections", "meshes", "materials"):
+            setattr(self._from, kind, list(source.get(kind, {})))
+            setattr(self._to, kind, [])
+        return self._from, self._to
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            return False
+        source = self._libraries._sources[self._path]
+        self._libraries.load_calls.append((self._path, self._link))
+        for kind in ("objects", "collections", "meshes", "materials"):
+            requested = getattr(self._to, kind)
+            factories = source.get(kind, {})
+            setattr(self._to, kind, [factories[name]() if name in factories else None for name in requested])
+        return False
+
+
+class _Libraries(_IDCollection):
+    def __init__(self, factory):
+        super().__init__(factory)
+        self._sources = {}
+        self.load_calls = []
+
+    def load(self, filepath, link=False, relative=False, assets_only=False, create_liboverrides=False):
+        return _LibraryLoad(self, filepath, link=link)
+
+
+def add_library_source(filepath, **kinds):
+    """Make ``filepath`` loadable: ``kinds`` maps "objects"/"collections"/... to {name: factory}."""
+    import os
+
+    data.libraries._sources[os.path.normcase(os.path.abspath(filepath))] = kinds
+
+
+class BlendData(types.bpy_struct):
+    def __init__(self):
+        self.objects = _IDCollection(lambda name, object_data: Object(name, object_data))
+        self.meshes = _IDCollection(lambda name: Mesh(name))
+        self.lattices = _IDCollection(lambda name: Lattice(name))
+        self.collections = _IDCollection(lambda name: Collection(name))
+        self.actions = _IDCollection(lambda name: Action(name))
+        self.materials = _IDCollection(lambda name: Material(name))
+        self.node_groups = _IDCollection(lambda name, type="GeometryNodeTree": NodeTree(name))
+        self.libraries = _Libraries(lambda name: Library(name))
+        self.shape_keys = _IDCollection(lambda name, owner: Key(name, owner))
+        self.shape_keys._new_key = self.shape_keys.new
+        self.scenes = _IDCollection(_new_scene)
+        self.filepath = ""
+        self.is_dirty = False
+        self._active_scene = None
+
+    def user_map(self, subset=None, key_types=None, value_types=None):
+        """IDs using each ID: collections linking objects, parents, object data and modifier targets."""
+        wanted = None if subset is None else {id(x) for x in subset}
+        result = {}
+
+        def add(key, user):
+            if wanted is not None and id(key) not in wanted:
+                return
+            result.setdefault(key, set()).add(user)
+
+        if subset is not None:
+            for key in subset:
+                result.setdefault(key, set())
+        for obj in self.objects:
+            if obj.data is not None:
+                add(obj.data, obj)
+            if obj.parent is not None:
+                add(obj.parent, obj)
+            for mod in obj.modifiers:
+                target = getattr(mod, "object", None)
+                if target is not None:
+                    add(target, obj)
+                group = getattr(mod, "node_group", None)
+                if group is not None:
+                    add(group, obj)
+            if obj.instance_collection is not None:
+                add(obj.instance_collection, obj)
+        for coll in list(self.collections) + [s.collection for s in self.scenes]:
+            for obj in coll.objects:
+                add(obj, coll)
+        return result
+
+
+def _new_scene(name):
+    scene = Scene(name)
+    scene._view_layer = ViewLayer(scene)
+    scene.view_layers = [scene._view_layer]
+    return scene
+
+
+data = None
+context = None
+
+
+def reset():
+    """Start from an empty file with a single scene (like File > New > General, minus defaults)."""
+    global data, context
+    data = BlendData()
+    scene = data.scenes.new("Scene")
+    data._active_scene = scene
+    context = types.Context()
+    globals()["data"] = data
+    globals()["context"] = context
+    app.timers.clear()
+    app.timers.set_time(0.0)
+    return context
+
+
+reset()
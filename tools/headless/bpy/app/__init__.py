@@ -0,0 +1,14 @@
+"""``bpy.app`` with a virtual-clock timer scheduler.
+
+Timers never fire on their own. Drive them with :func:`timers.advance`, which
+moves the virtual clock forward and runs every timer that becomes due, feeding
+each callback's return value back in as its next interval.
+"""
+
+from . import handlers, timers
+
+version = (4, 5, 0)
+version_string = "4.5.0"
+background = True
+binary_path = ""
+driver_namespace = {}
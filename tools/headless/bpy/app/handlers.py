@@ -0,0 +1,17 @@
+def persistent(func):
+    func._bpy_persistent = True
+    return func
+
+
+save_pre = []
+save_post = []
+load_pre = []
+load_post = []
+undo_pre = []
+undo_post = []
+redo_pre = []
+redo_post = []
+depsgraph_update_pre = []
+depsgraph_update_post = []
+frame_change_pre = []
+frame_change_post = []
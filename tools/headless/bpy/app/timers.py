@@ -0,0 +1,61 @@
+import heapq
+import itertools
+
+_now = 0.0
+_queue = []
+_counter = itertools.count()
+_registered = {}
+
+
+def now() -> float:
+    return _now
+
+
+def register(function, first_interval=0.0, persistent=False):
+    if function in _registered:
+        raise ValueError("function is already registered")
+    entry = [_now + float(first_interval), next(_counter), function]
+    _registered[function] = entry
+    heapq.heappush(_queue, entry)
+
+
+def unregister(function):
+    entry = _registered.pop(function, None)
+    if entry is None:
+        raise ValueError("Error: function is not registered")
+    entry[2] = None
+
+
+def is_registered(function):
+    return function in _registered
+
+
+def clear():
+    _registered.clear()
+    _queue.clear()
+
+
+def advance(seconds: float = 0.0) -> int:
+    """Move the virtual clock forward, running every timer that becomes due. Returns calls made."""
+    global _now
+    target = _now + float(seconds)
+    calls = 0
+    while _queue and _queue[0][0] <= target:
+        due, _, function = heapq.heappop(_queue)
+        if function is None or _registered.get(function) is None:
+            continue
+        _now = max(_now, due)
+        del _registered[function]
+        calls += 1
+        result = function()
+        if result is not None and function not in _registered:
+            entry = [_now + float(result), next(_counter), function]
+            _registered[function] = entry
+            heapq.heappush(_queue, entry)
+    _now = target
+    return calls
+
+
+def set_time(value: float) -> None:
+    global _now
+    _now = float(value)
@@ -0,0 +1,106 @@
+"""``bpy.ops``: add-on operators plus the built-ins the add-on calls.
+
+Registered operators are callable as ``bpy.ops.<category>.<name>(**props)``;
+they run ``execute`` (or ``invoke`` with ``'INVOKE_DEFAULT'``) and return the
+result set. ``object.modifier_apply`` removes the modifier without evaluating it
+(there is no modifier stack here); callers that need real positions should use
+an evaluator of their own.
+"""
+
+from . import types as _types
+
+_operators = {}
+call_log = []
+
+
+class _Category:
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        idname = f"{self._name}.{name}"
+        if idname in _operators:
+            return _OperatorCaller(_operators[idname])
+        builtin = _BUILTINS.get(idname)
+        if builtin is not None:
+            return builtin
+        raise AttributeError(f"Calling operator \"bpy.ops.{idname}\" error, could not be found")
+
+
+class _OperatorCaller:
+    def __init__(self, cls):
+        self._cls = cls
+
+    def poll(self):
+        import bpy
+
+        poll = getattr(self._cls, "poll", None)
+        return True if poll is None else bool(poll(bpy.context))
+
+    def __call__(self, *args, **props):
+        import bpy
+
+        op = self._cls()
+        for key, value in props.items():
+            setattr(op, key, value)
+        poll = getattr(self._cls, "poll", None)
+        if poll is not None and not poll(bpy.context):
+            raise RuntimeError(f"Operator bpy.ops.{self._cls.bl_idname}.poll() failed, context is incorrect")
+        call_log.append(self._cls.bl_idname)
+        if args and args[0] == 'INVOKE_DEFAULT' and hasattr(op, "invoke"):
+            result = op.invoke(bpy.context, _types.Event())
+        else:
+            result = op.execute(bpy.context)
+        _OperatorCaller.last = op
+        return result
+
+
+def _register_operator(cls):
+    _operators[cls.bl_idname] = cls
+
+
+def _unregister_operator(cls):
+    _operators.pop(cls.bl_idname, None)
+
+
+def _mode_set(mode='OBJECT', toggle=False):
+    import bpy
+
+    call_log.append("object.mode_set")
+    obj = bpy.context.view_layer.objects.active
+    if obj is not None:
+        obj.mode = 'OBJECT' if mode == 'OBJECT' else 'EDIT'
+    return {'FINISHED'}
+
+
+def _modifier_apply(modifier="", report=False, single_user=False):
+    import bpy
+
+    call_log.append("object.modifier_apply")
+    obj = bpy.context.object
+    mod = obj.modifiers.get(modifier) if obj is not None else None
+    if mod is None:
+        raise RuntimeError(f"Modifier '{modifier}' not found")
+    obj.modifiers.remove(mod)
+    return {'FINISHED'}
+
+
+def _select_all(action='TOGGLE'):
+    import bpy
+
+    for obj in list(bpy.context.scene.objects):
+        obj.select_set(action == 'SELECT')
+    return {'FINISHED'}
+
+
+_BUILTINS = {
+    "object.mode_set": _mode_set,
+    "object.modifier_apply": _modifier_apply,
+    "object.select_all": _select_all,
+}
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return _Category(name)
@@ -0,0 +1,17 @@
+"""``bpy.path`` subset."""
+
+import os
+
+
+def abspath(path, start=None, library=None):
+    path = str(path)
+    if path.startswith("//"):
+        import bpy
+
+        base = os.path.dirname(bpy.data.filepath) if start is None else start
+        return os.path.join(base, path[2:])
+    return path
+
+
+def basename(path):
+    return os.path.basename(abspath(path))
@@ -0,0 +1,156 @@
+"""Property definitions (``bpy.props``).
+
+Each function returns a :class:`_PropertyDeferred`. When a class is registered its
+annotations are turned into descriptors, so instances read defaults, clamp numeric
+values and fire ``update`` callbacks like RNA properties do. Assigning a deferred
+property to a registered type (``bpy.types.Scene.foo = PointerProperty(...)``)
+works the same way.
+"""
+
+
+class _PropertyDeferred:
+    def __init__(self, function, keywords):
+        self.function = function
+        self.keywords = dict(keywords)
+        self.attr = None
+
+    def __repr__(self):
+        return f"<_PropertyDeferred {self.function.__name__} {self.attr}>"
+
+    def __set_name__(self, owner, name):
+        self.attr = name
+
+    # -- descriptor protocol -------------------------------------------------------
+
+    def _storage(self, instance):
+        try:
+            return instance.__dict__["_rna_values"]
+        except KeyError:
+            values = {}
+            instance.__dict__["_rna_values"] = values
+            return values
+
+    def _default(self, instance):
+        kind = self.function.__name__
+        kw = self.keywords
+        if kind == "PointerProperty":
+            ptype = kw.get("type")
+            if ptype is not None and _is_property_group(ptype):
+                value = ptype()
+                value.__dict__["_rna_owner"] = instance
+                return value
+            return None
+        if kind == "CollectionProperty":
+            from .types import bpy_prop_collection_idprop
+
+            return bpy_prop_collection_idprop(kw.get("type"), owner=instance)
+        if "default" in kw:
+            default = kw["default"]
+            if kind.endswith("VectorProperty") and not isinstance(default, (int, float, bool)):
+                return list(default)
+            if kind == "EnumProperty" and kw.get("options") and "ENUM_FLAG" in kw.get("options"):
+                return set(default)
+            return default
+        if kind == "EnumProperty":
+            items = kw.get("items")
+            if callable(items):
+                return ""
+            if kw.get("options") and "ENUM_FLAG" in kw.get("options"):
+                return set()
+            return items[0][0] if items else ""
+        if kind.endswith("VectorProperty"):
+            size = kw.get("size", 3)
+            zero = {"FloatVectorProperty": 0.0, "IntVectorProperty": 0, "BoolVectorProperty": False}[kind]
+            return [zero] * (size if isinstance(size, int) else size[0])
+        return {
+            "BoolProperty": False,
+            "IntProperty": 0,
+            "FloatProperty": 0.0,
+            "StringProperty": "",
+        }.get(kind)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = self._storage(instance)
+        if self.attr not in values:
+            values[self.attr] = self._default(instance)
+        value = values[self.attr]
+        getter = self.keywords.get("get")
+        if callable(getter):
+            return getter(instance)
+        return value
+
+    def _coerce(self, value):
+        kind = self.function.__name__
+        kw = self.keywords
+        if kind in ("FloatProperty", "IntProperty"):
+            cast = float if kind == "FloatProperty" else int
+            value = cast(value)
+            if "min" in kw and value < kw["min"]:
+                value = cast(kw["min"])
+            if "max" in kw and value > kw["max"]:
+                value = cast(kw["max"])
+            return value
+        if kind == "BoolProperty":
+            return bool(value)
+        if kind == "StringProperty":
+            return str(value)
+        if kind == "EnumProperty":
+            items = kw.get("items")
+            if isinstance(value, set):
+                return set(value)
+            if items and not callable(items):
+                ids = [item[0] for item in items]
+                if value not in ids:
+                    raise TypeError(f"enum \"{value}\" not found in {tuple(ids)}")
+            return value
+        if kind.endswith("VectorProperty"):
+            return list(value)
+        return value
+
+    def __set__(self, instance, value):
+        if self.function.__name__ == "CollectionProperty":
+            raise AttributeError(f"bpy_struct: attribute \"{self.attr}\" from \"{type(instance).__name__}\" is read-only")
+        setter = self.keywords.get("set")
+        if callable(setter):
+            setter(instance, value)
+        else:
+            self._storage(instance)[self.attr] = self._coerce(value)
+        update = self.keywords.get("update")
+        if callable(update):
+            import bpy
+
+            update(instance, bpy.context)
+
+
+def _is_property_group(cls):
+    from .types import PropertyGroup
+
+    return isinstance(cls, type) and issubclass(cls, PropertyGroup)
+
+
+def _make(name):
+    def factory(**keywords):
+        return _PropertyDeferred(factory, keywords)
+
+    factory.__name__ = name
+    factory.__qualname__ = name
+    return factory
+
+
+BoolProperty = _make("BoolProperty")
+BoolVectorProperty = _make("BoolVectorProperty")
+IntProperty = _make("IntProperty")
+IntVectorProperty = _make("IntVectorProperty")
+FloatProperty = _make("FloatProperty")
+FloatVectorProperty = _make("FloatVectorProperty")
+StringProperty = _make("StringProperty")
+EnumProperty = _make("EnumProperty")
+PointerProperty = _make("PointerProperty")
+CollectionProperty = _make("CollectionProperty")
+
+
+def RemoveProperty(cls, attr):
+    if attr in cls.__dict__:
+        delattr(cls, attr)
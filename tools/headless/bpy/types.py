@@ -0,0 +1,1368 @@
+"""Data model (``bpy.types``) for the headless stand-in.
+
+Objects, meshes, lattices, collections, modifiers and shape keys keep their state
+in plain Python / NumPy so ``foreach_get``/``foreach_set`` behave like Blender's
+bulk accessors (flat buffers, size checked, NumPy arrays or Python lists).
+"""
+
+import numpy as np
+from mathutils import Matrix, Vector
+
+from .props import _PropertyDeferred
+
+
+# -- RNA base ---------------------------------------------------------------------------
+
+
+class _RNAMeta(type):
+    def __setattr__(cls, name, value):
+        if isinstance(value, _PropertyDeferred):
+            value.attr = name
+        super().__setattr__(name, value)
+
+
+class bpy_struct(metaclass=_RNAMeta):
+    """Base for every RNA struct: ID properties and keyframing."""
+
+    def _idprops(self):
+        try:
+            return self.__dict__["_id_properties"]
+        except KeyError:
+            props = {}
+            self.__dict__["_id_properties"] = props
+            return props
+
+    def __getitem__(self, key):
+        return self._idprops()[key]
+
+    def __setitem__(self, key, value):
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        self._idprops()[key] = value
+
+    def __delitem__(self, key):
+        del self._idprops()[key]
+
+    def __contains__(self, key):
+        return key in self._idprops()
+
+    def get(self, key, default=None):
+        return self._idprops().get(key, default)
+
+    def keys(self):
+        return self._idprops().keys()
+
+    def items(self):
+        return self._idprops().items()
+
+    def pop(self, key, *default):
+        return self._idprops().pop(key, *default)
+
+    @property
+    def id_data(self):
+        return self.__dict__.get("_id_data", self)
+
+    @property
+    def bl_rna(self):
+        return type(self)
+
+    def path_from_id(self, prop=""):
+        base = self.__dict__.get("_path", "")
+        if prop:
+            return f"{base}.{prop}" if base else prop
+        return base
+
+    def keyframe_insert(self, data_path, index=-1, frame=None, group=""):
+        import bpy
+
+        id_data = self.id_data
+        if frame is None:
+            frame = bpy.context.scene.frame_current
+        value = getattr(self, data_path)
+        anim = id_data.animation_data or id_data.animation_data_create()
+        if anim.action is None:
+            anim.action = bpy.data.actions.new(f"{id_data.name}Action")
+        path = self.path_from_id(data_path)
+        fcurve = anim.action.fcurves.find(path) or anim.action.fcurves.new(path)
+        fcurve.keyframe_points.insert(frame, float(value))
+        return True
+
+    def driver_add(self, path, index=-1):
+        anim = self.id_data.animation_data_create()
+        fcurve = FCurve(self.path_from_id(path), max(int(index), 0))
+        fcurve.driver = Driver()
+        anim.drivers.append(fcurve)
+        return fcurve
+
+    def driver_remove(self, path, index=-1):
+        anim = self.id_data.animation_data
+        if anim is None:
+            return False
+        path = self.path_from_id(path)
+        kept = [f for f in anim.drivers if not (f.data_path == path and index in (-1, f.array_index))]
+        removed = len(kept) != len(anim.drivers)
+        anim.drivers[:] = kept
+        return removed
+
+
+class PropertyGroup(bpy_struct):
+    @property
+    def id_data(self):
+        owner = self.__dict__.get("_rna_owner")
+        return owner.id_data if owner is not None else None
+
+
+class AddonPreferences(bpy_struct):
+    bl_idname = ""
+
+
+class Operator(bpy_struct):
+    bl_idname = ""
+    bl_label = ""
+    bl_options = set()
+
+    def __init__(self):
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((set(level), str(message)))
+
+    @property
+    def properties(self):
+        return self
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class Menu(bpy_struct):
+    pass
+
+
+class UIList(bpy_struct):
+    pass
+
+
+class Gizmo(bpy_struct):
+    pass
+
+
+class GizmoGroup(bpy_struct):
+    pass
+
+
+class KeyingSet(bpy_struct):
+    pass
+
+
+class Event(bpy_struct):
+    def __init__(self, type="NONE", value="NOTHING", mouse_x=0, mouse_y=0, shift=False, ctrl=False, alt=False):
+        self.type = type
+        self.value = value
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+        self.mouse_region_x = mouse_x
+        self.mouse_region_y = mouse_y
+        self.mouse_prev_x = mouse_x
+        self.mouse_prev_y = mouse_y
+        self.shift = shift
+        self.ctrl = ctrl
+        self.alt = alt
+
+
+class bpy_prop_collection_idprop(bpy_struct):
+    """CollectionProperty storage."""
+
+    def __init__(self, item_type, owner=None):
+        self._type = item_type
+        self._items = []
+        self._owner = owner
+
+    def add(self):
+        item = self._type()
+        item.__dict__["_rna_owner"] = self._owner
+        self._items.append(item)
+        return item
+
+    def remove(self, index):
+        del self._items[index]
+
+    def clear(self):
+        self._items.clear()
+
+    def move(self, src, dst):
+        item = self._items.pop(src)
+        self._items.insert(dst, item)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self._items:
+                if getattr(item, "name", None) == key:
+                    return item
+            raise KeyError(key)
+        return self._items[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+    def find(self, key):
+        for i, item in enumerate(self._items):
+            if getattr(item, "name", None) == key:
+                return i
+        return -1
+
+    def keys(self):
+        return [getattr(item, "name", "") for item in self._items]
+
+    def values(self):
+        return list(self._items)
+
+
+# -- bulk access helpers ------------------------------------------------------------------
+
+
+def _foreach_get(array, seq):
+    flat = np.ascontiguousarray(array).reshape(-1)
+    if isinstance(seq, np.ndarray):
+        if seq.size != flat.size:
+            raise RuntimeError(f"internal error setting the array: size mismatch {seq.size} != {flat.size}")
+        seq.reshape(-1)[...] = flat
+        return
+    if len(seq) != flat.size:
+        raise RuntimeError(f"internal error setting the array: size mismatch {len(seq)} != {flat.size}")
+    seq[:] = flat.tolist()
+
+
+def _foreach_set(array, seq):
+    data = np.asarray(seq, dtype=array.dtype).reshape(-1)
+    if data.size != array.size:
+        raise RuntimeError(f"internal error setting the array: size mismatch {data.size} != {array.size}")
+    array.reshape(-1)[...] = data
+
+
+class _Element(bpy_struct):
+    """One element of an array-backed collection (vertex, lattice point, key point)."""
+
+    _vector_attrs = ()
+
+    def __init__(self, owner, index):
+        self.__dict__["_owner"] = owner
+        self.__dict__["_index"] = index
+        self.__dict__["_id_data"] = owner._id_data
+
+    @property
+    def index(self):
+        return self._index
+
+    def __getattr__(self, name):
+        arrays = self.__dict__["_owner"]._arrays
+        if name in arrays:
+            array = arrays[name]
+            value = array[self._index]
+            if array.ndim == 1:
+                return value.item()
+
+            def write(values, array=array, index=self._index):
+                array[index] = values
+
+            return Vector._wrap(value.tolist(), write)
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        arrays = self.__dict__["_owner"]._arrays
+        if name in arrays:
+            arrays[name][self._index] = value
+            tag = getattr(self.__dict__["_owner"]._id_data, "update_tag", None)
+            if tag is not None:
+                tag()
+            return
+        object.__setattr__(self, name, value)
+
+
+class _ArrayCollection(bpy_struct):
+    def __init__(self, id_data, arrays):
+        self._id_data = id_data
+        self._arrays = arrays
+
+    def __len__(self):
+        for array in self._arrays.values():
+            return int(array.shape[0])
+        return 0
+
+    def __iter__(self):
+        return (_Element(self, i) for i in range(len(self)))
+
+    def __getitem__(self, index):
+        count = len(self)
+        if isinstance(index, slice):
+            return [_Element(self, i) for i in range(count)[index]]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("bpy_prop_collection[index]: index out of range")
+        return _Element(self, index)
+
+    def foreach_get(self, attr, seq):
+        _foreach_get(self._arrays[attr], seq)
+
+    def foreach_set(self, attr, seq):
+        _foreach_set(self._arrays[attr], seq)
+
+
+# -- ID types -------------------------------------------------------------------------
+
+
+class ID(bpy_struct):
+    def __init__(self, name=""):
+        self.__dict__["name"] = name
+        self.library = None
+        self.override_library = None
+        self.use_fake_user = False
+        self.is_evaluated = False
+        self.animation_data = None
+        self.tag_count = 0
+        self._users = 0
+
+    def __repr__(self):
+        return f"bpy.data.{type(self).__name__.lower()}s['{self.name}']"
+
+    def __setattr__(self, name, value):
+        if name == "name" and "_registry" in self.__dict__:
+            value = self.__dict__["_registry"]._rename(self, value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def name_full(self):
+        return self.name
+
+    @property
+    def users(self):
+        return self._users + (1 if self.use_fake_user else 0)
+
+    @property
+    def original(self):
+        return self
+
+    def update_tag(self, refresh=set()):
+        self.tag_count += 1
+
+    def evaluated_get(self, depsgraph):
+        return self
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = AnimData()
+        return self.animation_data
+
+    def animation_data_clear(self):
+        self.animation_data = None
+
+    def override_create(self, remap_local_usages=False):
+        return self
+
+
+class AnimData(bpy_struct):
+    def __init__(self):
+        self.action = None
+        self.action_slot = None
+        self.drivers = []
+
+
+class Keyframe(bpy_struct):
+    def __init__(self, owner, index):
+        self.__dict__["_owner"] = owner
+        self.__dict__["_index"] = index
+
+    @property
+    def co(self):
+        array = self._owner._arrays["co"]
+
+        def write(values, array=array, index=self._index):
+            array[index] = values
+
+        return Vector._wrap(array[self._index].tolist(), write)
+
+    @co.setter
+    def co(self, value):
+        self._owner._arrays["co"][self._index] = value
+
+    @property
+    def interpolation(self):
+        return ("CONSTANT", "LINEAR", "BEZIER")[int(self._owner._arrays["interpolation"][self._index])]
+
+    @interpolation.setter
+    def interpolation(self, value):
+        self._owner._arrays["interpolation"][self._index] = ("CONSTANT", "LINEAR", "BEZIER").index(value)
+
+
+class _KeyframePoints(_ArrayCollection):
+    def __init__(self, fcurve):
+        super().__init__(fcurve, {"co": np.zeros((0, 2), np.float32), "interpolation": np.zeros(0, np.int32)})
+
+    def __getitem__(self, index):
+        return Keyframe(self, range(len(self))[index])
+
+    def __iter__(self):
+        return (Keyframe(self, i) for i in range(len(self)))
+
+    def add(self, count):
+        self._arrays["co"] = np.concatenate((self._arrays["co"], np.zeros((count, 2), np.float32)))
+        self._arrays["interpolation"] = np.concatenate(
+            (self._arrays["interpolation"], np.full(count, 2, np.int32))
+        )
+
+    def insert(self, frame, value, options=set()):
+        co = self._arrays["co"]
+        hit = np.nonzero(co[:, 0] == frame)[0] if len(co) else []
+        if len(hit):
+            co[hit[0], 1] = value
+            return Keyframe(self, int(hit[0]))
+        self.add(1)
+        self._arrays["co"][-1] = (frame, value)
+        self._id_data.update()
+        return Keyframe(self, int(np.nonzero(self._arrays["co"][:, 0] == frame)[0][0]))
+
+
+class FCurve(bpy_struct):
+    def __init__(self, data_path, index=0):
+        self.data_path = data_path
+        self.array_index = index
+        self.keyframe_points = _KeyframePoints(self)
+        self.mute = False
+
+    def update(self):
+        points = self.keyframe_points
+        order = np.argsort(points._arrays["co"][:, 0], kind="stable")
+        points._arrays["co"] = points._arrays["co"][order]
+        points._arrays["interpolation"] = points._arrays["interpolation"][order]
+
+    def evaluate(self, frame):
+        co = self.keyframe_points._arrays["co"]
+        if len(co) == 0:
+            return 0.0
+        order = np.argsort(co[:, 0], kind="stable")
+        xs = co[order, 0].astype(np.float64)
+        ys = co[order, 1].astype(np.float64)
+        interp = self.keyframe_points._arrays["interpolation"][order]
+        if frame <= xs[0]:
+            return float(ys[0])
+        if frame >= xs[-1]:
+            return float(ys[-1])
+        i = int(np.searchsorted(xs, frame, side="right")) - 1
+        if interp[i] == 0:
+            return float(ys[i])
+        t = (frame - xs[i]) / (xs[i + 1] - xs[i])
+        if interp[i] == 2:
+            t = t * t * (3.0 - 2.0 * t)
+        return float(ys[i] + (ys[i + 1] - ys[i]) * t)
+
+
+class DriverTarget(bpy_struct):
+    def __init__(self):
+        self.id_type = 'OBJECT'
+        self.id = None
+        self.data_path = ""
+
+
+class DriverVariable(bpy_struct):
+    def __init__(self):
+        self.name = "var"
+        self.type = 'SINGLE_PROP'
+        self.targets = [DriverTarget()]
+
+
+class _DriverVariables(bpy_struct):
+    def __init__(self):
+        self._items = []
+
+    def new(self):
+        var = DriverVariable()
+        self._items.append(var)
+        return var
+
+    def remove(self, var):
+        self._items.remove(var)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+
+class Driver(bpy_struct):
+    def __init__(self):
+        self.type = 'SCRIPTED'
+        self.expression = ""
+        self.variables = _DriverVariables()
+
+
+class _FCurves(bpy_struct):
+    def __init__(self):
+        self._items = []
+
+    def new(self, data_path, index=0, action_group=""):
+        fcurve = FCurve(data_path, index)
+        self._items.append(fcurve)
+        return fcurve
+
+    def find(self, data_path, index=0):
+        for fcurve in self._items:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        return None
+
+    def remove(self, fcurve):
+        self._items.remove(fcurve)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+
+class Action(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.fcurves = _FCurves()
+        self.layers = []
+
+
+class Mesh(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.vertices = _ArrayCollection(self, {"co": np.zeros((0, 3), np.float32)})
+        self.shape_keys = None
+        self.update_count = 0
+
+    def from_pydata(self, vertices, edges, faces, shade_flat=True):
+        self.vertices = _ArrayCollection(self, {"co": np.asarray(vertices, np.float32).reshape(-1, 3).copy()})
+
+    def update(self, calc_edges=False):
+        self.update_count += 1
+
+    def _bound_box(self):
+        co = self.vertices._arrays["co"]
+        if len(co) == 0:
+            return [(0.0, 0.0, 0.0)] * 8
+        lo = co.min(axis=0).tolist()
+        hi = co.max(axis=0).tolist()
+        return [
+            (lo[0], lo[1], lo[2]),
+            (lo[0], lo[1], hi[2]),
+            (lo[0], hi[1], hi[2]),
+            (lo[0], hi[1], lo[2]),
+            (hi[0], lo[1], lo[2]),
+            (hi[0], lo[1], hi[2]),
+            (hi[0], hi[1], hi[2]),
+            (hi[0], hi[1], lo[2]),
+        ]
+
+
+def _uniform_lattice(u, v, w):
+    def axis(n):
+        return -0.5 + np.arange(n) / (n - 1) if n > 1 else np.zeros(1)
+
+    ww, vv, uu = np.meshgrid(axis(w), axis(v), axis(u), indexing="ij")
+    return np.stack((uu, vv, ww), axis=-1).reshape(-1, 3).astype(np.float32)
+
+
+class Lattice(ID):
+    _INTERPOLATIONS = ("KEY_LINEAR", "KEY_CARDINAL", "KEY_CATMULL_ROM", "KEY_BSPLINE")
+
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.__dict__["_res"] = [2, 2, 2]
+        self.__dict__["interpolation_type_u"] = "KEY_BSPLINE"
+        self.__dict__["interpolation_type_v"] = "KEY_BSPLINE"
+        self.__dict__["interpolation_type_w"] = "KEY_BSPLINE"
+        self.use_outside = False
+        self.shape_keys = None
+        self._rebuild()
+
+    def __setattr__(self, name, value):
+        if name.startswith("interpolation_type_"):
+            if value not in self._INTERPOLATIONS:
+                raise TypeError(f"enum \"{value}\" not found in {self._INTERPOLATIONS}")
+        super().__setattr__(name, value)
+
+    def _rebuild(self):
+        co = _uniform_lattice(*self._res)
+        self.__dict__["points"] = _ArrayCollection(self, {"co": co, "co_deform": co.copy(), "weight_softbody": np.ones(len(co), np.float32)})
+
+    def _resolution(axis):
+        def getter(self):
+            return self._res[axis]
+
+        def setter(self, value):
+            value = int(value)
+            if not 1 <= value <= 64:
+                raise ValueError("points must be in [1, 64]")
+            if value != self._res[axis]:
+                self._res[axis] = value
+                self._rebuild()
+                if self.shape_keys is not None:
+                    self.shape_keys._resize(len(self.points))
+
+        return property(getter, setter)
+
+    points_u = _resolution(0)
+    points_v = _resolution(1)
+    points_w = _resolution(2)
+    del _resolution
+
+
+class KeyBlock(bpy_struct):
+    def __init__(self, key, name, co):
+        self.__dict__["_id_data"] = key
+        self.name = name
+        self.value = 0.0
+        self.mute = False
+        self.relative_key = None
+        self.data = _ArrayCollection(key, {"co": co})
+        self.__dict__["_path"] = f'key_blocks["{name}"]'
+
+    def __setattr__(self, name, value):
+        if name == "name":
+            self.__dict__["_path"] = f'key_blocks["{value}"]'
+        object.__setattr__(self, name, value)
+
+
+class Key(ID):
+    def __init__(self, name, owner):
+        super().__init__(name)
+        self.user = owner
+        self.use_relative = True
+        self.key_blocks = bpy_prop_collection_idprop(KeyBlock)
+        self.reference_key = None
+
+    def _resize(self, count):
+        for kb in self.key_blocks:
+            kb.data._arrays["co"] = np.zeros((count, 3), np.float32)
+
+
+class Collection(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.objects = _CollectionObjects(self)
+        self.children = _CollectionChildren(self)
+        self.hide_viewport = False
+        self.instance_offset = Vector((0.0, 0.0, 0.0))
+
+    @property
+    def all_objects(self):
+        seen = {}
+        stack = [self]
+        visited = set()
+        while stack:
+            coll = stack.pop()
+            if id(coll) in visited:
+                continue
+            visited.add(id(coll))
+            for obj in coll.objects:
+                seen.setdefault(id(obj), obj)
+            stack.extend(coll.children)
+        return list(seen.values())
+
+    @property
+    def children_recursive(self):
+        out = []
+        stack = list(self.children)
+        while stack:
+            coll = stack.pop(0)
+            if coll not in out:
+                out.append(coll)
+                stack.extend(coll.children)
+        return out
+
+
+class _CollectionObjects(bpy_struct):
+    def __init__(self, owner):
+        self._owner = owner
+        self._items = {}
+
+    def link(self, obj):
+        if id(obj) in self._items:
+            raise RuntimeError(f"Object '{obj.name}' already in collection '{self._owner.name}'")
+        self._items[id(obj)] = obj
+        obj._collections.append(self._owner)
+        obj._users += 1
+
+    def unlink(self, obj):
+        if self._items.pop(id(obj), None) is None:
+            raise RuntimeError(f"Object '{obj.name}' not in collection '{self._owner.name}'")
+        obj._collections.remove(self._owner)
+        obj._users -= 1
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, obj):
+        return id(obj) in self._items
+
+    def get(self, name, default=None):
+        for obj in self._items.values():
+            if obj.name == name:
+                return obj
+        return default
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            obj = self.get(key)
+            if obj is None:
+                raise KeyError(key)
+            return obj
+        return list(self._items.values())[key]
+
+
+class _CollectionChildren(bpy_struct):
+    def __init__(self, owner):
+        self._owner = owner
+        self._items = []
+
+    def link(self, coll):
+        if coll in self._items:
+            raise RuntimeError("already linked")
+        self._items.append(coll)
+        coll._users += 1
+
+    def unlink(self, coll):
+        self._items.remove(coll)
+        coll._users -= 1
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, coll):
+        return coll in self._items
+
+    def get(self, name, default=None):
+        for coll in self._items:
+            if coll.name == name:
+                return coll
+        return default
+
+
+class Modifier(bpy_struct):
+    def __init__(self, owner, name, type):
+        self.__dict__["_id_data"] = owner
+        self.name = name
+        self.type = type
+        self.show_viewport = True
+        self.show_render = True
+        self.show_in_editmode = False
+        self.show_on_cage = False
+        self.show_expanded = True
+        if type == 'LATTICE':
+            self.object = None
+            self.vertex_group = ""
+            self.invert_vertex_group = False
+            self.strength = 1.0
+        elif type == 'NODES':
+            self.node_group = None
+
+    def __setattr__(self, name, value):
+        if name == "name" and "name" in self.__dict__:
+            value = self.__dict__["_id_data"].modifiers._unique(value, exclude=self)
+        if name == "object":
+            _retarget(self.__dict__.get("object"), value, (id(self._id_data), id(self)), self._id_data)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return f"<Modifier {self.name} ({self.type})>"
+
+
+class _Modifiers(bpy_struct):
+    def __init__(self, owner):
+        self._owner = owner
+        self._items = []
+
+    def _unique(self, name, exclude=None):
+        names = {m.name for m in self._items if m is not exclude}
+        if name not in names:
+            return name
+        i = 1
+        while f"{name}.{i:03d}" in names:
+            i += 1
+        return f"{name}.{i:03d}"
+
+    def new(self, name, type):
+        mod = Modifier(self._owner, self._unique(name), type)
+        self._items.append(mod)
+        return mod
+
+    def remove(self, mod):
+        if mod not in self._items:
+            raise ReferenceError("Modifier not found")
+        self._items.remove(mod)
+        if getattr(mod, "object", None) is not None:
+            mod.object = None
+
+    def clear(self):
+        for mod in list(self._items):
+            self.remove(mod)
+
+    def move(self, src, dst):
+        mod = self._items.pop(src)
+        self._items.insert(dst, mod)
+
+    def get(self, name, default=None):
+        for mod in self._items:
+            if mod.name == name:
+                return mod
+        return default
+
+    def find(self, name):
+        for i, mod in enumerate(self._items):
+            if mod.name == name:
+                return i
+        return -1
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            mod = self.get(key)
+            if mod is None:
+                raise KeyError(key)
+            return mod
+        return self._items[key]
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, mod):
+        return mod in self._items
+
+
+class VertexGroup(bpy_struct):
+    def __init__(self, owner, name, index):
+        self.__dict__["_id_data"] = owner
+        self.name = name
+        self.index = index
+        self.lock_weight = False
+        self._weights = {}
+
+    def add(self, index, weight, type):
+        for i in index:
+            self._weights[int(i)] = float(weight)
+
+    def remove(self, index):
+        for i in index:
+            self._weights.pop(int(i), None)
+
+    def weight(self, index):
+        if int(index) not in self._weights:
+            raise RuntimeError("Vertex not in group")
+        return self._weights[int(index)]
+
+
+class _VertexGroups(bpy_struct):
+    def __init__(self, owner):
+        self._owner = owner
+        self._items = []
+        self.active_index = 0
+
+    def new(self, name="Group"):
+        names = {g.name for g in self._items}
+        unique = name
+        i = 1
+        while unique in names:
+            unique = f"{name}.{i:03d}"
+            i += 1
+        group = VertexGroup(self._owner, unique, len(self._items))
+        self._items.append(group)
+        return group
+
+    def remove(self, group):
+        self._items.remove(group)
+        for i, g in enumerate(self._items):
+            g.index = i
+
+    def get(self, name, default=None):
+        for group in self._items:
+            if group.name == name:
+                return group
+        return default
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            group = self.get(key)
+            if group is None:
+                raise KeyError(key)
+            return group
+        return self._items[key]
+
+
+_OBJECT_TYPES = {"Mesh": 'MESH', "Lattice": 'LATTICE', "Curve": 'CURVE'}
+
+
+def _retarget(old, new, key, user):
+    # Objects keep a reverse index of who points at them (children, modifier
+    # targets), so removing an object does not scan every object in the file.
+    if old is not None:
+        old._referrers.pop(key, None)
+    if new is not None:
+        new._referrers[key] = user
+
+
+class Object(ID):
+    def __init__(self, name="", data=None):
+        super().__init__(name)
+        self.__dict__["data"] = None
+        self.__dict__["_referrers"] = {}
+        self.type = _OBJECT_TYPES.get(type(data).__name__, 'EMPTY') if data is not None else 'EMPTY'
+        self.data = data
+        self.modifiers = _Modifiers(self)
+        self.vertex_groups = _VertexGroups(self)
+        self.parent = None
+        self.matrix_world = Matrix.Identity(4)
+        self.matrix_parent_inverse = Matrix.Identity(4)
+        self.hide_viewport = False
+        self.hide_render = False
+        self.display_type = 'TEXTURED'
+        self.instance_type = 'NONE'
+        self.instance_collection = None
+        self.mode = 'OBJECT'
+        self._collections = []
+        self._hidden = False
+
+    def __setattr__(self, name, value):
+        if name == "data":
+            old = self.__dict__.get("data")
+            if old is not None:
+                old._users -= 1
+            if value is not None:
+                value._users += 1
+        if name == "parent":
+            _retarget(self.__dict__.get("parent"), value, (id(self), None), self)
+        if name in ("matrix_world", "matrix_parent_inverse") and value is not None:
+            value = value.copy()
+        super().__setattr__(name, value)
+
+    @property
+    def users_collection(self):
+        return tuple(self._collections)
+
+    @property
+    def children(self):
+        users = {id(o): o for o in self._referrers.values()}
+        return tuple(o for o in users.values() if o.parent is self)
+
+    @property
+    def location(self):
+        return self.matrix_world.translation
+
+    @location.setter
+    def location(self, value):
+        m = self.matrix_world.copy()
+        m.translation = value
+        self.matrix_world = m
+
+    @property
+    def dimensions(self):
+        box = self.bound_box
+        lo = [min(c[i] for c in box) for i in range(3)]
+        hi = [max(c[i] for c in box) for i in range(3)]
+        m3 = self.matrix_world.to_3x3()
+        return Vector((hi[i] - lo[i]) * m3.col[i].length for i in range(3))
+
+    @property
+    def bound_box(self):
+        if self.type == 'MESH':
+            return self.data._bound_box()
+        if self.type == 'LATTICE':
+            h = 0.5
+            return [(x, y, z) for x in (-h, h) for y in (-h, h) for z in (-h, h)]
+        return [(-1.0, -1.0, -1.0), (-1.0, -1.0, 1.0), (-1.0, 1.0, 1.0), (-1.0, 1.0, -1.0),
+                (1.0, -1.0, -1.0), (1.0, -1.0, 1.0), (1.0, 1.0, 1.0), (1.0, 1.0, -1.0)]
+
+    def select_get(self, view_layer=None):
+        import bpy
+
+        return bpy.context.view_layer._is_selected(self)
+
+    def select_set(self, state, view_layer=None):
+        import bpy
+
+        bpy.context.view_layer._set_selected(self, state)
+
+    def hide_get(self, view_layer=None):
+        return self._hidden
+
+    def hide_set(self, state, view_layer=None):
+        self._hidden = bool(state)
+
+    def visible_get(self, view_layer=None, viewport=None):
+        return not (self._hidden or self.hide_viewport)
+
+    def shape_key_add(self, name="Key", from_mix=True):
+        if self.type == 'LATTICE':
+            co = self.data.points._arrays["co_deform"]
+        elif self.type == 'MESH':
+            co = self.data.vertices._arrays["co"]
+        else:
+            raise RuntimeError("Object does not support shape keys")
+        import bpy
+
+        data = self.data
+        if data.shape_keys is None:
+            data.shape_keys = bpy.data.shape_keys._new_key("Key", data)
+        key = data.shape_keys
+        names = set(key.key_blocks.keys())
+        unique = name
+        i = 1
+        while unique in names:
+            unique = f"{name}.{i:03d}"
+            i += 1
+        kb = KeyBlock(key, unique, co.copy())
+        key.key_blocks._items.append(kb)
+        if key.reference_key is None:
+            key.reference_key = kb
+        return kb
+
+    def shape_key_remove(self, key_block):
+        key = self.data.shape_keys
+        key.key_blocks._items.remove(key_block)
+
+    def shape_key_clear(self):
+        import bpy
+
+        if self.data.shape_keys is not None:
+            bpy.data.shape_keys.remove(self.data.shape_keys)
+            self.data.shape_keys = None
+
+    def to_mesh(self, preserve_all_data_layers=False, depsgraph=None):
+        return self.data
+
+    def to_mesh_clear(self):
+        pass
+
+    def update_from_editmode(self):
+        return True
+
+
+class NodeTree(ID):
+    pass
+
+
+class Library(ID):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.filepath = name
+
+    def reload(self):
+        pass
+
+
+class Image(ID):
+    pass
+
+
+class Material(ID):
+    pass
+
+
+class Scene(ID):
+    def __init__(self, name="Scene"):
+        super().__init__(name)
+        self.collection = Collection("Scene Collection")
+        self.frame_start = 1
+        self.frame_end = 250
+        self.frame_current = 1
+        self.frame_step = 1
+        self.render = _Namespace(fps=24, fps_base=1.0)
+        self.tool_settings = _Namespace()
+
+    @property
+    def objects(self):
+        return self.collection.all_objects
+
+    def frame_set(self, frame, subframe=0.0):
+        import bpy
+
+        self.frame_current = int(frame)
+        for handler in list(bpy.app.handlers.frame_change_pre) + list(bpy.app.handlers.frame_change_post):
+            handler(self, None)
+
+
+class _Namespace(bpy_struct):
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+class Depsgraph(bpy_struct):
+    def __init__(self, view_layer):
+        self.view_layer = view_layer
+        self.updates = []
+
+    @property
+    def scene(self):
+        return self.view_layer._scene
+
+    def update(self):
+        self.view_layer.update()
+
+    def id_eval_get(self, id):
+        return id
+
+
+class LayerObjects(bpy_struct):
+    def __init__(self, view_layer):
+        self._view_layer = view_layer
+        self.active = None
+
+    def __iter__(self):
+        return iter(self._view_layer._scene.objects)
+
+    def __len__(self):
+        return len(self._view_layer._scene.objects)
+
+    def get(self, name, default=None):
+        for obj in self._view_layer._scene.objects:
+            if obj.name == name:
+                return obj
+        return default
+
+    @property
+    def selected(self):
+        return self._view_layer._selected_list()
+
+
+class ViewLayer(bpy_struct):
+    def __init__(self, scene, name="ViewLayer"):
+        self._scene = scene
+        self.name = name
+        self.objects = LayerObjects(self)
+        self._selected = {}
+        self.update_count = 0
+        self.depsgraph = Depsgraph(self)
+
+    def update(self):
+        self.update_count += 1
+
+    def _is_selected(self, obj):
+        return id(obj) in self._selected
+
+    def _set_selected(self, obj, state):
+        if state:
+            self._selected[id(obj)] = obj
+        else:
+            self._selected.pop(id(obj), None)
+
+    def _selected_list(self):
+        return list(self._selected.values())
+
+
+class WindowManager(ID):
+    def __init__(self):
+        super().__init__("WinMan")
+        self.progress = None
+        self.progress_log = []
+        self.modal_handlers = []
+        self.timers = []
+        self.windows = []
+
+    def progress_begin(self, min, max):
+        self.progress = (float(min), float(max), float(min))
+        self.progress_log.append(("begin", float(min), float(max)))
+
+    def progress_update(self, value):
+        if self.progress is not None:
+            lo, hi, _ = self.progress
+            self.progress = (lo, hi, float(value))
+        self.progress_log.append(("update", float(value)))
+
+    def progress_end(self):
+        self.progress = None
+        self.progress_log.append(("end",))
+
+    def modal_handler_add(self, operator):
+        self.modal_handlers.append(operator)
+        return True
+
+    def event_timer_add(self, time_step, window=None):
+        timer = _Namespace(time_step=time_step, time_duration=0.0)
+        self.timers.append(timer)
+        return timer
+
+    def event_timer_remove(self, timer):
+        if timer in self.timers:
+            self.timers.remove(timer)
+
+    def invoke_props_dialog(self, operator, width=300):
+        return {'RUNNING_MODAL'}
+
+    def invoke_confirm(self, operator, event, **kwargs):
+        return {'RUNNING_MODAL'}
+
+    def invoke_props_popup(self, operator, event):
+        return {'RUNNING_MODAL'}
+
+    def fileselect_add(self, operator):
+        return {'RUNNING_MODAL'}
+
+    def popup_menu(self, draw_func, title="", icon='NONE'):
+        pass
+
+
+class UILayout(bpy_struct):
+    """Accepts every layout call; used to smoke-test ``draw`` methods."""
+
+    def __init__(self):
+        self.calls = []
+        self.enabled = True
+        self.active = True
+        self.alert = False
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.use_property_split = False
+        self.use_property_decorate = True
+
+    def _child(self, *args, **kwargs):
+        child = UILayout()
+        self.calls.append(child)
+        return child
+
+    row = column = box = split = column_flow = grid_flow = _child
+
+    def operator(self, idname, **kwargs):
+        self.calls.append(("operator", idname, kwargs))
+        return _Namespace()
+
+    def prop(self, data, attr, **kwargs):
+        if not hasattr(data, attr):
+            raise AttributeError(f"layout.prop: property not found: {type(data).__name__}.{attr}")
+        self.calls.append(("prop", attr, kwargs))
+
+    def label(self, **kwargs):
+        self.calls.append(("label", kwargs))
+
+    def separator(self, **kwargs):
+        pass
+
+    def template_list(self, *args, **kwargs):
+        self.calls.append(("template_list", args, kwargs))
+
+    def template_icon(self, **kwargs):
+        pass
+
+    def prop_search(self, *args, **kwargs):
+        self.calls.append(("prop_search", args, kwargs))
+
+    def menu(self, *args, **kwargs):
+        pass
+
+    def progress(self, **kwargs):
+        pass
+
+
+class Context(bpy_struct):
+    def __init__(self):
+        self._overrides = []
+        self.window_manager = WindowManager()
+        self.window = None
+        self.area = None
+        self.region = None
+        self.space_data = None
+        self.preferences = _Namespace(addons={})
+        self._mode = 'OBJECT'
+
+    def _lookup(self, name):
+        for layer in reversed(self._overrides):
+            if name in layer:
+                return True, layer[name]
+        return False, None
+
+    def __getattribute__(self, name):
+        if not name.startswith("_") and name not in ("temp_override", "copy", "evaluated_depsgraph_get"):
+            found, value = object.__getattribute__(self, "_lookup")(name)
+            if found:
+                return value
+        return object.__getattribute__(self, name)
+
+    @property
+    def scene(self):
+        import bpy
+
+        return bpy.data._active_scene
+
+    @property
+    def view_layer(self):
+        return self.scene._view_layer
+
+    @property
+    def collection(self):
+        return self.scene.collection
+
+    @property
+    def selected_objects(self):
+        return self.view_layer._selected_list()
+
+    @property
+    def selected_editable_objects(self):
+        return self.selected_objects
+
+    @property
+    def active_object(self):
+        return self.view_layer.objects.active
+
+    @property
+    def object(self):
+        return self.view_layer.objects.active
+
+    @property
+    def edit_object(self):
+        obj = self.view_layer.objects.active
+        return obj if obj is not None and obj.mode == 'EDIT' else None
+
+    @property
+    def mode(self):
+        obj = self.view_layer.objects.active
+        if obj is not None and obj.mode == 'EDIT':
+            return {'LATTICE': 'EDIT_LATTICE', 'MESH': 'EDIT_MESH'}.get(obj.type, 'EDIT')
+        return 'OBJECT'
+
+    def evaluated_depsgraph_get(self):
+        return self.view_layer.depsgraph
+
+    def copy(self):
+        return {}
+
+    def temp_override(self, **overrides):
+        context = self
+
+        class _Override:
+            def __enter__(self_inner):
+                context._overrides.append(overrides)
+                return context
+
+            def __exit__(self_inner, *exc):
+                context._overrides.pop()
+                return False
+
+        return _Override()
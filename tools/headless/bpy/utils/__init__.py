@@ -0,0 +1,59 @@
+from .. import types as _types
+from ..props import _PropertyDeferred
+from . import previews  # noqa: F401
+
+_registered = []
+
+
+def _annotations(cls):
+    merged = {}
+    for base in reversed(cls.__mro__):
+        merged.update(getattr(base, "__annotations__", {}) or {})
+    return merged
+
+
+def register_class(cls):
+    if cls in _registered:
+        raise ValueError(f"register_class(...): already registered as a subclass '{cls.__name__}'")
+    for name, value in _annotations(cls).items():
+        if isinstance(value, _PropertyDeferred):
+            prop = _PropertyDeferred(value.function, value.keywords)
+            prop.attr = name
+            setattr(cls, name, prop)
+    _registered.append(cls)
+    if issubclass(cls, _types.Operator):
+        from .. import ops
+
+        ops._register_operator(cls)
+
+
+def unregister_class(cls):
+    if cls not in _registered:
+        raise RuntimeError(f"unregister_class(...): missing bl_rna attribute from '{cls.__name__}'")
+    _registered.remove(cls)
+    if issubclass(cls, _types.Operator):
+        from .. import ops
+
+        ops._unregister_operator(cls)
+
+
+def is_registered(cls):
+    return cls in _registered
+
+
+def register_classes_factory(classes):
+    def register():
+        for cls in classes:
+            register_class(cls)
+
+    def unregister():
+        for cls in reversed(classes):
+            unregister_class(cls)
+
+    return register, unregister
+
+
+def user_resource(resource_type, path="", create=False):
+    import tempfile
+
+    return tempfile.gettempdir()
@@ -0,0 +1,25 @@
+class ImagePreview:
+    def __init__(self, name):
+        self.name = name
+        self.icon_id = abs(hash(name)) % 100000
+
+
+class ImagePreviewCollection(dict):
+    def load(self, name, filepath, filetype, force_reload=False):
+        preview = ImagePreview(name)
+        self[name] = preview
+        return preview
+
+    def new(self, name):
+        return self.load(name, "", 'IMAGE')
+
+    def close(self):
+        self.clear()
+
+
+def new():
+    return ImagePreviewCollection()
+
+
+def remove(pcoll):
+    pcoll.close()
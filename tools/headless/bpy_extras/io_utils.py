@@ -0,0 +1,18 @@
+from bpy.props import StringProperty
+
+
+class ExportHelper:
+    filepath: StringProperty(name="File Path", subtype='FILE_PATH')
+    check_extension = True
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class ImportHelper:
+    filepath: StringProperty(name="File Path", subtype='FILE_PATH')
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
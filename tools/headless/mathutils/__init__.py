@@ -0,0 +1,294 @@
+"""Minimal pure-Python stand-in for Blender's ``mathutils`` module.
+
+Only the subset used by the add-on is implemented. Values are stored as Python
+floats (Blender stores single precision), which is close enough for tests.
+"""
+
+import math
+
+
+class Vector:
+    __slots__ = ("_v", "_owner")
+
+    def __init__(self, seq=(0.0, 0.0, 0.0)):
+        self._v = [float(x) for x in seq]
+        self._owner = None
+
+    @classmethod
+    def _wrap(cls, values, owner=None):
+        vec = cls(values)
+        vec._owner = owner
+        return vec
+
+    def _sync(self):
+        if self._owner is not None:
+            self._owner(self._v)
+
+    def __len__(self):
+        return len(self._v)
+
+    def __iter__(self):
+        return iter(list(self._v))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [*self._v[index]]
+        return self._v[index]
+
+    def __setitem__(self, index, value):
+        self._v[index] = float(value)
+        self._sync()
+
+    def _axis(index):
+        def getter(self):
+            return self._v[index]
+
+        def setter(self, value):
+            self[index] = value
+
+        return property(getter, setter)
+
+    x = _axis(0)
+    y = _axis(1)
+    z = _axis(2)
+    w = _axis(3)
+    del _axis
+
+    def __repr__(self):
+        return f"Vector(({', '.join(f'{x:.4f}' for x in self._v)}))"
+
+    def __eq__(self, other):
+        try:
+            return list(self._v) == [float(x) for x in other]
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def _binary(self, other, op):
+        if isinstance(other, (int, float)):
+            return Vector(op(a, other) for a in self._v)
+        return Vector(op(a, float(b)) for a, b in zip(self._v, other))
+
+    def __add__(self, other):
+        return self._binary(other, lambda a, b: a + b)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._binary(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        return Vector(float(b) - a for a, b in zip(self._v, other))
+
+    def __mul__(self, other):
+        return self._binary(other, lambda a, b: a * b)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self._binary(other, lambda a, b: a / b)
+
+    def __neg__(self):
+        return Vector(-a for a in self._v)
+
+    def __iadd__(self, other):
+        self._v = (self + other)._v
+        self._sync()
+        return self
+
+    def __isub__(self, other):
+        self._v = (self - other)._v
+        self._sync()
+        return self
+
+    def __imul__(self, other):
+        self._v = (self * other)._v
+        self._sync()
+        return self
+
+    def copy(self):
+        return Vector(self._v)
+
+    def to_tuple(self, precision=-1):
+        if precision < 0:
+            return tuple(self._v)
+        return tuple(round(a, precision) for a in self._v)
+
+    def to_3d(self):
+        return Vector((self._v + [0.0, 0.0, 0.0])[:3])
+
+    def to_4d(self):
+        values = (self._v + [0.0, 0.0, 0.0])[:3]
+        return Vector(values + [1.0])
+
+    def dot(self, other):
+        return sum(a * float(b) for a, b in zip(self._v, other))
+
+    def cross(self, other):
+        a, b = self._v, [float(x) for x in other]
+        return Vector((a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]))
+
+    @property
+    def length(self):
+        return math.sqrt(sum(a * a for a in self._v))
+
+    def normalized(self):
+        length = self.length
+        return Vector(a / length for a in self._v) if length > 0 else self.copy()
+
+    def lerp(self, other, factor):
+        t = float(factor)
+        return Vector(a * (1.0 - t) + float(b) * t for a, b in zip(self._v, other))
+
+
+class _Column:
+    def __init__(self, matrix):
+        self._m = matrix
+
+    def __getitem__(self, index):
+        return Vector(self._m._rows[r][index] for r in range(len(self._m._rows)))
+
+    def __len__(self):
+        return len(self._m._rows[0])
+
+
+class Matrix:
+    def __init__(self, rows=None):
+        if rows is None:
+            rows = [[1.0 if r == c else 0.0 for c in range(4)] for r in range(4)]
+        self._rows = [[float(x) for x in row] for row in rows]
+
+    @classmethod
+    def Identity(cls, size=4):
+        return cls([[1.0 if r == c else 0.0 for c in range(size)] for r in range(size)])
+
+    @classmethod
+    def Translation(cls, vec):
+        m = cls.Identity(4)
+        for i in range(3):
+            m._rows[i][3] = float(vec[i])
+        return m
+
+    @classmethod
+    def Diagonal(cls, vec):
+        size = len(vec)
+        return cls([[float(vec[r]) if r == c else 0.0 for c in range(size)] for r in range(size)])
+
+    @classmethod
+    def Scale(cls, factor, size=4, axis=None):
+        m = cls.Identity(size)
+        for i in range(min(size, 3)):
+            m._rows[i][i] = float(factor)
+        return m
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        row = self._rows[index]
+
+        def write(values, row=row):
+            row[:] = values
+
+        return Vector._wrap(row, write)
+
+    def __setitem__(self, index, value):
+        self._rows[index] = [float(x) for x in value]
+
+    def __iter__(self):
+        return iter([self[i] for i in range(len(self._rows))])
+
+    def __repr__(self):
+        return "Matrix(" + repr(self._rows) + ")"
+
+    def __eq__(self, other):
+        return isinstance(other, Matrix) and self._rows == other._rows
+
+    __hash__ = None
+
+    @property
+    def col(self):
+        return _Column(self)
+
+    @property
+    def translation(self):
+        return Vector(self._rows[r][3] for r in range(3))
+
+    @translation.setter
+    def translation(self, vec):
+        for r in range(3):
+            self._rows[r][3] = float(vec[r])
+
+    def copy(self):
+        return Matrix(self._rows)
+
+    def __matmul__(self, other):
+        if isinstance(other, Matrix):
+            n, m, p = len(self._rows), len(other._rows), len(other._rows[0])
+            return Matrix(
+                [[sum(self._rows[i][k] * other._rows[k][j] for k in range(m)) for j in range(p)] for i in range(n)]
+            )
+        values = [float(x) for x in other]
+        size = len(self._rows)
+        if len(values) == size:
+            return Vector(sum(self._rows[i][k] * values[k] for k in range(size)) for i in range(size))
+        if size == 4 and len(values) == 3:
+            full = values + [1.0]
+            out = [sum(self._rows[i][k] * full[k] for k in range(4)) for i in range(4)]
+            w = out[3] if out[3] != 0 else 1.0
+            return Vector(v / w for v in out[:3])
+        raise ValueError("matrix/vector size mismatch")
+
+    def to_3x3(self):
+        return Matrix([row[:3] for row in self._rows[:3]])
+
+    def to_4x4(self):
+        if len(self._rows) == 4:
+            return self.copy()
+        m = Matrix.Identity(4)
+        for r in range(3):
+            m._rows[r][:3] = self._rows[r][:3]
+        return m
+
+    def to_translation(self):
+        return self.translation
+
+    def transposed(self):
+        return Matrix([list(col) for col in zip(*self._rows)])
+
+    def normalized(self):
+        cols = [Vector(self._rows[r][c] for r in range(len(self._rows))).normalized() for c in range(len(self._rows[0]))]
+        return Matrix([[cols[c][r] for c in range(len(cols))] for r in range(len(self._rows))])
+
+    def determinant(self):
+        import numpy as np
+
+        return float(np.linalg.det(np.array(self._rows)))
+
+    def inverted(self, fallback=None):
+        import numpy as np
+
+        try:
+            return Matrix(np.linalg.inv(np.array(self._rows)).tolist())
+        except np.linalg.LinAlgError:
+            if fallback is not None:
+                return fallback
+            raise ValueError("Matrix.inverted(): matrix does not have an inverse")
+
+    def inverted_safe(self):
+        return self.inverted(fallback=Matrix.Identity(len(self._rows)))
+
+    def decompose(self):
+        loc = self.translation
+        m3 = self.to_3x3()
+        scale = Vector(m3.col[i].length for i in range(3))
+        return loc, m3.normalized(), scale
+
+
+class Euler(Vector):
+    pass
+
+
+class Quaternion(Vector):
+    pass
@@ -0,0 +1,354 @@
+"""Fuzz the fast deform paths against the loop reference and report their speedup.
+
+    python tools/headless/parity.py --cases 500 --seed 0
+
+Every case draws a resolution, a locked axis, Reset to Uniform and a small batch of
+Shift/Scale/Offset values, biased toward the edges the kernels must keep (axes
+below 4 points, negative and near-zero shift, zero offsets on locked axes, scale
+without shift). Each accelerated path runs the same case and must match
+``bevel_deformer.reference`` within ``--tolerance``; a failing case is shrunk to a
+smaller one before it is printed. The speed table times every path against the
+reference on one shared workload.
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass, replace
+from types import SimpleNamespace
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [HERE, os.path.join(os.path.dirname(os.path.dirname(HERE)), "addon")]
+
+import numpy as np  # noqa: E402
+
+import bpy  # noqa: E402
+import bevel_deformer  # noqa: E402
+from bevel_deformer import deform_ops, interactive_ops, kernels, layers, random_ops, reference, stages  # noqa: E402
+
+
+PARAMS = random_ops.RANDOM_PARAMS
+DEFAULTS = {"shift_factor": 0.0, "scale_factor": 1.0, "offset_x": 0.0, "offset_y": 0.0, "offset_z": 0.0}
+_EDGE_RESOLUTIONS = (1, 2, 3, 4, 5)
+_EDGE_SHIFTS = (0.0, 1e-9, -1e-9, 1.0, -1.0, 0.5, -0.5)
+_EDGE_SCALES = (1.0, 0.0, 2.0)
+_EDGE_OFFSETS = (0.0, 1e-9, -1e-9, 1.0)
+
+
+@dataclass(frozen=True)
+class Case:
+    resolution: tuple[int, int, int]
+    locked_idx: int
+    reset_to_uniform: bool
+    params: tuple[tuple[tuple[str, float], ...], ...]
+    noise_seed: int
+
+    def values(self, item: int) -> dict[str, float]:
+        return dict(self.params[item])
+
+    def start(self) -> np.ndarray:
+        """(B, N * 3) float32 points the case starts from (used without Reset to Uniform)."""
+        rest = kernels.uniform_coords(self.resolution).ravel()
+        noise = np.random.default_rng(self.noise_seed).normal(0.0, 0.05, (len(self.params), rest.size))
+        return (rest + noise).astype(np.float32)
+
+
+def _edge_or(rng, edges, low: float, high: float) -> float:
+    return float(rng.choice(edges)) if rng.random() < 0.5 else float(rng.uniform(low, high))
+
+
+def draw_case(rng, batch: int = 3) -> Case:
+    resolution = tuple(
+        int(rng.choice(_EDGE_RESOLUTIONS)) if rng.random() < 0.6 else int(rng.integers(6, 11)) for _ in range(3)
+    )
+    params = tuple(
+        (
+            ("shift_factor", _edge_or(rng, _EDGE_SHIFTS, -1.0, 1.0)),
+            ("scale_factor", _edge_or(rng, _EDGE_SCALES, 0.0, 2.0)),
+            ("offset_x", _edge_or(rng, _EDGE_OFFSETS, -2.0, 2.0)),
+            ("offset_y", _edge_or(rng, _EDGE_OFFSETS, -2.0, 2.0)),
+            ("offset_z", _edge_or(rng, _EDGE_OFFSETS, -2.0, 2.0)),
+        )
+        for _ in range(batch)
+    )
+    return Case(resolution, int(rng.integers(-1, 3)), bool(rng.random() < 0.5), params, int(rng.integers(2**31)))
+
+
+def expected(case: Case) -> np.ndarray:
+    start = case.start()
+    rows = []
+    for item in range(len(case.params)):
+        points = [tuple(p) for p in start[item].reshape(-1, 3).astype(np.float64)]
+        rows.append(np.ravel(reference.process_points(
+            points,
+            case.resolution,
+            reset_to_uniform=case.reset_to_uniform,
+            locked_idx=None if case.locked_idx < 0 else case.locked_idx,
+            **case.values(item),
+        )))
+    return np.asarray(rows, dtype=np.float64)
+
+
+# Fast paths: each takes a case and returns its (B, N * 3) result.
+
+def _chain(case: Case) -> tuple[str, ...]:
+    return (("reset",) if case.reset_to_uniform else ()) + stages.DEFAULT_CHAIN
+
+
+def _new_lattices(case: Case) -> list:
+    start = case.start()
+    lattices = []
+    for item in range(len(case.params)):
+        data = bpy.data.lattices.new(f"Parity_{item}_Data")
+        data.points_u, data.points_v, data.points_w = case.resolution
+        obj = bpy.data.objects.new(f"Parity_{item}", data)
+        bpy.context.scene.collection.objects.link(obj)
+        obj["bd_locked_axis_enabled"] = case.locked_idx >= 0
+        obj["bd_locked_axis_idx"] = case.locked_idx
+        data.points.foreach_set("co_deform", start[item])
+        lattices.append(obj)
+    return lattices
+
+
+def _read(lattices) -> np.ndarray:
+    rows = []
+    for obj in lattices:
+        co = np.empty(len(obj.data.points) * 3, dtype=np.float32)
+        obj.data.points.foreach_get("co_deform", co)
+        rows.append(co)
+        bpy.data.objects.remove(obj, do_unlink=True)
+    return np.asarray(rows, dtype=np.float64)
+
+
+def path_run_chain(case: Case) -> np.ndarray:
+    grid = kernels.grid_from_flat(case.start(), case.resolution)
+    per_item = {name: np.array([case.values(i)[name] for i in range(len(case.params))]) for name in PARAMS}
+    stages.run_chain(grid, _chain(case), per_item, locked_idx=case.locked_idx)
+    return grid.reshape(len(case.params), -1)
+
+
+def path_uniform_chain(case: Case) -> np.ndarray | None:
+    if not case.reset_to_uniform:
+        return None
+    chain = _chain(case)
+    return np.asarray([
+        stages.uniform_chain(case.resolution, case.locked_idx, chain, deform_ops.chain_memo_key(chain, case.values(i))).ravel()
+        for i in range(len(case.params))
+    ], dtype=np.float64)
+
+
+def path_smart_scale(case: Case) -> np.ndarray:
+    lattices = _new_lattices(case)
+    for item, obj in enumerate(lattices):
+        deform_ops.process_lattice_smart_scale(lattices=[obj], reset_to_uniform=case.reset_to_uniform, **case.values(item))
+    return _read(lattices)
+
+
+def path_batched_params(case: Case) -> np.ndarray:
+    lattices = _new_lattices(case)
+    per_lattice = {name: np.array([case.values(i)[name] for i in range(len(lattices))]) for name in PARAMS}
+    random_ops.deform_lattices_with_params(
+        lattices, per_lattice, chain=stages.DEFAULT_CHAIN, reset_to_uniform=case.reset_to_uniform,
+    )
+    return _read(lattices)
+
+
+def path_interactive(case: Case) -> np.ndarray:
+    lattices = _new_lattices(case)
+    for item, obj in enumerate(lattices):
+        values = case.values(item)
+        settings = SimpleNamespace(stage_chain=" ".join(stages.DEFAULT_CHAIN), reset_to_uniform=case.reset_to_uniform, **values)
+        plan = interactive_ops.DragPlan([obj], settings)
+        plan.apply({name: values[name] for name in interactive_ops._DRAG_PARAMS})
+    return _read(lattices)
+
+
+def path_layer(case: Case) -> np.ndarray | None:
+    if not case.reset_to_uniform:
+        return None
+    lattices = _new_lattices(case)
+    for item, obj in enumerate(lattices):
+        layers.deform_into_layer([obj], "Parity", stages.DEFAULT_CHAIN, case.values(item))
+        layers.flatten(obj)
+    return _read(lattices)
+
+
+def _with_stack(lattices) -> list:
+    # A disabled layer leaves the points alone but makes the lattices "layered".
+    for obj in lattices:
+        layers.set_stage_layer(obj, "Base", stages.DEFAULT_CHAIN, DEFAULTS)
+        layers.set_layer_enabled(obj, "Base", False)
+    return lattices
+
+
+def path_layered_deform(case: Case) -> np.ndarray | None:
+    # Layered lattices always take the sliders as a stage layer, which starts from the uniform grid.
+    if not case.reset_to_uniform:
+        return None
+    lattices = _with_stack(_new_lattices(case))
+    scene = bpy.context.scene
+    for item, obj in enumerate(lattices):
+        with deform_ops.suppress_live_update():
+            for name, value in case.values(item).items():
+                setattr(scene.bd_deform_settings, name, value)
+            scene.bd_deform_settings.reset_to_uniform = False
+        deform_ops.deform_with_settings(scene, [obj])
+        # What a later layer edit does: the stack must still hold the deform.
+        layers.rebuild(obj)
+        layers.flatten(obj)
+    return _read(lattices)
+
+
+def path_layered_interactive(case: Case) -> np.ndarray | None:
+    if not case.reset_to_uniform:
+        return None
+    lattices = _with_stack(_new_lattices(case))
+    for item, obj in enumerate(lattices):
+        values = case.values(item)
+        settings = SimpleNamespace(stage_chain=" ".join(stages.DEFAULT_CHAIN), reset_to_uniform=False, **values)
+        plan = interactive_ops.DragPlan([obj], settings, layer="Parity")
+        plan.apply({name: values[name] for name in interactive_ops._DRAG_PARAMS})
+        layers.rebuild(obj)
+        layers.flatten(obj)
+    return _read(lattices)
+
+
+PATHS = {
+    "run_chain (batched)": path_run_chain,
+    "uniform_chain (memo)": path_uniform_chain,
+    "process_lattice_smart_scale": path_smart_scale,
+    "per-lattice params": path_batched_params,
+    "interactive drag": path_interactive,
+    "deform layer": path_layer,
+    "layered deform": path_layered_deform,
+    "layered interactive drag": path_layered_interactive,
+}
+
+
+def error(path, case: Case) -> float | None:
+    result = path(case)
+    if result is None:
+        return None
+    return float(np.abs(result - expected(case)).max(initial=0.0))
+
+
+def _smaller(case: Case):
+    """Simpler neighbours of a case, simplest changes first."""
+    if len(case.params) > 1:
+        for item in range(len(case.params)):
+            yield replace(case, params=(case.params[item],))
+    for item, values in enumerate(case.params):
+        for i, (name, value) in enumerate(values):
+            if value != DEFAULTS[name]:
+                simpler = values[:i] + ((name, DEFAULTS[name]),) + values[i + 1:]
+                yield replace(case, params=case.params[:item] + (simpler,) + case.params[item + 1:])
+    if case.locked_idx >= 0:
+        yield replace(case, locked_idx=-1)
+    if not case.reset_to_uniform:
+        yield replace(case, reset_to_uniform=True)
+    for axis in range(3):
+        if case.resolution[axis] > 1:
+            resolution = list(case.resolution)
+            resolution[axis] -= 1
+            yield replace(case, resolution=tuple(resolution))
+
+
+def shrink(path, case: Case, tolerance: float) -> Case:
+    """Greedily simplify a failing case while it keeps failing."""
+    changed = True
+    while changed:
+        changed = False
+        for candidate in _smaller(case):
+            err = error(path, candidate)
+            if err is not None and err > tolerance:
+                case = candidate
+                changed = True
+                break
+    return case
+
+
+def fuzz(cases: int, seed: int, tolerance: float) -> dict[str, tuple[float, int, Case | None]]:
+    """Per path: (max error, cases checked, first failing case shrunk)."""
+    rng = np.random.default_rng(seed)
+    report = {label: (0.0, 0, None) for label in PATHS}
+    for _ in range(cases):
+        case = draw_case(rng)
+        for label, path in PATHS.items():
+            worst, checked, failure = report[label]
+            err = error(path, case)
+            if err is None:
+                continue
+            if err > tolerance and failure is None:
+                failure = shrink(path, case, tolerance)
+            report[label] = (max(worst, err), checked + 1, failure)
+    return report
+
+
+def speed(count: int, resolution: tuple[int, int, int], seed: int) -> list[tuple[str, float]]:
+    """Seconds per path for ``count`` lattices of one resolution, reference first."""
+    rng = np.random.default_rng(seed)
+    values = [dict(draw_case(rng, batch=1).params[0]) for _ in range(count)]
+    shared = values[0]
+    rest = [tuple(p) for p in kernels.uniform_coords(resolution).astype(np.float64)]
+    per_lattice = {name: np.array([v[name] for v in values]) for name in PARAMS}
+
+    lattices = _new_lattices(Case(resolution, -1, True, tuple(tuple(v.items()) for v in values), seed))
+
+    def timed(func) -> float:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    rows = [
+        ("reference (loops)", timed(lambda: [
+            reference.process_points(rest, resolution, reset_to_uniform=True, **v) for v in values
+        ])),
+        ("run_chain (batched)", timed(lambda: stages.run_chain(
+            kernels.uniform_grid(resolution, batch=count), ("reset",) + stages.DEFAULT_CHAIN, per_lattice,
+        ))),
+        ("process_lattice_smart_scale", timed(lambda: deform_ops.process_lattice_smart_scale(
+            lattices=lattices, reset_to_uniform=True, **shared,
+        ))),
+        ("per-lattice params", timed(lambda: random_ops.deform_lattices_with_params(
+            lattices, per_lattice, chain=stages.DEFAULT_CHAIN,
+        ))),
+    ]
+    _read(lattices)
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=300, help="random cases per path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=1e-5, help="max abs difference to the reference")
+    parser.add_argument("--lattices", type=int, default=500, help="lattices in the speed workload")
+    parser.add_argument("--resolution", type=int, nargs=3, default=(8, 8, 8), help="speed workload resolution")
+    args = parser.parse_args(argv)
+
+    bpy.reset()
+    bevel_deformer.register()
+    try:
+        print(f"Parity: {args.cases} case(s), seed {args.seed}, tolerance {args.tolerance:g}")
+        failed = False
+        for label, (worst, checked, failure) in fuzz(args.cases, args.seed, args.tolerance).items():
+            status = "FAIL" if failure is not None else "ok"
+            print(f"{label:<28} {status:<4} max error {worst:.2e} over {checked} case(s)")
+            if failure is not None:
+                failed = True
+                print(f"    smallest failing case: {failure}")
+
+        resolution = tuple(args.resolution)
+        print(f"\nSpeed: {args.lattices} lattice(s) at {resolution[0]}x{resolution[1]}x{resolution[2]}")
+        rows = speed(args.lattices, resolution, args.seed)
+        baseline = rows[0][1]
+        for label, elapsed in rows:
+            print(f"{label:<28} {elapsed * 1000.0:9.2f} ms  x{baseline / max(elapsed, 1e-9):8.1f}")
+    finally:
+        bevel_deformer.unregister()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
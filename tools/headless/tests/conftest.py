@@ -0,0 +1,41 @@
+"""Headless regression tests: ``python -m pytest tools/headless/tests``.
+
+They run the add-on against the ``bpy`` stand-in one directory up.
+"""
+
+import os
+import sys
+
+HEADLESS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [HEADLESS, os.path.join(os.path.dirname(os.path.dirname(HEADLESS)), "addon")]
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+import bpy  # noqa: E402
+import bevel_deformer  # noqa: E402
+
+
+@pytest.fixture
+def addon():
+    bpy.reset()
+    bevel_deformer.register()
+    yield bevel_deformer
+    bevel_deformer.unregister()
+
+
+def add_mesh(name: str, vertices: int = 200, size=(2.0, 1.0, 0.5), seed: int = 0, select: bool = True):
+    co = np.random.default_rng(seed).uniform(-1.0, 1.0, (vertices, 3)) * size
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(co, [], [])
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.select_set(select)
+    return obj
+
+
+def select_only(objects) -> None:
+    for obj in list(bpy.context.selected_objects):
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
@@ -0,0 +1,31 @@
+import bpy
+
+from bevel_deformer import anim_ops
+from conftest import add_mesh
+
+
+def _paths(keys) -> list[str]:
+    return [fcurve.data_path for fcurve in anim_ops._iter_fcurves(keys)]
+
+
+def test_rebake_keeps_other_shape_key_animation(addon):
+    mesh = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    lat_obj = mesh.modifiers[0].object
+    scene = bpy.context.scene
+
+    scene.bd_deform_settings.keyframe_insert("shift_factor", frame=1)
+    scene.bd_deform_settings.shift_factor = 0.4
+    scene.bd_deform_settings.keyframe_insert("shift_factor", frame=10)
+
+    lat_obj.shape_key_add(name="Basis", from_mix=False)
+    dent = lat_obj.shape_key_add(name="Dent", from_mix=False)
+    dent.keyframe_insert("value", frame=1)
+
+    for _ in range(2):
+        assert anim_ops.bake_deform_animation(scene, [lat_obj], frame_start=1, frame_end=10) == 1
+
+    paths = _paths(lat_obj.data.shape_keys)
+    assert 'key_blocks["Dent"].value' in paths
+    baked = [path for path in paths if path.startswith('key_blocks["BD_Frame_')]
+    assert baked and len(baked) == len(set(baked))
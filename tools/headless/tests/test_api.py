@@ -0,0 +1,50 @@
+import bpy
+import numpy as np
+
+from bevel_deformer import api, layers
+from conftest import add_mesh
+
+
+def _lattices(count: int = 3):
+    meshes = [add_mesh(f"Rock_{i}", seed=i, select=False) for i in range(count)]
+    return meshes, api.create_lattices(meshes).lattices
+
+
+def test_deform_reports_written_skipped_and_failed(addon):
+    _meshes, (plain, layered, backend, conflicted) = _lattices(4)
+    layers.set_stage_layer(layered, layers.DEFAULT_LAYER, ("shift",), {"shift_factor": 0.1})
+    backend["bd_gn_backend"] = True
+    co = np.empty(len(conflicted.data.points) * 3, dtype=np.float32)
+    conflicted.data.points.foreach_get("co_deform", co)
+    co[:3] += 0.25
+    conflicted.data.points.foreach_set("co_deform", co)
+    layers.capture_edits(conflicted, layers.DEFAULT_LAYER)
+
+    result = api.deform([plain, layered, backend, conflicted], shift_factor=0.3, offset_x=[0.1, 0.2, 0.3, 0.4])
+    assert result.written == [plain, layered]
+    assert result.layered == [layered]
+    assert list(result.skipped) == [backend.name]
+    assert list(result.failed) == [conflicted.name]
+
+
+def test_reset_reports_flattened_stacks(addon):
+    _meshes, (plain, layered, backend) = _lattices()
+    layers.set_stage_layer(layered, layers.DEFAULT_LAYER, ("shift",), {"shift_factor": 0.1})
+    backend["bd_gn_backend"] = True
+
+    result = api.reset([plain, layered, backend])
+    assert result.reset == [plain, layered]
+    assert result.flattened == [layered]
+    assert list(result.skipped) == [backend.name]
+    assert not layers.has_layers(layered)
+
+
+def test_delete_reports_names(addon):
+    meshes, lattices = _lattices(2)
+    names = [lat.name for lat in lattices]
+
+    result = api.delete(lattices)
+    assert result.deleted == names
+    assert not result.failed
+    assert all(name not in bpy.data.objects for name in names)
+    assert all(len(mesh.modifiers) == 0 for mesh in meshes)
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+import bpy
+import numpy as np
+import pytest
+
+from bevel_deformer import ffd
+from conftest import add_mesh
+
+
+@pytest.fixture
+def mesh(addon):
+    obj = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    return obj
+
+
+def test_can_bake_plain_lattice_modifier(mesh):
+    assert ffd.can_bake_directly(mesh, mesh.modifiers[0])
+
+
+def test_cannot_bake_modifier_hidden_in_viewport(mesh):
+    mod = mesh.modifiers[0]
+    mod.show_viewport = False
+    assert not ffd.can_bake_directly(mesh, mod)
+
+
+@pytest.mark.parametrize("attr", ["library", "override_library"])
+def test_cannot_bake_linked_or_overridden_mesh(mesh, attr):
+    library = bpy.types.Library("//rocks.blend")
+    setattr(mesh.data, attr, library if attr == "library" else SimpleNamespace(reference=library))
+    assert not ffd.can_bake_directly(mesh, mesh.modifiers[0])
+
+
+def _inside(count: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).uniform(-0.5, 0.5, (count, 3))
+
+
+def _trilinear(co: np.ndarray, deform: np.ndarray, resolution) -> np.ndarray:
+    grid = deform.reshape(resolution[2], resolution[1], resolution[0], 3)
+    out = np.empty_like(co)
+    for n, point in enumerate(co):
+        index, frac = [], []
+        for axis, count in enumerate(resolution):
+            pos = (point[axis] + 0.5) * (count - 1)
+            i = min(int(np.floor(pos)), count - 2)
+            index.append(i)
+            frac.append(pos - i)
+        value = np.zeros(3)
+        for du in (0, 1):
+            for dv in (0, 1):
+                for dw in (0, 1):
+                    weight = (
+                        (frac[0] if du else 1.0 - frac[0])
+                        * (frac[1] if dv else 1.0 - frac[1])
+                        * (frac[2] if dw else 1.0 - frac[2])
+                    )
+                    value += weight * grid[index[2] + dw, index[1] + dv, index[0] + du]
+        out[n] = value
+    return out
+
+
+@pytest.mark.parametrize("interpolation", ffd.INTERPOLATION_TYPES)
+def test_uniform_lattice_is_identity(interpolation):
+    resolution = (4, 3, 5)
+    co = _inside(500)
+    deformed = ffd.deform_points(co, ffd.rest_coords(*resolution), resolution, interpolation)
+    np.testing.assert_allclose(deformed, co, atol=1e-12)
+
+
+def test_linear_matches_trilinear_interpolation():
+    resolution = (3, 4, 2)
+    rng = np.random.default_rng(1)
+    deform = ffd.rest_coords(*resolution) + rng.normal(0.0, 0.1, (3 * 4 * 2, 3))
+    co = _inside(200, seed=2)
+    deformed = ffd.deform_points(co, deform, resolution, "KEY_LINEAR")
+    np.testing.assert_allclose(deformed, _trilinear(co, deform, resolution), atol=1e-12)
+
+
+def test_chunks_match_single_pass():
+    resolution = (5, 3, 4)
+    rng = np.random.default_rng(3)
+    deform = ffd.rest_coords(*resolution) + rng.normal(0.0, 0.05, (5 * 3 * 4, 3))
+    matrix = np.diag([0.5, 2.0, 1.0, 1.0])
+    matrix[:3, 3] = (0.1, -0.2, 0.0)
+    co = rng.uniform(-1.0, 1.0, (1000, 3))
+    interpolation = ("KEY_BSPLINE", "KEY_CARDINAL", "KEY_LINEAR")
+
+    whole = ffd.deform_points(co, deform, resolution, interpolation, matrix=matrix, chunk_size=len(co))
+    chunks = list(ffd.iter_deformed_chunks(co, deform, resolution, interpolation, matrix=matrix, chunk_size=97))
+    assert [(start, stop) for start, stop, _ in chunks] == [(s, min(s + 97, len(co))) for s in range(0, len(co), 97)]
+    np.testing.assert_array_equal(np.concatenate([chunk for _, _, chunk in chunks]), whole)
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+
+import bpy
+import numpy as np
+import pytest
+
+from bevel_deformer import cage_io, gn_backend, lattice_ops, layers, stages
+from conftest import add_mesh, select_only
+
+_INPUTS = ("Geometry", "Lattice", "Resolution", "Locked Axis", "Shift", "Scale", "Offset")
+
+
+@pytest.fixture
+def node_group(addon, monkeypatch):
+    # The stand-in has no node trees; only the group interface is read here.
+    items = [
+        SimpleNamespace(name=name, identifier=f"Socket_{i}", item_type='SOCKET', in_out='INPUT')
+        for i, name in enumerate(_INPUTS)
+    ]
+    group = SimpleNamespace(name="BD Bevel Deform", interface=SimpleNamespace(items_tree=items))
+    monkeypatch.setattr(gn_backend, "ensure_node_group", lambda interpolation: group)
+    return group
+
+
+@pytest.fixture
+def mesh(node_group):
+    obj = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    bpy.context.scene.bd_deform_settings.live_preview = False
+    return obj
+
+
+@pytest.fixture
+def backend(mesh, node_group):
+    lat_obj = mesh.modifiers[0].object
+    mod = gn_backend.enable_gn_backend(mesh, lat_obj, bpy.context.scene)
+    return lat_obj, mod, gn_backend._socket_identifiers(node_group)
+
+
+def _points(lat_obj) -> np.ndarray:
+    co = np.empty(len(lat_obj.data.points) * 3, dtype=np.float32)
+    lat_obj.data.points.foreach_get("co_deform", co)
+    return co.reshape(-1, 3)
+
+
+def _enable(mesh) -> bool:
+    select_only([mesh])
+    bpy.ops.bd.enable_gn_backend()
+    return mesh.modifiers.get(gn_backend.MODIFIER_NAME) is not None
+
+
+def _resolution_input(mod, identifiers):
+    return tuple(int(v) for v in mod[identifiers["Resolution"]])
+
+
+def test_change_resolution_updates_node_modifier(backend):
+    lat_obj, mod, identifiers = backend
+    assert lattice_ops.resample_lattice_resolution(lat_obj, (5, 7, 9))
+    assert _resolution_input(mod, identifiers) == (5, 7, 9)
+
+
+def test_cage_import_updates_node_modifier(backend, tmp_path):
+    lat_obj, mod, identifiers = backend
+    filepath = str(tmp_path / "cages.bdcage")
+    lattice_ops.resample_lattice_resolution(lat_obj, (4, 4, 4))
+    cage_io.export_lattices(filepath, [lat_obj])
+    lattice_ops.resample_lattice_resolution(lat_obj, (6, 6, 6))
+
+    assert cage_io.import_cages(filepath)[0] == 1
+    assert _resolution_input(mod, identifiers) == (4, 4, 4)
+
+
+def test_enable_refuses_layered_lattice(mesh):
+    layers.set_stage_layer(mesh.modifiers[0].object, "Bevel", stages.DEFAULT_CHAIN, {"shift_factor": 0.3})
+    assert not _enable(mesh)
+
+
+def test_enable_refuses_edited_lattice(mesh):
+    lat_obj = mesh.modifiers[0].object
+    co = _points(lat_obj)
+    co[0] += 0.2
+    lat_obj.data.points.foreach_set("co_deform", co.ravel())
+    assert not _enable(mesh)
+
+
+def test_enable_accepts_lattice_deformed_by_sliders(mesh):
+    select_only([mesh])
+    bpy.context.scene.bd_deform_settings.shift_factor = 0.3
+    bpy.ops.bd.deform_selected_lattices()
+    assert _enable(mesh)
+
+
+@pytest.mark.parametrize("name, value", [
+    ("reset_to_uniform", False),
+    ("stage_chain", "shift, taper, offset, scale"),
+    ("relax_profile", "SMOOTH"),
+    ("offset_falloff", "SMOOTH"),
+])
+def test_unsupported_setting_switches_back_to_lattice(backend, name, value):
+    lat_obj, _mod, _identifiers = backend
+    mesh = bpy.data.objects["Rock"]
+    settings = bpy.context.scene.bd_deform_settings
+    settings.shift_factor = 0.3
+
+    setattr(settings, name, value)
+    shown = gn_backend.slider_points(lat_obj, settings)
+    assert mesh.modifiers.get(gn_backend.MODIFIER_NAME) is None
+    assert mesh.modifiers[0].show_viewport
+    assert not lat_obj.get("bd_gn_backend")
+    np.testing.assert_allclose(_points(lat_obj), shown, atol=1e-6)
+
+
+def test_disable_deforms_layered_lattice_into_its_stack(backend):
+    lat_obj, _mod, _identifiers = backend
+    layers.set_stage_layer(lat_obj, "Base", stages.DEFAULT_CHAIN, {"offset_z": 0.1})
+    bpy.context.scene.bd_deform_settings.shift_factor = 0.3
+
+    select_only([bpy.data.objects["Rock"]])
+    bpy.ops.bd.disable_gn_backend()
+    deformed = _points(lat_obj).copy()
+    layers.clear_cache()
+    layers.rebuild(lat_obj)
+    np.testing.assert_allclose(_points(lat_obj), deformed, atol=1e-6)
+    assert [layer["name"] for layer in layers.read_layers(lat_obj)] == ["Base", layers.DEFAULT_LAYER]
+
+
+def test_drag_moves_sliders_for_backend_meshes(backend):
+    lat_obj, _mod, _identifiers = backend
+    settings = bpy.context.scene.bd_deform_settings
+    before = _points(lat_obj).copy()
+
+    select_only([bpy.data.objects["Rock"]])
+    assert bpy.ops.bd.interactive_deform('INVOKE_DEFAULT') == {'RUNNING_MODAL'}
+    op = bpy.context.window_manager.modal_handlers[-1]
+    op.modal(bpy.context, bpy.types.Event('MOUSEMOVE', mouse_x=40))
+    assert settings.shift_factor == pytest.approx(0.1)
+    np.testing.assert_array_equal(_points(lat_obj), before)
+
+    op.modal(bpy.context, bpy.types.Event('ESC', 'PRESS'))
+    assert settings.shift_factor == 0.0
@@ -0,0 +1,50 @@
+import bpy
+import numpy as np
+import pytest
+
+from bevel_deformer import ffd, influence
+from conftest import add_mesh, select_only
+
+
+@pytest.mark.parametrize("interpolation", ffd.INTERPOLATION_TYPES)
+def test_group_covers_every_displaced_vertex(interpolation):
+    resolution = (6, 5, 4)
+    rng = np.random.default_rng(0)
+    deform = ffd.rest_coords(*resolution)
+    deform[[7, 40, 95]] += rng.normal(0.0, 0.1, (3, 3))
+    co = rng.uniform(-0.7, 0.7, (4000, 3))
+
+    mask = influence.affected_vertices(co, influence.moved_points(deform, resolution), resolution, interpolation)
+    displaced = np.abs(ffd.deform_points(co, deform, resolution, interpolation) - co).max(axis=1) > 0.0
+    assert not (displaced & ~mask).any()
+    assert not mask.all()
+
+
+def test_uniform_lattice_influences_nothing():
+    resolution = (4, 4, 4)
+    moved = influence.moved_points(ffd.rest_coords(*resolution), resolution)
+    co = np.random.default_rng(1).uniform(-0.5, 0.5, (100, 3))
+    assert not influence.affected_vertices(co, moved, resolution, "KEY_BSPLINE").any()
+
+
+def test_groups_follow_deform_and_setting(addon):
+    mesh = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    mod = mesh.modifiers[0]
+    settings = bpy.context.scene.bd_lattice_settings
+    settings.auto_influence = True
+
+    select_only([mesh])
+    deform_settings = bpy.context.scene.bd_deform_settings
+    deform_settings.live_preview = False
+    deform_settings.shift_factor = 0.4
+    bpy.ops.bd.deform_selected_lattices()
+    influence.refresh_pending()
+
+    group = mesh.vertex_groups.get(influence.group_name(mod))
+    assert group is not None
+    assert mod.vertex_group == group.name
+
+    settings.auto_influence = False
+    assert mesh.vertex_groups.get(influence.group_name(mod)) is None
+    assert mod.vertex_group == ""
@@ -0,0 +1,94 @@
+import bpy
+import numpy as np
+
+from bevel_deformer import ffd, lattice_ops
+from conftest import add_mesh, select_only
+
+
+def _resolution(lat_obj):
+    lat = lat_obj.data
+    return lat.points_u, lat.points_v, lat.points_w
+
+
+def test_create_rebuilds_lattice_resized_by_change_resolution(addon):
+    mesh = add_mesh("Rock")
+    settings = bpy.context.scene.bd_lattice_settings
+    settings.base_resolution = 6
+    bpy.ops.bd.create_lattice_multi()
+    fitted = _resolution(mesh.modifiers[0].object)
+
+    select_only([mesh])
+    settings.base_resolution = 10
+    bpy.ops.bd.change_lattice_resolution()
+    assert _resolution(mesh.modifiers[0].object) != fitted
+
+    select_only([mesh])
+    settings.base_resolution = 6
+    bpy.ops.bd.create_lattice_multi()
+    assert _resolution(mesh.modifiers[0].object) == fitted
+
+
+def test_create_keeps_unchanged_lattice(addon):
+    mesh = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    lat_obj = mesh.modifiers[0].object
+
+    select_only([mesh])
+    bpy.ops.bd.create_lattice_multi()
+    assert mesh.modifiers[0].object is lat_obj
+
+
+def test_apply_skips_linked_mesh(addon):
+    mesh = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    lat_obj = mesh.modifiers[0].object
+    mesh.data.library = bpy.types.Library("//rocks.blend")
+
+    select_only([mesh])
+    bpy.ops.bd.apply_lattice()
+    assert mesh.modifiers[0].object is lat_obj
+    assert lat_obj.name in bpy.data.objects
+
+
+def _affine_lattice(resolution):
+    lat_obj = bpy.data.objects.new("Cage", bpy.data.lattices.new("Cage"))
+    lat_obj.data.points_u, lat_obj.data.points_v, lat_obj.data.points_w = resolution
+    transform = np.array([[1.2, 0.1, 0.0], [0.0, 0.9, 0.2], [0.1, 0.0, 1.1]])
+    deform = ffd.rest_coords(*resolution) @ transform.T + (0.05, -0.1, 0.0)
+    lat_obj.data.points.foreach_set("co_deform", deform.astype(np.float32).ravel())
+    return lat_obj, transform
+
+
+def test_resample_keeps_the_cage_shape(addon):
+    lat_obj, transform = _affine_lattice((4, 3, 3))
+    assert lattice_ops.resample_lattice_resolution(lat_obj, (7, 5, 2))
+    assert _resolution(lat_obj) == (7, 5, 2)
+
+    deform, resolution, _interpolation = ffd.read_lattice(lat_obj)
+    expected = ffd.rest_coords(*resolution) @ transform.T + (0.05, -0.1, 0.0)
+    np.testing.assert_allclose(deform, expected, atol=1e-6)
+
+
+def test_resample_to_same_resolution_does_nothing(addon):
+    lat_obj, _transform = _affine_lattice((4, 3, 3))
+    assert not lattice_ops.resample_lattice_resolution(lat_obj, (4, 3, 3))
+
+
+def test_change_resolution_keeps_deformed_mesh(addon):
+    mesh = add_mesh("Rock")
+    settings = bpy.context.scene.bd_lattice_settings
+    settings.base_resolution = 6
+    bpy.ops.bd.create_lattice_multi()
+    lat_obj = mesh.modifiers[0].object
+    lat_obj.data.interpolation_type_u = lat_obj.data.interpolation_type_v = "KEY_LINEAR"
+    lat_obj.data.interpolation_type_w = "KEY_LINEAR"
+    deform = ffd.rest_coords(*_resolution(lat_obj)) * (1.3, 0.8, 1.0)
+    lat_obj.data.points.foreach_set("co_deform", deform.astype(np.float32).ravel())
+    before = ffd.deform_mesh_coords(mesh, lat_obj)
+    fitted = _resolution(lat_obj)
+
+    select_only([mesh])
+    settings.base_resolution = 10
+    bpy.ops.bd.change_lattice_resolution()
+    assert _resolution(lat_obj) != fitted
+    np.testing.assert_allclose(ffd.deform_mesh_coords(mesh, lat_obj), before, atol=1e-5)
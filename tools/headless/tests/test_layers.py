@@ -0,0 +1,107 @@
+import bpy
+import numpy as np
+
+from bevel_deformer import layers
+from conftest import add_mesh, select_only
+
+
+def _points(lat_obj) -> np.ndarray:
+    co = np.empty(len(lat_obj.data.points) * 3, dtype=np.float32)
+    lat_obj.data.points.foreach_get("co_deform", co)
+    return co
+
+
+def _layered_lattice():
+    mesh = add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    lat_obj = mesh.modifiers[0].object
+    co = _points(lat_obj)
+    co[:3] += 0.25
+    lat_obj.data.points.foreach_set("co_deform", co)
+    assert layers.capture_edits(lat_obj, "Edits")
+    select_only([lat_obj])
+    return lat_obj
+
+
+def test_deform_of_layered_lattice_survives_rebuild(addon):
+    lat_obj = _layered_lattice()
+    settings = bpy.context.scene.bd_deform_settings
+    settings.live_preview = False
+    settings.shift_factor = 0.4
+
+    assert bpy.ops.bd.deform_selected_lattices() == {'FINISHED'}
+    deformed = _points(lat_obj)
+    assert [layer["name"] for layer in layers.read_layers(lat_obj)] == ["Edits", layers.DEFAULT_LAYER]
+
+    layers.clear_cache()
+    layers.rebuild(lat_obj)
+    np.testing.assert_allclose(_points(lat_obj), deformed, atol=1e-6)
+
+
+def test_deform_refuses_to_overwrite_captured_edits(addon):
+    lat_obj = _layered_lattice()
+    bpy.context.scene.bd_layer_settings.name = "Edits"
+    before = lat_obj[layers.LAYERS_KEY]
+
+    assert bpy.ops.bd.deform_selected_lattices() == {'CANCELLED'}
+    assert lat_obj[layers.LAYERS_KEY] == before
+
+
+def test_randomize_writes_per_lattice_stage_layers(addon):
+    lat_obj = _layered_lattice()
+    assert bpy.ops.bd.randomize_deform(seed=3, offset_spread=0.2) == {'FINISHED'}
+    randomized = _points(lat_obj)
+    assert [layer["name"] for layer in layers.read_layers(lat_obj)] == ["Edits", layers.DEFAULT_LAYER]
+
+    layers.clear_cache()
+    layers.rebuild(lat_obj)
+    np.testing.assert_allclose(_points(lat_obj), randomized, atol=1e-6)
+
+
+def test_reset_drops_the_stack(addon):
+    lat_obj = _layered_lattice()
+    assert bpy.ops.bd.reset_selected_lattices() == {'FINISHED'}
+    assert not layers.has_layers(lat_obj)
+
+
+def test_restored_snapshot_survives_rebuild(addon):
+    from bevel_deformer import snapshots
+
+    lat_obj = _layered_lattice()
+    co = _points(lat_obj)
+    co[-3:] -= 0.5
+    snapshot = snapshots.capture([lat_obj])
+    snapshot[0][:] = co
+
+    assert snapshots.restore(snapshot, [lat_obj]) == (1, 0)
+    layers.clear_cache()
+    layers.rebuild(lat_obj)
+    np.testing.assert_allclose(_points(lat_obj), co, atol=1e-6)
+
+
+def test_cage_import_keeps_stack_at_new_resolution(addon, tmp_path):
+    from bevel_deformer import cage_io, lattice_ops
+
+    lat_obj = _layered_lattice()
+    path = str(tmp_path / "cages.bdcage")
+    cage_io.export_lattices(path, [lat_obj])
+    exported = _points(lat_obj)
+    lattice_ops.resample_lattice_resolution(lat_obj, (3, 3, 3))
+
+    assert cage_io.import_cages(path) == (1, 0, 0)
+    layers.clear_cache()
+    layers.rebuild(lat_obj)
+    np.testing.assert_allclose(_points(lat_obj), exported, atol=1e-6)
+
+
+def test_api_deform_writes_into_layer(addon):
+    from bevel_deformer import api
+
+    lat_obj = _layered_lattice()
+    api.deform([lat_obj], shift_factor=0.3, offset_x=[0.1])
+    deformed = _points(lat_obj)
+    assert [layer["name"] for layer in layers.read_layers(lat_obj)] == ["Edits", layers.DEFAULT_LAYER]
+
+    layers.clear_cache()
+    layers.rebuild(lat_obj)
+    np.testing.assert_allclose(_points(lat_obj), deformed, atol=1e-6)
@@ -0,0 +1,69 @@
+import bpy
+import pytest
+
+from bevel_deformer import memstats
+from conftest import add_mesh, select_only
+
+
+@pytest.fixture
+def lattices(addon):
+    meshes = [add_mesh(f"Rock_{i:03d}", vertices=64, seed=i) for i in range(200)]
+    bpy.ops.bd.create_lattice_multi()
+    lattices = [mesh.modifiers[0].object for mesh in meshes]
+    select_only(lattices)
+    settings = bpy.context.scene.bd_deform_settings
+    settings.live_preview = False
+    settings.offset_x = 0.2
+    memstats.set_enabled(True)
+    yield settings
+    memstats.set_enabled(False)
+    memstats.clear()
+
+
+def _record(label: str) -> memstats.Record:
+    records = [r for r in memstats.records() if r.label == label]
+    assert records, f"nothing recorded for {label}"
+    assert records[-1].points > 0
+    return records[-1]
+
+
+def _live_tick(settings, shift: float) -> None:
+    settings.live_preview = True
+    settings.shift_factor = shift
+    bpy.app.timers.advance(1.0)
+    settings.live_preview = False
+
+
+@pytest.mark.parametrize("reset_to_uniform, budget", [(True, "deform_reset"), (False, "deform")])
+def test_deform_operator_within_budget(lattices, reset_to_uniform, budget):
+    settings = lattices
+    settings.reset_to_uniform = reset_to_uniform
+    # The first call fills the lookup-table caches; the second is measured.
+    for shift in (0.3, 0.35):
+        memstats.clear()
+        settings.shift_factor = shift
+        bpy.ops.bd.deform_selected_lattices()
+
+    record = _record("bd.deform_selected_lattices")
+    assert record.peak_per_point <= memstats.BUDGETS[budget]
+
+
+@pytest.mark.parametrize("reset_to_uniform, budget", [(True, "deform_reset"), (False, "deform")])
+def test_live_tick_within_budget(lattices, reset_to_uniform, budget):
+    settings = lattices
+    settings.reset_to_uniform = reset_to_uniform
+    for shift in (0.3, 0.35):
+        memstats.clear()
+        _live_tick(settings, shift)
+
+    record = _record("live_tick")
+    assert record.peak_per_point <= memstats.BUDGETS[budget]
+
+
+def test_budget_check_cleans_up(addon):
+    objects = len(bpy.data.objects)
+    results = memstats.budget_check()
+    assert [record.label for record, _budget in results] == ["deform", "deform_reset"]
+    assert all(record.points == 64 * 8 * 8 * 2 for record, _budget in results)
+    assert all(record.peak_per_point <= budget for record, budget in results)
+    assert len(bpy.data.objects) == objects
@@ -0,0 +1,87 @@
+import bpy
+import numpy as np
+
+from bevel_deformer import kernels
+from conftest import add_mesh, select_only
+
+
+def _points(lat_obj) -> np.ndarray:
+    co = np.empty(len(lat_obj.data.points) * 3, dtype=np.float32)
+    lat_obj.data.points.foreach_get("co_deform", co)
+    return co
+
+
+def _uniform(lat_obj) -> np.ndarray:
+    lat = lat_obj.data
+    return kernels.uniform_coords((lat.points_u, lat.points_v, lat.points_w)).ravel()
+
+
+def _lattices(meshes) -> list:
+    return [mod.object for mesh in meshes for mod in mesh.modifiers if mod.type == 'LATTICE']
+
+
+def _vertices(mesh) -> np.ndarray:
+    co = np.empty(len(mesh.data.vertices) * 3, dtype=np.float32)
+    mesh.data.vertices.foreach_get("co", co)
+    return co
+
+
+def _scene(count: int = 3) -> list:
+    meshes = [add_mesh(f"Rock_{i}", seed=i) for i in range(count)]
+    assert bpy.ops.bd.create_lattice_multi() == {'FINISHED'}
+    return meshes
+
+
+def test_create(addon):
+    meshes = _scene()
+    lattices = _lattices(meshes)
+    assert len(lattices) == len(meshes)
+    for lat_obj in lattices:
+        assert lat_obj.type == 'LATTICE'
+        np.testing.assert_allclose(_points(lat_obj), _uniform(lat_obj), atol=1e-6)
+
+
+def test_deform_and_reset(addon):
+    lattices = _lattices(_scene())
+    select_only(lattices)
+    settings = bpy.context.scene.bd_deform_settings
+    settings.live_preview = False
+    settings.shift_factor = 0.4
+
+    assert bpy.ops.bd.deform_selected_lattices() == {'FINISHED'}
+    assert all(not np.allclose(_points(lat), _uniform(lat), atol=1e-4) for lat in lattices)
+
+    assert bpy.ops.bd.reset_selected_lattices() == {'FINISHED'}
+    for lat_obj in lattices:
+        np.testing.assert_allclose(_points(lat_obj), _uniform(lat_obj), atol=1e-6)
+
+
+def test_apply(addon):
+    meshes = _scene()
+    lattices = _lattices(meshes)
+    before = [_vertices(mesh) for mesh in meshes]
+    select_only(lattices)
+    bpy.context.scene.bd_deform_settings.shift_factor = 0.4
+    bpy.ops.bd.deform_selected_lattices()
+
+    # The stand-in's modifier_apply only removes the modifier; Fast Apply bakes the points.
+    bpy.context.scene.bd_lattice_settings.fast_apply = True
+    select_only(meshes)
+    bpy.ops.bd.apply_lattice()
+    for mesh, co in zip(meshes, before):
+        assert not _lattices([mesh])
+        assert not np.allclose(_vertices(mesh), co, atol=1e-4)
+    assert not any(lat.name in bpy.data.objects for lat in lattices)
+
+
+def test_delete(addon):
+    meshes = _scene()
+    lattices = _lattices(meshes)
+    before = [_vertices(mesh) for mesh in meshes]
+
+    select_only(meshes)
+    bpy.ops.bd.delete_lattice()
+    for mesh, co in zip(meshes, before):
+        assert not _lattices([mesh])
+        np.testing.assert_array_equal(_vertices(mesh), co)
+    assert not any(lat.name in bpy.data.objects for lat in lattices)
@@ -0,0 +1,43 @@
+import os
+
+import bpy
+import pytest
+
+from bevel_deformer import snapshots
+from conftest import add_mesh
+
+
+@pytest.fixture
+def settings(addon, tmp_path):
+    add_mesh("Rock")
+    bpy.ops.bd.create_lattice_multi()
+    settings = bpy.context.scene.bd_snapshot_settings
+    settings.storage = 'FILE'
+    settings.directory = str(tmp_path)
+    yield settings
+    snapshots.clear_memory()
+
+
+def test_names_list_folder_only_when_it_changes(settings, monkeypatch):
+    settings.name = "A"
+    bpy.ops.bd.capture_snapshot()
+    assert snapshots.snapshot_names(settings) == ["A"]
+
+    listed = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path: listed.append(path) or listdir(path))
+    assert snapshots.snapshot_names(settings) == ["A"]
+    assert not listed
+
+    settings.name = "B"
+    bpy.ops.bd.capture_snapshot()
+    assert snapshots.snapshot_names(settings) == ["A", "B"]
+    assert len(listed) == 1
+
+
+def test_memory_storage_does_not_list_folder(settings, monkeypatch):
+    settings.storage = 'MEMORY'
+    settings.name = "A"
+    bpy.ops.bd.capture_snapshot()
+    monkeypatch.setattr(os, "listdir", lambda path: pytest.fail("folder listed"))
+    assert snapshots.snapshot_names(settings) == ["A"]